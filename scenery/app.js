@@ -31,11 +31,27 @@ async function main() {
             'src/pca_graph_viz/core/__init__.py',
             'src/pca_graph_viz/core/svg_utils.py',
             'src/pca_graph_viz/core/color_utils.py',
+            'src/pca_graph_viz/core/svg_writer.py',
+            'src/pca_graph_viz/core/number_format.py',
+            'src/pca_graph_viz/core/path_encoder.py',
+            'src/pca_graph_viz/core/simplify.py',
+            'src/pca_graph_viz/core/ticks.py',
+            'src/pca_graph_viz/core/clipping.py',
+            'src/pca_graph_viz/core/sampling.py',
+            'src/pca_graph_viz/core/render_cache.py',
+            'src/pca_graph_viz/core/batching.py',
+            'src/pca_graph_viz/core/elements.py',
+            'src/pca_graph_viz/core/polynomial.py',
+            'src/pca_graph_viz/core/batch_render.py',
+            'src/pca_graph_viz/core/shared_arrays.py',
+            'src/pca_graph_viz/core/families.py',
             'src/pca_graph_viz/models/__init__.py',
             'src/pca_graph_viz/models/line_model.py',
             'src/pca_graph_viz/models/curve_model.py',
             'src/pca_graph_viz/models/line_object.py',
             'src/pca_graph_viz/models/foreign_object.py',
+            'src/pca_graph_viz/models/records.py',
+            'src/pca_graph_viz/models/pydantic_models.py',
             'src/pca_graph_viz/tests/graphs/__init__.py',
             'src/pca_graph_viz/tests/graphs/spe_sujet1_auto_07_question_canonical.py',
             'src/pca_graph_viz/tests/graphs/spe_sujet1_auto_07_question_small.py',
@@ -110,7 +126,7 @@ async function main() {
         console.log('🚀 Initializing Nagini with Pyodide backend...');
         manager = await Nagini.createManager(
             'pyodide',
-            ["numpy", "svgwrite", "pydantic"],
+            ["numpy", "svgwrite"],
             [],
             filesToLoad,
             WORKER_PATH
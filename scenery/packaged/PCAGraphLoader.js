@@ -39,6 +39,7 @@ export class PCAGraphLoader {
       baseUrl: options.baseUrl || 'auto',
       graphConfig: options.graphConfig || {},
       debug: options.debug !== undefined ? options.debug : true,
+      validateModels: options.validateModels || false, // Load pydantic for set_debug_validation(True)
       ...options
     };
 
@@ -88,12 +89,28 @@ export class PCAGraphLoader {
       "src/pca_graph_viz/core/__init__.py",
       "src/pca_graph_viz/core/svg_utils.py",
       "src/pca_graph_viz/core/color_utils.py",
+      "src/pca_graph_viz/core/svg_writer.py",
+      "src/pca_graph_viz/core/number_format.py",
+      "src/pca_graph_viz/core/path_encoder.py",
+      "src/pca_graph_viz/core/simplify.py",
+      "src/pca_graph_viz/core/ticks.py",
+      "src/pca_graph_viz/core/clipping.py",
+      "src/pca_graph_viz/core/sampling.py",
+      "src/pca_graph_viz/core/render_cache.py",
+      "src/pca_graph_viz/core/batching.py",
+      "src/pca_graph_viz/core/elements.py",
+      "src/pca_graph_viz/core/polynomial.py",
+      "src/pca_graph_viz/core/batch_render.py",
+      "src/pca_graph_viz/core/shared_arrays.py",
+      "src/pca_graph_viz/core/families.py",
       "src/pca_graph_viz/core/nagini_adapter.py",
       "src/pca_graph_viz/models/__init__.py",
       "src/pca_graph_viz/models/line_model.py",
       "src/pca_graph_viz/models/curve_model.py",
       "src/pca_graph_viz/models/line_object.py",
       "src/pca_graph_viz/models/foreign_object.py",
+      "src/pca_graph_viz/models/records.py",
+      "src/pca_graph_viz/models/pydantic_models.py",
     ];
   }
 
@@ -172,7 +189,8 @@ export class PCAGraphLoader {
       // Create manager with essential files only
       this.manager = await Nagini.createManager(
         "pyodide",
-        ["numpy", "svgwrite", "pydantic"],
+        // pydantic is only needed for debug validation of the element models
+        ["numpy", "svgwrite", ...(this.options.validateModels ? ["pydantic"] : [])],
         [],
         essentialFilesToLoad,
         this.workerCdnPath
@@ -299,7 +317,7 @@ print(f"✅ File ready for import: {full_module_name}")
   }
 
   /**
-   * Get graph dictionary from a loaded module with configuration passed via namespace
+   * Get graph dictionary from a loaded module with configuration passed as parameters
    */
   async _getGraphDict(moduleName, config = {}) {
     try {
@@ -323,73 +341,15 @@ print(f"✅ File ready for import: {full_module_name}")
         console.log('   Namespace to inject:', namespace);
       }
       
+      // The adapter keeps imported modules and memoizes get_graph_dict() per
+      // parameter set; values are passed as arguments instead of re-importing
+      // the module and injecting globals on every call
       const result = await this.manager.executeAsync(`get_${moduleName}.py`, `
 import json
-import traceback
-import sys
-import importlib
-import inspect
+from pca_graph_viz.core.nagini_adapter import load_and_send_graph
 
-try:
-    # Import the module cleanly
-    module_name = '${moduleName}'
-    full_module_name = f'pca_graph_viz.tests.graphs.{module_name}'
-    
-    # Force reload to ensure clean state
-    if full_module_name in sys.modules:
-        del sys.modules[full_module_name]
-    
-    # Import the module
-    module = importlib.import_module(full_module_name)
-    
-    # CRITICAL: Inject configuration variables into module's global namespace
-    # This is what the Python files expect when checking globals()
-    if 'Y_LABEL_FOR_HORIZONTAL_LINE' in globals():
-        setattr(module, 'Y_LABEL_FOR_HORIZONTAL_LINE', globals()['Y_LABEL_FOR_HORIZONTAL_LINE'])
-    if 'A_FLOAT_FOR_AFFINE_LINE' in globals():
-        setattr(module, 'A_FLOAT_FOR_AFFINE_LINE', globals()['A_FLOAT_FOR_AFFINE_LINE'])
-    if 'B_FLOAT_FOR_AFFINE_LINE' in globals():
-        setattr(module, 'B_FLOAT_FOR_AFFINE_LINE', globals()['B_FLOAT_FOR_AFFINE_LINE'])
-    if 'A_SHIFT_MAGNITUDE' in globals():
-        setattr(module, 'A_SHIFT_MAGNITUDE', globals()['A_SHIFT_MAGNITUDE'])
-    
-    # Check if get_graph_dict accepts parameters
-    if hasattr(module, 'get_graph_dict'):
-        sig = inspect.signature(module.get_graph_dict)
-        params = list(sig.parameters.keys())
-        
-        # Build kwargs based on what the function accepts
-        kwargs = {}
-        param_mapping = {
-            'y_horizontal': 'Y_LABEL_FOR_HORIZONTAL_LINE',
-            'a_affine': 'A_FLOAT_FOR_AFFINE_LINE', 
-            'b_affine': 'B_FLOAT_FOR_AFFINE_LINE',
-            'a_shift': 'A_SHIFT_MAGNITUDE'
-        }
-        
-        for param, global_name in param_mapping.items():
-            if param in params and global_name in globals():
-                kwargs[param] = globals()[global_name]
-        
-        # Debug logging
-        if kwargs:
-            print(f"Calling get_graph_dict with parameters: {kwargs}")
-        else:
-            print(f"Calling get_graph_dict without parameters")
-        
-        # Call with kwargs if any were matched, otherwise call without
-        if kwargs:
-            graph_dict = module.get_graph_dict(**kwargs)
-        else:
-            graph_dict = module.get_graph_dict()
-            
-        missive({"graph": graph_dict, "title": graph_dict.get('title', '${moduleName}')})
-    else:
-        raise RuntimeError(f'get_graph_dict not found in {full_module_name}')
-        
-except Exception as e:
-    missive({"error": str(e), "traceback": traceback.format_exc()})
-      `, namespace);
+load_and_send_graph('${moduleName}', json.loads(${JSON.stringify(JSON.stringify(namespace))}))
+      `);
       
       if (result.missive) {
         const data = typeof result.missive === "string" 
@@ -411,9 +371,10 @@ except Exception as e:
   }
 
   /**
-   * Load a specific graph by key
+   * Write the Python file(s) a graph key needs into the Pyodide file system
+   * @returns {Promise<string>} The graph module name
    */
-  async loadGraph(graphKey, config = null) {
+  async _loadGraphFiles(graphKey) {
     if (!this.initialized) {
       throw new Error("PCAGraphLoader not initialized. Call initialize() first.");
     }
@@ -422,20 +383,28 @@ except Exception as e:
       throw new Error(`Unknown graph key: ${graphKey}. Available: ${Object.keys(this.availableGraphs).join(', ')}`);
     }
 
-    try {
-      // Determine if we need dispatch module (for parabola graphs)
-      const needsDispatch = graphKey.startsWith("parabola");
-      
-      if (needsDispatch) {
-        // Load dispatch module first if not already loaded
-        await this._loadGraphFile("dispatch", 
-          "src/pca_graph_viz/tests/graphs/spe_sujet1_auto_10_question_small_dispatch.py");
-      }
+    // Determine if we need dispatch module (for parabola graphs)
+    const needsDispatch = graphKey.startsWith("parabola");
+    
+    if (needsDispatch) {
+      // Load dispatch module first if not already loaded
+      await this._loadGraphFile("dispatch", 
+        "src/pca_graph_viz/tests/graphs/spe_sujet1_auto_10_question_small_dispatch.py");
+    }
 
-      // Load the graph file
-      const moduleName = this.availableGraphs[graphKey];
-      const filepath = `src/pca_graph_viz/tests/graphs/${moduleName}.py`;
-      await this._loadGraphFile(graphKey, filepath);
+    // Load the graph file
+    const moduleName = this.availableGraphs[graphKey];
+    const filepath = `src/pca_graph_viz/tests/graphs/${moduleName}.py`;
+    await this._loadGraphFile(graphKey, filepath);
+    return moduleName;
+  }
+
+  /**
+   * Load a specific graph by key
+   */
+  async loadGraph(graphKey, config = null) {
+    try {
+      const moduleName = await this._loadGraphFiles(graphKey);
       
       // Get the graph dictionary with configuration
       const graphDict = await this._getGraphDict(moduleName, config);
@@ -451,35 +420,31 @@ except Exception as e:
   /**
    * Render a graph to SVG and return both SVG and graph dictionary
    * @param {string} graphKey - The graph key to render
-   * @param {Object} config - Configuration parameters to inject into Python namespace
+   * @param {Object} config - Configuration parameters passed to the graph module
    *                         (e.g., Y_LABEL_FOR_HORIZONTAL_LINE, A_FLOAT_FOR_AFFINE_LINE, etc.)
    *                         These override the default graphConfig for this render only
-   * @returns {Promise<{svg: string, graphDict: Object}>} Object containing SVG string and graph dictionary
+   * @param {Object} options - Render options
+   * @param {boolean} options.includeDict - Ship the graph dictionary back from Python
+   *                         (default true); without it graphDict is null
+   * @returns {Promise<{svg: string, graphDict: Object, title: string, counts: Object}>}
+   *          SVG string, graph dictionary, title and element counts
    */
-  async renderGraph(graphKey, config = null) {
+  async renderGraph(graphKey, config = null, { includeDict = true } = {}) {
     try {
-      // Load graph with config (parameters will be injected into Python namespace)
-      const graphDict = await this.loadGraph(graphKey, config);
+      const moduleName = await this._loadGraphFiles(graphKey);
+      const params = this._generateNamespace({ ...this.graphConfig, ...config });
       
-      // Render the graph dictionary to SVG
+      // Load and render in a single Python call: the graph dictionary does
+      // not travel to JS and back before rendering
       const result = await this.manager.executeAsync(`render_${graphKey}.py`, `
 import json
-from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core.nagini_adapter import load_render_and_send
 
-try:
-    graph_dict = json.loads('''${JSON.stringify(graphDict)}''')
-    
-    # Ensure defaults
-    if 'settings' not in graph_dict:
-        graph_dict['settings'] = {}
-    if 'margin' not in graph_dict['settings']:
-        graph_dict['settings']['margin'] = 16
-    
-    svg_output = graph_from_dict(graph_dict)
-    missive({"svg": svg_output})
-except Exception as e:
-    import traceback
-    missive({"error": str(e), "traceback": traceback.format_exc()})
+load_render_and_send(
+    '${moduleName}',
+    json.loads(${JSON.stringify(JSON.stringify(params))}),
+    include_dict=${includeDict ? "True" : "False"},
+)
       `);
       
       if (result.missive) {
@@ -491,10 +456,12 @@ except Exception as e:
           throw new Error(data.error);
         }
         
-        // Return both SVG and graph dictionary
+        if (this.options.debug) console.log(`✅ Rendered graph: ${data.title}`, data.counts);
         return {
           svg: data.svg,
-          graphDict: graphDict
+          graphDict: data.graph || null,
+          title: data.title,
+          counts: data.counts
         };
       }
       
@@ -512,10 +479,34 @@ except Exception as e:
    * @returns {Promise<string>} SVG string only
    */
   async renderGraphSvg(graphKey, config = null) {
-    const result = await this.renderGraph(graphKey, config);
+    const result = await this.renderGraph(graphKey, config, { includeDict: false });
     return result.svg;
   }
 
+  /**
+   * Look up a pre-rendered SVG in a parameter-sweep archive, without running Python
+   * (archives are written by `python -m pca_graph_viz.sweep`)
+   * @param {Object} archive - Parsed `<module>.sweep.json`
+   * @param {Object} config - Optional configuration overrides, as for renderGraph
+   * @returns {string|null} The SVG, or null when the values are not on the grid
+   *          (render them with renderGraph instead)
+   */
+  lookupSweep(archive, config = null) {
+    const fullConfig = { ...this.graphConfig, ...config };
+    let position = 0;
+    for (const param of archive.params) {
+      const value = Number(fullConfig[param.global || param.name]);
+      const raw = (value - param.start) / param.step;
+      const i = Math.round(raw);
+      if (!(Math.abs(raw - i) <= 1e-6) || i < 0 || i >= param.count) {
+        return null;
+      }
+      position = position * param.count + i;
+    }
+    const svgId = archive.index[position];
+    return svgId >= 0 ? archive.head + archive.svgs[svgId] + archive.tail : null;
+  }
+
   /**
    * Get list of available graphs
    */
@@ -35,12 +35,28 @@ const ESSENTIAL_FILES = [
   "src/pca_graph_viz/core/__init__.py",
   "src/pca_graph_viz/core/svg_utils.py",
   "src/pca_graph_viz/core/color_utils.py",
+  "src/pca_graph_viz/core/svg_writer.py",
+  "src/pca_graph_viz/core/number_format.py",
+  "src/pca_graph_viz/core/path_encoder.py",
+  "src/pca_graph_viz/core/simplify.py",
+  "src/pca_graph_viz/core/ticks.py",
+  "src/pca_graph_viz/core/clipping.py",
+  "src/pca_graph_viz/core/sampling.py",
+  "src/pca_graph_viz/core/render_cache.py",
+  "src/pca_graph_viz/core/batching.py",
+  "src/pca_graph_viz/core/elements.py",
+  "src/pca_graph_viz/core/polynomial.py",
+  "src/pca_graph_viz/core/batch_render.py",
+  "src/pca_graph_viz/core/shared_arrays.py",
+  "src/pca_graph_viz/core/families.py",
   "src/pca_graph_viz/core/nagini_adapter.py",
   "src/pca_graph_viz/models/__init__.py",
   "src/pca_graph_viz/models/line_model.py",
   "src/pca_graph_viz/models/curve_model.py",
   "src/pca_graph_viz/models/line_object.py",
   "src/pca_graph_viz/models/foreign_object.py",
+  "src/pca_graph_viz/models/records.py",
+  "src/pca_graph_viz/models/pydantic_models.py",
 ];
 
 // Hardcoded graph files - load these separately
@@ -100,7 +116,7 @@ async function initializeNagini() {
     // Create manager with essential files only
     manager = await Nagini.createManager(
       "pyodide",
-      ["numpy", "svgwrite", "pydantic"],
+      ["numpy", "svgwrite"],
       [],
       essentialFilesToLoad,
       WORKER_CDN_PATH
@@ -3,18 +3,38 @@ PCA Graph Visualization Package
 
 A modular system for creating mathematical visualizations with embedded LaTeX annotations
 using Pyodide, SVG, and KaTeX.
+
+The public API is loaded lazily (PEP 562): importing the package is free of
+side effects and does not pull in NumPy or svgwrite until a function is used.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-# Make key functions available at package level
-from .core.svg_utils import (
-    graph_from_dict,
-    dict_from_graph_params,
-    create_svg_scene,
-    create_svg,  # Alias for create_svg_scene
-    create_multi_curve_svg,
-)
+# Public name -> module providing it (relative to this package)
+_LAZY_ATTRIBUTES = {
+    "graph_from_dict": ".core.svg_utils",
+    "dict_from_graph_params": ".core.svg_utils",
+    "create_svg_scene": ".core.svg_utils",
+    "create_svg": ".core.svg_utils",  # Alias for create_svg_scene
+    "create_multi_curve_svg": ".core.svg_utils",
+    "sample_function": ".core.sampling",
+    "pixel_size_for": ".core.sampling",
+}
+
+_SUBPACKAGES = ("core", "models", "tests")
+
+if TYPE_CHECKING:
+    from .core.sampling import pixel_size_for, sample_function
+    from .core.svg_utils import (
+        create_multi_curve_svg,
+        create_svg,
+        create_svg_scene,
+        dict_from_graph_params,
+        graph_from_dict,
+    )
 
 __all__ = [
     "graph_from_dict",
@@ -22,4 +42,22 @@ __all__ = [
     "create_svg_scene",
     "create_svg",  # Alias for create_svg_scene
     "create_multi_curve_svg",
+    "sample_function",
+    "pixel_size_for",
 ]
+
+
+def __getattr__(name):
+    """Import public attributes and subpackages on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
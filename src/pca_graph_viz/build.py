@@ -0,0 +1,304 @@
+"""Pre-render the graph catalog to static SVG files.
+
+Every module of ``tests/graphs`` whose ``get_graph_dict()`` takes no
+parameter renders the same SVG for every visitor, so it can be rendered once
+at build time instead of in each browser::
+
+    python -m pca_graph_viz.build --out build/graphs --jobs 8
+
+Graphs are rendered across a process pool. The output directory receives one
+``<module>.svg`` per graph and a ``manifest.json``::
+
+    {"renderer": "<hash of the renderer sources>",
+     "graphs": {"graph1": {"title": ..., "topic": ..., "file": "graph1.svg",
+                           "bytes": 5120, "source_hash": "..."}, ...}}
+
+A graph is skipped when its source hash and the renderer hash are those of
+the previous manifest and its SVG is still there. The source hash covers the
+graph module and the graph modules it imports (the parabolas are drawn by
+``spe_sujet1_auto_10_question_small_dispatch``). Parameterized modules are
+recorded with ``"parametric": true`` and left to the browser.
+"""
+
+import argparse
+import ast
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import pkgutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+GRAPHS_PACKAGE = "pca_graph_viz.tests.graphs"
+
+MANIFEST_NAME = "manifest.json"
+
+DEFAULT_OUT_DIR = os.path.join("build", "graphs")
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Packages whose sources determine the rendered output of every graph
+_RENDERER_DIRS = ("core", "models")
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def source_hash(path):
+    """Digest of a graph module's source file."""
+    with open(path, "rb") as f:
+        return _digest(f.read())
+
+
+def _graph_imports(path):
+    """Names of the modules of the graphs package imported by the module at `path`."""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, ValueError):
+        # The render reports the error
+        return set()
+    prefix = GRAPHS_PACKAGE + "."
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            if node.level == 1 and module:
+                names.add(module.split(".")[0])
+            elif (node.level == 1 and not module) or (node.level == 0 and module == GRAPHS_PACKAGE):
+                names.update(alias.name for alias in node.names)
+            elif node.level == 0 and module.startswith(prefix):
+                names.add(module[len(prefix) :].split(".")[0])
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.startswith(prefix):
+                    names.add(alias.name[len(prefix) :].split(".")[0])
+    return names
+
+
+def graph_hash(module_name, sources=None):
+    """Digest of a graph module's source and of the graph modules it imports, transitively.
+
+    Args:
+        module_name: Module of the graphs package
+        sources: {module name: source path} (see `discover_graph_modules`)
+    """
+    if sources is None:
+        sources = discover_graph_modules()
+    modules = set()
+    pending = [module_name]
+    while pending:
+        name = pending.pop()
+        if name in modules or name not in sources:
+            continue
+        modules.add(name)
+        pending.extend(_graph_imports(sources[name]))
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(modules):
+        digest.update(name.encode())
+        with open(sources[name], "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def renderer_hash():
+    """Digest of the renderer sources; a change invalidates every pre-rendered graph."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in _RENDERER_DIRS:
+        directory = os.path.join(_PACKAGE_DIR, name)
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(".py"):
+                digest.update(filename.encode())
+                with open(os.path.join(directory, filename), "rb") as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def discover_graph_modules():
+    """Return {module name: source path} for every module of the graphs package.
+
+    Modules are found on disk without being imported.
+    """
+    package = importlib.import_module(GRAPHS_PACKAGE)
+    modules = {}
+    for info in pkgutil.iter_modules(package.__path__):
+        if info.ispkg:
+            continue
+        modules[info.name] = os.path.join(info.module_finder.path, f"{info.name}.py")
+    return dict(sorted(modules.items()))
+
+
+def graph_topic(path):
+    """Topic of a graph module, from its ``# Section:`` header comment, or None."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("# Section:"):
+                return line[len("# Section:") :].strip()
+    return None
+
+
+def render_module(module_name, path, out_dir, digest=None):
+    """Render one graph module to ``<out_dir>/<module_name>.svg`` (runs in a worker).
+
+    Args:
+        module_name: Module of the graphs package
+        path: Its source file
+        out_dir: Output directory
+        digest: Its `graph_hash`, computed here when not given
+
+    Returns:
+        dict: The manifest entry of the graph; parameterized modules are
+        marked ``parametric`` and failures carry an ``error`` message.
+    """
+    import inspect
+
+    from .core.svg_utils import graph_from_dict
+
+    if digest is None:
+        digest = graph_hash(module_name)
+    entry = {"source_hash": digest, "topic": graph_topic(path)}
+    try:
+        # Graph modules print progress messages; keep the build output readable
+        with contextlib.redirect_stdout(io.StringIO()):
+            module = importlib.import_module(f"{GRAPHS_PACKAGE}.{module_name}")
+            get_graph_dict = getattr(module, "get_graph_dict", None)
+            if get_graph_dict is None:
+                return {**entry, "error": "no get_graph_dict function"}
+            if inspect.signature(get_graph_dict).parameters:
+                return {**entry, "parametric": True}
+            graph_dict = get_graph_dict()
+            svg = graph_from_dict(graph_dict, cache=False)
+    except Exception as e:
+        return {**entry, "error": f"{type(e).__name__}: {e}"}
+
+    filename = f"{module_name}.svg"
+    data = svg.encode("utf-8")
+    with open(os.path.join(out_dir, filename), "wb") as f:
+        f.write(data)
+    return {
+        **entry,
+        "title": graph_dict.get("title") or module_name,
+        "file": filename,
+        "bytes": len(data),
+    }
+
+
+def load_manifest(out_dir):
+    """Return the manifest of a previous build, or an empty one."""
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"renderer": None, "graphs": {}}
+
+
+def _is_current(entry, digest, out_dir):
+    """True when a previous manifest entry can be reused for a source with hash `digest`."""
+    if not entry or entry.get("source_hash") != digest or "error" in entry:
+        return False
+    if entry.get("parametric"):
+        return True
+    return os.path.exists(os.path.join(out_dir, entry.get("file", "")))
+
+
+def build(out_dir=DEFAULT_OUT_DIR, jobs=None, force=False, modules=None, log=print):
+    """Pre-render the graph catalog into `out_dir` and update its manifest.
+
+    Args:
+        out_dir: Output directory (created if needed)
+        jobs: Worker processes (None = CPU count, 1 = render in this process)
+        force: Re-render every graph even when its source is unchanged
+        modules: Optional iterable of module names to build instead of the whole catalog
+        log: Callable receiving progress messages (None for silence)
+
+    Returns:
+        dict: The written manifest
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    sources = all_sources = discover_graph_modules()
+    if modules is not None:
+        unknown = sorted(set(modules) - set(sources))
+        if unknown:
+            raise ValueError(f"Unknown graph modules: {unknown}")
+        sources = {name: sources[name] for name in modules}
+
+    previous = load_manifest(out_dir)
+    renderer = renderer_hash()
+    same_renderer = previous.get("renderer") == renderer
+    # Hashed with the graph modules they import, which may be outside `modules`
+    digests = {name: graph_hash(name, all_sources) for name in sources}
+    graphs = {}
+    stale = []
+    for name in sources:
+        entry = previous["graphs"].get(name)
+        if same_renderer and not force and _is_current(entry, digests[name], out_dir):
+            graphs[name] = entry
+        else:
+            stale.append(name)
+
+    if jobs == 1 or len(stale) <= 1:
+        results = [render_module(name, sources[name], out_dir, digests[name]) for name in stale]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            paths = [sources[name] for name in stale]
+            results = list(
+                executor.map(
+                    render_module,
+                    stale,
+                    paths,
+                    [out_dir] * len(stale),
+                    [digests[name] for name in stale],
+                )
+            )
+    graphs.update(zip(stale, results))
+
+    if modules is not None:
+        # A partial build keeps the other graphs while they are still current
+        if same_renderer:
+            graphs = {**previous["graphs"], **graphs}
+    else:
+        # Drop the output of graph modules that no longer render to a file
+        for name, entry in previous["graphs"].items():
+            if entry.get("file") and "file" not in graphs.get(name, {}):
+                with contextlib.suppress(OSError):
+                    os.remove(os.path.join(out_dir, entry["file"]))
+
+    manifest = {"renderer": renderer, "graphs": dict(sorted(graphs.items()))}
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+    if log is not None:
+        failed = [name for name in stale if "error" in graphs[name]]
+        for name in failed:
+            log(f"{name}: {graphs[name]['error']}")
+        rendered = sum(1 for name in stale if "file" in graphs[name])
+        log(
+            f"Rendered {rendered}, unchanged {len(sources) - len(stale)}, "
+            f"parametric {sum(1 for entry in graphs.values() if entry.get('parametric'))}, "
+            f"failed {len(failed)} -> {out_dir}"
+        )
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pca_graph_viz.build", description="Pre-render the graph catalog to SVG."
+    )
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPUs)")
+    parser.add_argument("--force", action="store_true", help="re-render unchanged graphs")
+    parser.add_argument("modules", nargs="*", help="graph modules to build (default: all)")
+    args = parser.parse_args(argv)
+    manifest = build(args.out, args.jobs, args.force, args.modules or None)
+    failed = any("error" in entry for entry in manifest["graphs"].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
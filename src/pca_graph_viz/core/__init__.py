@@ -1,17 +1,62 @@
-"""Core utilities for SVG generation and color processing."""
+"""Core utilities for SVG generation and color processing.
 
-from .svg_utils import (
-    graph_from_dict,
-    dict_from_graph_params,
-    create_svg_scene,
-    create_svg,  # Alias for create_svg_scene
-    create_multi_curve_svg,
-    SVGScene,
-    resolve_color,
-    define_arrow_marker,
-)
+Attributes are loaded lazily (PEP 562), so importing a single submodule such
+as ``core.nagini_adapter`` does not import the renderer.
+"""
 
-from .color_utils import oklch_to_hex
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule providing it
+_LAZY_ATTRIBUTES = {
+    # SVG functions
+    "graph_from_dict": ".svg_utils",
+    "dict_from_graph_params": ".svg_utils",
+    "create_svg_scene": ".svg_utils",
+    "create_svg": ".svg_utils",  # Alias for create_svg_scene
+    "create_multi_curve_svg": ".svg_utils",
+    "SVGScene": ".svg_utils",
+    "resolve_color": ".svg_utils",
+    "define_arrow_marker": ".svg_utils",
+    "set_default_backend": ".svg_utils",
+    "get_default_backend": ".svg_utils",
+    # Sampling
+    "sample_function": ".sampling",
+    "pixel_size_for": ".sampling",
+    # Line batches
+    "line_batch": ".batching",
+    "batch_lines": ".batching",
+    # Element renderers
+    "register_element": ".elements",
+    "RenderContext": ".elements",
+    # Batch rendering
+    "render_many": ".batch_render",
+    # Render cache
+    "RenderCache": ".render_cache",
+    "fingerprint": ".render_cache",
+    # Color functions
+    "oklch_to_hex": ".color_utils",
+}
+
+if TYPE_CHECKING:
+    from .batch_render import render_many
+    from .batching import batch_lines, line_batch
+    from .color_utils import oklch_to_hex
+    from .elements import RenderContext, register_element
+    from .render_cache import RenderCache, fingerprint
+    from .sampling import pixel_size_for, sample_function
+    from .svg_utils import (
+        SVGScene,
+        create_multi_curve_svg,
+        create_svg,
+        create_svg_scene,
+        define_arrow_marker,
+        dict_from_graph_params,
+        get_default_backend,
+        graph_from_dict,
+        resolve_color,
+        set_default_backend,
+    )
 
 __all__ = [
     # SVG functions
@@ -23,6 +68,35 @@ __all__ = [
     "SVGScene",
     "resolve_color",
     "define_arrow_marker",
+    "set_default_backend",
+    "get_default_backend",
+    # Sampling
+    "sample_function",
+    "pixel_size_for",
+    # Line batches
+    "line_batch",
+    "batch_lines",
+    # Element renderers
+    "register_element",
+    "RenderContext",
+    # Batch rendering
+    "render_many",
+    # Render cache
+    "RenderCache",
+    "fingerprint",
     # Color functions
     "oklch_to_hex",
 ]
+
+
+def __getattr__(name):
+    """Import public attributes from their submodule on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,150 @@
+"""Render many graph dicts in one call.
+
+The gallery and sujets0 pages render dozens of graphs at once. Calling
+``graph_from_dict`` in a loop repeats per-call setup for every graph;
+``render_many`` does it once per batch:
+
+- the backend and the coordinate precision are resolved once;
+- every dict is fingerprinted once and looked up in the render cache, and
+  identical dicts are rendered only once (unless the cache is disabled);
+- the arrow markers (``arrow-x``, ``arrow-y``, axis-colored arrows) are built
+  once per color and size and shared by all drawings (see
+  ``svg_utils.shared_markers``);
+- with an executor, the remaining dicts are sent in chunks, so each task pays
+  for one submission and each worker imports the renderer and its element
+  registry once; for process pools the curve samples travel through one
+  memory-mapped scratch file instead of being pickled (see shared_arrays.py).
+
+Results come back in input order, one dict per graph, using the convention
+of ``nagini_adapter.render_graph``: ``{"svg": ...}`` on success and
+``{"error": ..., "traceback": ...}`` for a graph that failed, without
+affecting the others.
+"""
+
+import contextlib
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from .number_format import get_default_precision, set_default_precision
+from .render_cache import fingerprint, render_cache
+from .shared_arrays import pack_graph_dicts, unpack_graph_dicts
+from .svg_utils import get_default_backend, graph_from_dict, shared_markers
+
+# Graphs per executor task: large enough to amortize the submission, small
+# enough to spread a gallery over the workers
+DEFAULT_CHUNK_SIZE = 4
+
+
+def _render_chunk(graph_dicts, backend, precision):
+    """Render a list of graph dicts (runs in the caller, a thread or a worker process).
+
+    Returns:
+        list: One ``{"svg": ...}`` or ``{"error": ..., "traceback": ...}`` dict per graph
+    """
+    if get_default_precision() != precision:
+        # A fresh worker process starts with the package default
+        set_default_precision(precision)
+    results = []
+    with shared_markers():
+        for graph_dict in graph_dicts:
+            try:
+                results.append({"svg": graph_from_dict(graph_dict, backend, cache=False)})
+            except Exception as e:
+                results.append({"error": str(e), "traceback": traceback.format_exc()})
+    return results
+
+
+def _render_shared_chunk(path, packed_dicts, backend, precision):
+    """Render graph dicts whose curve samples live in a scratch file (in a worker)."""
+    return _render_chunk(unpack_graph_dicts(packed_dicts, path), backend, precision)
+
+
+def _failed_chunk(error, size):
+    """Results of a chunk whose task could not run (unpicklable dict, broken pool, ...)."""
+    message = f"{type(error).__name__}: {error}"
+    tb = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+    return [{"error": message, "traceback": tb} for _ in range(size)]
+
+
+def render_many(
+    graph_dicts, executor=None, backend=None, chunk_size=DEFAULT_CHUNK_SIZE, shared_arrays=None
+):
+    """Render a list of graph dicts with shared setup.
+
+    Args:
+        graph_dicts: Iterable of graph dictionaries (see `graph_from_dict`)
+        executor: Optional ``concurrent.futures`` thread or process pool
+            executor; by default the graphs are rendered in this thread
+        backend: Rendering backend ("svgwrite" or "string"); defaults to the
+            package-wide setting
+        chunk_size: Graphs per executor task
+        shared_arrays: Send large curve samples to worker processes through
+            a memory-mapped scratch file (see shared_arrays.py); by default
+            enabled for process pools
+
+    Returns:
+        list: In input order, ``{"svg": <svg_string>}`` for each rendered graph
+        and ``{"error": <error_msg>, "traceback": <traceback>}`` for each
+        graph that failed.
+    """
+    graph_dicts = list(graph_dicts)
+    backend = backend or get_default_backend()
+    precision = get_default_precision()
+    results = [None] * len(graph_dicts)
+
+    # Unique graphs left to render: key -> input indices. Without the cache
+    # (or for dicts that cannot be fingerprinted) every graph gets its own key.
+    pending = {}
+    for index, graph_dict in enumerate(graph_dicts):
+        key = index
+        if render_cache.enabled:
+            try:
+                key = (fingerprint(graph_dict), backend, precision)
+            except TypeError:
+                pass
+            else:
+                svg = render_cache.get(key)
+                if svg is not None:
+                    results[index] = {"svg": svg}
+                    continue
+        pending.setdefault(key, []).append(index)
+
+    keys = list(pending)
+    todo = [graph_dicts[pending[key][0]] for key in keys]
+    if executor is None or not todo:
+        rendered = _render_chunk(todo, backend, precision)
+    else:
+        if shared_arrays is None:
+            shared_arrays = isinstance(executor, ProcessPoolExecutor)
+        path = None
+        if shared_arrays:
+            path, todo = pack_graph_dicts(todo)
+        chunks = [todo[start : start + chunk_size] for start in range(0, len(todo), chunk_size)]
+        try:
+            if path is None:
+                futures = [
+                    executor.submit(_render_chunk, chunk, backend, precision) for chunk in chunks
+                ]
+            else:
+                futures = [
+                    executor.submit(_render_shared_chunk, path, chunk, backend, precision)
+                    for chunk in chunks
+                ]
+            rendered = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    rendered.extend(future.result())
+                except Exception as e:
+                    rendered.extend(_failed_chunk(e, len(chunk)))
+        finally:
+            if path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    for key, result in zip(keys, rendered):
+        if "svg" in result and not isinstance(key, int):
+            render_cache.put(key, result["svg"])
+        for index in pending[key]:
+            results[index] = dict(result)
+    return results
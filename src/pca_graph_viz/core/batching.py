@@ -0,0 +1,126 @@
+"""Columnar line batches: many segments sharing one style, drawn as one path.
+
+Grids, cobweb diagrams, tree diagrams, sign tables and Riemann rectangles are
+hundreds of ``{"type": "line", ...}`` dicts that only differ by their
+endpoints. A ``line_batch`` element stores the endpoints as columns and the
+style once::
+
+    {"type": "line_batch", "x1": [...], "y1": [...], "x2": [...], "y2": [...],
+     "stroke-width": 1, "class": "stroke-base-content"}
+
+The renderer transforms and clips all segments as arrays and writes a single
+``<path d="M x1,y1 L x2,y2 M ...">``. The columns may be lists or NumPy arrays
+(use lists when the graph dict is sent to JavaScript as JSON).
+
+``batch_lines`` merges consecutive plain line dicts with the same style into
+batches, so existing graph modules benefit without changes. Only runs of
+adjacent lines are merged, which keeps the drawing order of every element.
+"""
+
+import numpy as np
+
+from .clipping import clip_segment_arrays
+from .path_encoder import encode_segments
+
+LINE_BATCH_TYPE = "line_batch"
+
+# Endpoint columns of a batch
+COORDINATE_KEYS = ("x1", "y1", "x2", "y2")
+
+# Keys a plain line may carry to be merged into a batch. Lines with an id, a
+# marker or an opacity (overlaps would no longer add up) are drawn on their own.
+BATCHABLE_STYLE_KEYS = frozenset(
+    ["stroke", "stroke-width", "stroke_width", "stroke-dasharray", "class", "style"]
+)
+
+# Shortest run of equal lines worth merging
+MIN_BATCH_SIZE = 2
+
+
+def line_batch(x1, y1, x2, y2, **attributes):
+    """Build a ``line_batch`` element from endpoint columns and shared attributes.
+
+    Attributes use the graph dict spelling, e.g. ``**{"stroke-width": 1, "class": "..."}``.
+    """
+    columns = [np.asarray(values, dtype=float).ravel() for values in (x1, y1, x2, y2)]
+    if len({len(values) for values in columns}) != 1:
+        raise ValueError("line_batch columns x1, y1, x2, y2 must have the same length")
+    return {"type": LINE_BATCH_TYPE, **dict(zip(COORDINATE_KEYS, columns)), **attributes}
+
+
+def batch_style_key(line):
+    """Return a hashable key for the style of a plain line dict, or None if it cannot be batched."""
+    if not isinstance(line, dict) or line.get("type", "line") != "line":
+        return None
+    if not all(key in line for key in COORDINATE_KEYS):
+        return None
+    style = []
+    for key, value in line.items():
+        if key in COORDINATE_KEYS:
+            if value is None or isinstance(value, (list, tuple, np.ndarray)):
+                return None
+        elif key in BATCHABLE_STYLE_KEYS:
+            if not isinstance(value, (str, int, float, type(None))):
+                return None
+            style.append((key, value))
+        elif key != "type":
+            return None
+    return tuple(sorted(style))
+
+
+def batch_lines(lines, min_size=MIN_BATCH_SIZE):
+    """Merge runs of adjacent plain lines with identical style into ``line_batch`` elements.
+
+    Returns a new list; elements that cannot be batched are kept as they are.
+    """
+    result = []
+    run = []
+    run_key = None
+
+    def flush():
+        if len(run) >= min_size:
+            columns = {key: [line[key] for line in run] for key in COORDINATE_KEYS}
+            style = {key: value for key, value in run[0].items() if key in BATCHABLE_STYLE_KEYS}
+            result.append({"type": LINE_BATCH_TYPE, **columns, **style})
+        else:
+            result.extend(run)
+
+    for line in lines:
+        key = batch_style_key(line)
+        if key is not None and key == run_key:
+            run.append(line)
+            continue
+        flush()
+        run = [line] if key is not None else []
+        run_key = key
+        if key is None:
+            result.append(line)
+    flush()
+    return result
+
+
+def batch_path_data(batch, transform_x, transform_y, clip_rect=None, precision=None):
+    """Transform, clip and encode the segments of a ``line_batch`` element.
+
+    Segments with non-finite endpoints or entirely outside `clip_rect` are
+    dropped; dashed batches are only trimmed at segment ends so each dash
+    pattern starts where it used to.
+
+    Returns:
+        str: Path data, or ``""`` when no segment is visible.
+    """
+    columns = [np.asarray(batch.get(key, []), dtype=float).ravel() for key in COORDINATE_KEYS]
+    if len({len(values) for values in columns}) != 1:
+        raise ValueError("line_batch columns x1, y1, x2, y2 must have the same length")
+    x0, y0, x1, y1 = columns
+    x0, x1 = np.asarray(transform_x(x0), dtype=float), np.asarray(transform_x(x1), dtype=float)
+    y0, y1 = np.asarray(transform_y(y0), dtype=float), np.asarray(transform_y(y1), dtype=float)
+
+    keep = np.isfinite(x0) & np.isfinite(y0) & np.isfinite(x1) & np.isfinite(y1)
+    if clip_rect is not None:
+        dashed = bool(batch.get("stroke-dasharray"))
+        x0, y0, x1, y1, visible = clip_segment_arrays(x0, y0, x1, y1, clip_rect, dashed)
+        keep &= visible
+    if not keep.all():
+        x0, y0, x1, y1 = x0[keep], y0[keep], x1[keep], y1[keep]
+    return encode_segments(x0, y0, x1, y1, precision)
@@ -0,0 +1,217 @@
+"""Vectorized viewport clipping of curves and line segments.
+
+Curves are often sampled far outside the displayed ``domain`` (asymptotes,
+exponentials, log scales) and every off-screen sample used to end up in the
+path data. Clipping runs in pixel space against the visible canvas (the plot
+rectangle extended by the SVG margins) plus a small padding, so the visible
+result is unchanged:
+
+- ``clip_segments`` is Liang–Barsky over arrays of segments;
+- ``clip_polyline`` clips every segment of a polyline at once and returns the
+  surviving points with a ``starts`` mask marking where a new subpath (``M``)
+  begins, i.e. where the curve re-enters the viewport;
+- ``clip_segment_arrays`` clips independent segments (line batches);
+- ``clip_line_elements`` clips plain ``line`` dicts of a graph in one pass;
+- ``data_view`` maps the canvas back to data space for geometry that is cut
+  analytically (polynomials, see polynomial.py).
+
+Endpoints that are not clipped are returned bit-for-bit unchanged, so
+geometry fully inside the viewport renders exactly as before.
+"""
+
+import numpy as np
+
+from .number_format import quantize
+
+# Extra pixels kept around the canvas so stroke widths and caps are never cut
+DEFAULT_PADDING = 8
+
+
+def resolve_padding(clip):
+    """Map a `settings["clip"]` value to a padding in pixels or None (disabled)."""
+    if clip is None or clip is False:
+        return None
+    if clip is True:
+        return DEFAULT_PADDING
+    return float(clip)
+
+
+def clip_segments(x0, y0, x1, y1, rect):
+    """Liang–Barsky clipping of many segments against `rect` = (x_min, y_min, x_max, y_max).
+
+    Returns:
+        tuple: (t0, t1, visible) where the visible part of segment i runs from
+        parameter t0[i] to t1[i]. Segments with non-finite endpoints are
+        reported invisible.
+    """
+    x_min, y_min, x_max, y_max = rect
+    dx = x1 - x0
+    dy = y1 - y0
+    p = np.stack([-dx, dx, -dy, dy])
+    q = np.stack([x0 - x_min, x_max - x0, y0 - y_min, y_max - y0])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / p
+        t0 = np.max(np.where(p < 0, r, 0.0), axis=0)
+        t1 = np.min(np.where(p > 0, r, 1.0), axis=0)
+        outside_parallel = np.any((p == 0) & (q < 0), axis=0)
+        visible = (t0 <= t1) & ~outside_parallel
+    return t0, t1, visible
+
+
+def clip_polyline(px, py, rect, starts=None):
+    """Clip a pixel-space polyline to `rect`.
+
+    An optional `starts` mask marks existing breaks; segments across a break
+    are not drawn.
+
+    Returns:
+        tuple: (px, py, starts) with the clipped points and a boolean mask that
+        is True where a new subpath starts.
+    """
+    n = min(len(px), len(py))
+    px = np.asarray(px, dtype=float)[:n]
+    py = np.asarray(py, dtype=float)[:n]
+    if n < 2:
+        return px[:0], py[:0], np.zeros(0, dtype=bool)
+
+    t0, t1, visible = clip_segments(px[:-1], py[:-1], px[1:], py[1:], rect)
+    if starts is not None:
+        visible &= ~np.asarray(starts[1:n], dtype=bool)
+    seg = np.flatnonzero(visible)
+    if len(seg) == 0:
+        return px[:0], py[:0], np.zeros(0, dtype=bool)
+
+    t0, t1 = t0[seg], t1[seg]
+    ax, ay, bx, by = px[seg], py[seg], px[seg + 1], py[seg + 1]
+    # Keep unclipped endpoints exact instead of recomputing a + 1 * (b - a)
+    start_x = np.where(t0 == 0, ax, ax + t0 * (bx - ax))
+    start_y = np.where(t0 == 0, ay, ay + t0 * (by - ay))
+    end_x = np.where(t1 == 1, bx, ax + t1 * (bx - ax))
+    end_y = np.where(t1 == 1, by, ay + t1 * (by - ay))
+
+    # A segment continues the previous one if they are adjacent and neither was
+    # clipped at the shared point; otherwise it opens a new subpath.
+    new = np.ones(len(seg), dtype=bool)
+    new[1:] = ~((seg[1:] == seg[:-1] + 1) & (t1[:-1] == 1) & (t0[1:] == 0))
+
+    emit = np.column_stack([new, np.ones(len(seg), dtype=bool)]).ravel()
+    starts = np.column_stack([new, np.zeros(len(seg), dtype=bool)]).ravel()
+    out_x = np.column_stack([start_x, end_x]).ravel()
+    out_y = np.column_stack([start_y, end_y]).ravel()
+    return out_x[emit], out_y[emit], starts[emit]
+
+
+def clip_segment_arrays(x0, y0, x1, y1, rect, keep_start=None):
+    """Clip independent pixel-space segments to `rect`.
+
+    Args:
+        x0, y0, x1, y1: Segment endpoints (arrays)
+        rect: (x_min, y_min, x_max, y_max)
+        keep_start: Optional boolean mask of segments that are only trimmed at
+            their end (dashed lines keep their dash phase)
+
+    Returns:
+        tuple: (start_x, start_y, end_x, end_y, visible) with unclipped
+        endpoints returned unchanged.
+    """
+    t0, t1, visible = clip_segments(x0, y0, x1, y1, rect)
+    if keep_start is not None:
+        t0 = np.where(keep_start, 0.0, t0)
+
+    start_x = np.where(t0 == 0, x0, x0 + t0 * (x1 - x0))
+    start_y = np.where(t0 == 0, y0, y0 + t0 * (y1 - y0))
+    end_x = np.where(t1 == 1, x1, x0 + t1 * (x1 - x0))
+    end_y = np.where(t1 == 1, y1, y0 + t1 * (y1 - y0))
+    return start_x, start_y, end_x, end_y, visible
+
+
+def clip_line_elements(lines, transform_x, transform_y, rect, precision=None):
+    """Transform and clip all plain ``line`` dicts of a graph in one vectorized pass.
+
+    Only dict lines rendered as ``<line>`` are handled; axes (which carry arrow
+    markers), circles, paths, line batches, curves and Line objects are left to
+    the renderer.
+    Dashed lines are only trimmed at their end so the dash phase is kept.
+
+    Returns:
+        dict: index in `lines` -> ((x1, y1), (x2, y2)) in pixels, or None when
+        the line lies entirely outside `rect` and can be skipped.
+    """
+    indices = []
+    coords = []
+    dashed = []
+    for index, line in enumerate(lines):
+        if not isinstance(line, dict) or line.get("type", "line") in (
+            "axis",
+            "circle",
+            "path",
+            "line_batch",
+        ):
+            continue
+        values = (line.get("x1"), line.get("y1"), line.get("x2"), line.get("y2"))
+        if any(value is None for value in values):
+            continue
+        indices.append(index)
+        coords.append(values)
+        dashed.append(bool(line.get("stroke-dasharray")))
+    if not indices:
+        return {}
+
+    data = np.asarray(coords, dtype=float)
+    x0, x1 = transform_x(data[:, 0]), transform_x(data[:, 2])
+    y0, y1 = transform_y(data[:, 1]), transform_y(data[:, 3])
+    start_x, start_y, end_x, end_y, visible = clip_segment_arrays(x0, y0, x1, y1, rect, dashed)
+
+    result = {}
+    rows = zip(
+        indices,
+        visible.tolist(),
+        start_x.tolist(),
+        start_y.tolist(),
+        end_x.tolist(),
+        end_y.tolist(),
+    )
+    for index, is_visible, sx, sy, ex, ey in rows:
+        if is_visible:
+            result[index] = (
+                (quantize(sx, precision), quantize(sy, precision)),
+                (quantize(ex, precision), quantize(ey, precision)),
+            )
+        else:
+            result[index] = None
+    return result
+
+
+def canvas_rect(plot_width, plot_height, margins, padding):
+    """Visible canvas in plot-group coordinates, grown by `padding` pixels.
+
+    Args:
+        plot_width, plot_height: Size of the plot area
+        margins: (top, right, bottom, left) SVG margins around the plot area
+        padding: Extra pixels on every side
+    """
+    top, right, bottom, left = margins
+    return (
+        -left - padding,
+        -top - padding,
+        plot_width + right + padding,
+        plot_height + bottom + padding,
+    )
+
+
+def data_view(rect, x_min, x_max, y_min, y_max, plot_width, plot_height):
+    """Map a pixel rectangle of the plot group back to data space.
+
+    Returns:
+        tuple: (x_min, x_max, y_min, y_max) in data units
+    """
+    left, top, right, bottom = rect
+    x_scale = (x_max - x_min) / plot_width
+    y_scale = (y_max - y_min) / plot_height
+    return (
+        x_min + left * x_scale,
+        x_min + right * x_scale,
+        y_min + (plot_height - bottom) * y_scale,
+        y_min + (plot_height - top) * y_scale,
+    )
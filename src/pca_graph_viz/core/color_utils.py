@@ -2,8 +2,13 @@
 """
 Convert OKLCH colors to HEX using approximate conversions
 Based on the CSS Color Module Level 4 specification
+
+`oklch_array_to_rgb` converts whole arrays of colors at once; the themes of
+`oklch_colors` are compiled once into palettes by `theme_palette`. NumPy is
+imported and the palettes are compiled on first use, not at import.
 """
 
+import functools
 import math
 
 
@@ -43,11 +48,92 @@ def oklch_to_rgb(l, c, h):
     return int(r * 255), int(g * 255), int(b * 255)
 
 
+@functools.lru_cache(maxsize=None)
+def _oklab_matrices():
+    """OKLab -> LMS (cube roots) and linear LMS -> linear sRGB matrices"""
+    import numpy as np
+
+    oklab_to_lms = np.array(
+        [
+            [1.0, 0.3963377774, 0.2158037573],
+            [1.0, -0.1055613458, -0.0638541728],
+            [1.0, -0.0894841775, -1.2914855480],
+        ]
+    )
+    lms_to_linear_rgb = np.array(
+        [
+            [4.0767416621, -3.3077115913, 0.2309699292],
+            [-1.2684380046, 2.6097574011, -0.3413193965],
+            [-0.0041960863, -0.7034186147, 1.7076147010],
+        ]
+    )
+    return oklab_to_lms, lms_to_linear_rgb
+
+
+def oklch_array_to_rgb(lightness, c, h):
+    """Vectorized `oklch_to_rgb`: convert arrays of L, C, H to RGB (0-255 range)
+
+    Returns:
+        np.ndarray: uint8 array of shape (..., 3), identical to `oklch_to_rgb`
+        applied to every color
+    """
+    import numpy as np
+
+    lightness, c, h = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (lightness, c, h)))
+    h_rad = h * math.pi / 180
+    lab = np.stack([lightness, c * np.cos(h_rad), c * np.sin(h_rad)], axis=-1)
+
+    oklab_to_lms, lms_to_linear_rgb = _oklab_matrices()
+    lms = (lab @ oklab_to_lms.T) ** 3
+    linear = lms @ lms_to_linear_rgb.T
+
+    # Gamma correction (the power branch only sees values above the threshold)
+    with np.errstate(invalid="ignore"):
+        srgb = np.where(
+            linear <= 0.0031308,
+            12.92 * linear,
+            1.055 * np.maximum(linear, 0.0031308) ** (1 / 2.4) - 0.055,
+        )
+    return (np.clip(srgb, 0, 1) * 255).astype(np.uint8)
+
+
 def rgb_to_hex(r, g, b):
     """Convert RGB to HEX"""
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+def rgb_array_to_hex(rgb):
+    """Convert an (n, 3) RGB array to a list of HEX strings"""
+    import numpy as np
+
+    rgb = np.asarray(rgb, dtype=np.uint8).reshape(-1, 3)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist()]
+
+
+def oklch_to_hex_batch(oklch_strings):
+    """Convert a sequence of OKLCH strings to HEX in one vectorized pass
+
+    Strings that cannot be parsed are returned unchanged, as with `oklch_to_hex`.
+    """
+    oklch_strings = list(oklch_strings)
+    parsed = []
+    for index, oklch_str in enumerate(oklch_strings):
+        try:
+            parsed.append((index, parse_oklch(oklch_str)))
+        except Exception:
+            pass
+    result = list(oklch_strings)
+    if parsed:
+        import numpy as np
+
+        lch = np.array([values for _, values in parsed], dtype=float)
+        hex_colors = rgb_array_to_hex(oklch_array_to_rgb(lch[:, 0], lch[:, 1], lch[:, 2]))
+        for (index, _), hex_color in zip(parsed, hex_colors):
+            result[index] = hex_color
+    return result
+
+
+@functools.lru_cache(maxsize=256)
 def oklch_to_hex(oklch_str):
     """Convert OKLCH color string to HEX"""
     try:
@@ -129,45 +215,110 @@ oklch_colors = {
     },
 }
 
-# Convert all colors
-print("=== CONVERTED COLORS ===\n")
-
-for theme_name, colors in oklch_colors.items():
-    print(f"/* {theme_name.upper()} THEME - HEX VALUES */")
-    print(f'[data-theme="{theme_name}"] {{')
-
-    # Group by color type
-    groups = {
-        "Base colors": ["base-100", "base-200", "base-300", "base-content"],
-        "Primary colors": ["primary", "primary-content"],
-        "Secondary colors": ["secondary", "secondary-content"],
-        "Accent colors": ["accent", "accent-content"],
-        "Neutral colors": ["neutral", "neutral-content"],
-        "State colors": [
-            "info",
-            "info-content",
-            "success",
-            "success-content",
-            "warning",
-            "warning-content",
-            "error",
-            "error-content",
-        ],
-    }
-
-    for group_name, color_names in groups.items():
-        print(f"    /* {group_name} */")
-        for color_name in color_names:
-            var_name = f"--color-{color_name}"
-            if var_name in colors:
-                oklch_str = colors[var_name]
-                try:
-                    l, c, h = parse_oklch(oklch_str)
-                    r, g, b = oklch_to_rgb(l, c, h)
-                    hex_color = rgb_to_hex(r, g, b)
-                    print(f"    {var_name}: {hex_color};")
-                except Exception:
-                    print(f"    {var_name}: /* Error converting {oklch_str} */")
-        print()
-
-    print("}\n")
+
+@functools.lru_cache(maxsize=None)
+def _compile_theme(theme):
+    """Convert every color of `theme` once; returns a tuple of (variable, HEX) pairs"""
+    if theme not in oklch_colors:
+        raise ValueError(f"Unknown theme: {theme}. Available: {list(oklch_colors)}")
+    colors = oklch_colors[theme]
+    return tuple(zip(colors, oklch_to_hex_batch(colors.values())))
+
+
+def theme_palette(theme):
+    """Return the HEX palette of `theme` as {"--color-primary": "#...", ...}
+
+    Themes are converted once and memoized; edit `oklch_colors` before the
+    first call (or call `_compile_theme.cache_clear()`).
+    """
+    return dict(_compile_theme(theme))
+
+
+# Theme whose palette provides the inline fallback colors of DaisyUI classes
+DEFAULT_THEME = "bolt"
+
+# DaisyUI utility prefixes that carry a theme color (stroke-primary, fill-base-100, ...)
+DAISYUI_COLOR_PREFIXES = ("stroke", "fill", "text")
+
+
+def daisyui_color_fallbacks(theme=DEFAULT_THEME):
+    """Map DaisyUI color classes to the HEX colors of `theme` (see theme_palette)"""
+    fallbacks = {}
+    for variable, hex_color in theme_palette(theme).items():
+        name = variable[len("--color-") :]
+        for prefix in DAISYUI_COLOR_PREFIXES:
+            fallbacks[f"{prefix}-{name}"] = hex_color
+    return fallbacks
+
+
+@functools.lru_cache(maxsize=None)
+def _default_color_fallbacks():
+    """DaisyUI class to fallback color mapping of the default theme, built on first use"""
+    return daisyui_color_fallbacks()
+
+
+def __getattr__(name):
+    # DAISYUI_COLOR_FALLBACKS is computed on first access instead of at import
+    if name == "DAISYUI_COLOR_FALLBACKS":
+        return _default_color_fallbacks()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_color_from_class(class_string):
+    """Extract fallback color from DaisyUI class string"""
+    if not class_string:
+        return None
+
+    fallbacks = _default_color_fallbacks()
+    # Check each class in the string
+    for cls in class_string.split():
+        if cls in fallbacks:
+            return fallbacks[cls]
+    return None
+
+
+def print_theme_css():
+    """Print every theme of `oklch_colors` as CSS custom properties in HEX."""
+    print("=== CONVERTED COLORS ===\n")
+
+    for theme_name in oklch_colors:
+        palette = theme_palette(theme_name)
+        print(f"/* {theme_name.upper()} THEME - HEX VALUES */")
+        print(f'[data-theme="{theme_name}"] {{')
+
+        # Group by color type
+        groups = {
+            "Base colors": ["base-100", "base-200", "base-300", "base-content"],
+            "Primary colors": ["primary", "primary-content"],
+            "Secondary colors": ["secondary", "secondary-content"],
+            "Accent colors": ["accent", "accent-content"],
+            "Neutral colors": ["neutral", "neutral-content"],
+            "State colors": [
+                "info",
+                "info-content",
+                "success",
+                "success-content",
+                "warning",
+                "warning-content",
+                "error",
+                "error-content",
+            ],
+        }
+
+        for group_name, color_names in groups.items():
+            print(f"    /* {group_name} */")
+            for color_name in color_names:
+                var_name = f"--color-{color_name}"
+                if var_name in palette:
+                    hex_color = palette[var_name]
+                    if hex_color.startswith("#"):
+                        print(f"    {var_name}: {hex_color};")
+                    else:
+                        print(f"    {var_name}: /* Error converting {hex_color} */")
+            print()
+
+        print("}\n")
+
+
+if __name__ == "__main__":
+    print_theme_css()
@@ -0,0 +1,642 @@
+"""Element-type registry: how each kind of graph element is drawn.
+
+The ``lines`` of a graph are a mixed list of elements told apart by their
+``type`` (``"line"``, ``"axis"``, ``"tick"``, ``"circle"``, ``"path"``,
+``"line_batch"``, the data-space shapes ``"rect"``, ``"ellipse"``, ``"arc"``,
+``"polygon"``, ``"polyline"`` and ``"text"``, ...) plus Line objects. A renderer is registered per type
+and receives a whole run of consecutive elements of that type at once, so it
+can transform, clip and encode them as arrays::
+
+    @register_element("cross")
+    def render_crosses(context, crosses):
+        ...
+
+The list is split into runs of adjacent elements of the same type and the
+runs are drawn in order, which keeps the z-order of every element. Types
+without a renderer are drawn as plain lines.
+
+The two renderers differ in how unstyled or DaisyUI-classed elements get
+their colors; `RenderContext.class_fallbacks` selects the policy:
+
+- False (``create_svg_scene``): an explicit ``stroke``/``fill`` is only set
+  when the class has no ``stroke-``/``fill-`` utility, and elements without
+  a class get default classes with a ``currentColor`` stroke.
+- True (``create_multi_curve_svg``): DaisyUI classes provide inline fallback
+  colors and axes use color-specific arrow markers.
+"""
+
+import numpy as np
+
+from .batching import LINE_BATCH_TYPE, batch_lines, batch_path_data
+from .clipping import clip_line_elements
+from .color_utils import get_color_from_class
+from .number_format import compact, quantize
+from .path_encoder import break_polyline, encode_polyline, transform_points
+
+# Type of elements without a "type" key, and of types without a renderer
+DEFAULT_ELEMENT_TYPE = "line"
+
+# Pseudo-type of Line objects (records or pydantic models) in the element list
+LINE_OBJECT_TYPE = "line_object"
+
+# Element type -> renderer(context, elements)
+ELEMENT_RENDERERS = {}
+
+
+class RenderContext:
+    """Everything a renderer needs to draw elements into the plot area."""
+
+    __slots__ = (
+        "drawing",
+        "parent",
+        "transform_x",
+        "transform_y",
+        "clip_rect",
+        "precision",
+        "class_fallbacks",
+    )
+
+    def __init__(
+        self,
+        drawing,
+        parent,
+        transform_x,
+        transform_y,
+        clip_rect=None,
+        precision=None,
+        class_fallbacks=True,
+    ):
+        self.drawing = drawing
+        self.parent = parent
+        self.transform_x = transform_x
+        self.transform_y = transform_y
+        self.clip_rect = clip_rect
+        self.precision = precision
+        self.class_fallbacks = class_fallbacks
+
+
+def register_element(element_type, renderer=None):
+    """Register `renderer(context, elements)` for `element_type`; usable as a decorator.
+
+    Registering an already known type replaces its renderer.
+    """
+    if renderer is None:
+        return lambda function: register_element(element_type, function)
+    ELEMENT_RENDERERS[element_type] = renderer
+    return renderer
+
+
+def get_element_renderer(element_type):
+    """Return the renderer of `element_type`, falling back to the plain line renderer."""
+    return ELEMENT_RENDERERS.get(element_type) or ELEMENT_RENDERERS[DEFAULT_ELEMENT_TYPE]
+
+
+def element_type(element):
+    """Return the registry key of an element (dicts by their "type", objects as Line objects)."""
+    if isinstance(element, dict):
+        return element.get("type", DEFAULT_ELEMENT_TYPE)
+    return LINE_OBJECT_TYPE
+
+
+def element_runs(elements):
+    """Split `elements` into (type, [elements]) runs of adjacent elements of the same type."""
+    runs = []
+    for element in elements:
+        kind = element_type(element)
+        if runs and runs[-1][0] == kind:
+            runs[-1][1].append(element)
+        else:
+            runs.append((kind, [element]))
+    return runs
+
+
+def render_elements(context, elements):
+    """Draw `elements` run by run with their registered renderers."""
+    for kind, run in element_runs(elements):
+        get_element_renderer(kind)(context, run)
+
+
+def _set_optional(elem, element, keys):
+    """Copy the truthy `keys` of a dict element onto the SVG element."""
+    for key in keys:
+        if element.get(key):
+            elem[key] = element.get(key)
+
+
+def _axis_marker_id(element):
+    """Id of the color-specific arrow marker of an axis (see create_multi_curve_svg)."""
+    stroke_color = get_color_from_class(element.get("class", "")) or element.get("stroke", "black")
+    return f"arrow-{stroke_color.replace('#', '')}"
+
+
+def _is_vertical(element):
+    x1, y1 = element.get("x1", 0), element.get("y1", 0)
+    x2, y2 = element.get("x2", 0), element.get("y2", 0)
+    return abs(y2 - y1) > abs(x2 - x1)
+
+
+@register_element(LINE_OBJECT_TYPE)
+def render_line_objects(context, lines):
+    """Draw Line objects (records or pydantic models) as ``<line>`` elements."""
+    transform_x, transform_y = context.transform_x, context.transform_y
+    for line in lines:
+        if not hasattr(line, "x1"):
+            continue
+        line_kwargs = {
+            "start": (transform_x(line.x1), transform_y(line.y1)),
+            "end": (transform_x(line.x2), transform_y(line.y2)),
+            "stroke_width": line.stroke_width,
+        }
+        fallback_color = None
+        if context.class_fallbacks:
+            # Get fallback color from class if present
+            fallback_color = get_color_from_class(getattr(line, "class_", ""))
+            if fallback_color:
+                line_kwargs["stroke"] = fallback_color
+            elif hasattr(line, "stroke"):
+                line_kwargs["stroke"] = line.stroke
+        line_elem = context.drawing.line(**line_kwargs)
+        if line.stroke_opacity is not None:
+            line_elem["stroke-opacity"] = line.stroke_opacity
+        if line.stroke_dasharray:
+            line_elem["stroke-dasharray"] = line.stroke_dasharray
+        if line.class_:
+            line_elem["class"] = line.class_
+        if line.id:
+            line_elem["id"] = line.id
+        if line.style:
+            line_elem["style"] = line.style
+        # Check for type field to add arrow
+        if getattr(line, "type", None) == "axis":
+            if context.class_fallbacks:
+                # Use color-specific arrow marker
+                stroke_color = fallback_color or getattr(line, "stroke", "black")
+                line_elem["marker-end"] = f"url(#arrow-{stroke_color.replace('#', '')})"
+            elif abs(line.y2 - line.y1) > abs(line.x2 - line.x1):
+                line_elem["marker-end"] = "url(#arrow-y)"
+            else:
+                line_elem["marker-end"] = "url(#arrow-x)"
+        context.parent.add(line_elem)
+
+
+def _draw_line(context, line, line_type, start, end):
+    """Draw one line or axis dict between pixel points `start` and `end`."""
+    class_value = line.get("class", "") or ""
+    line_kwargs = {
+        "start": start,
+        "end": end,
+        "stroke_width": line.get("stroke-width", line.get("stroke_width", 1)),
+    }
+    if context.class_fallbacks:
+        # Add fallback stroke color if class contains color directive
+        fallback_color = get_color_from_class(class_value)
+        if fallback_color:
+            line_kwargs["stroke"] = fallback_color
+        elif line.get("stroke"):
+            line_kwargs["stroke"] = line.get("stroke")
+    elif "stroke-" not in class_value and line.get("stroke") is not None:
+        line_kwargs["stroke"] = line.get("stroke")
+    line_elem = context.drawing.line(**line_kwargs)
+
+    if line.get("stroke-opacity") is not None:
+        line_elem["stroke-opacity"] = line.get("stroke-opacity")
+    if line.get("stroke-dasharray"):
+        line_elem["stroke-dasharray"] = line.get("stroke-dasharray")
+    if line.get("class"):
+        line_elem["class"] = line.get("class")
+    elif not context.class_fallbacks:
+        # Apply default classes, with the axis orientation for axes
+        if line_type == "axis":
+            axis_cls = "y-axis" if _is_vertical(line) else "x-axis"
+            line_elem["class"] = f"axis {axis_cls} stroke-base-content"
+        else:
+            line_elem["class"] = "line stroke-secondary"
+        # Ensure visible stroke even if CSS vars are missing
+        if "stroke" not in line_elem.attribs:
+            line_elem["stroke"] = "currentColor"
+    _set_optional(line_elem, line, ("id", "style"))
+
+    # Axes end with an arrow
+    if line_type == "axis":
+        if not context.class_fallbacks:
+            line_elem["marker-end"] = "url(#arrow-y)" if _is_vertical(line) else "url(#arrow-x)"
+        elif "no-arrow" not in line.get("class", ""):
+            line_elem["marker-end"] = f"url(#{_axis_marker_id(line)})"
+    context.parent.add(line_elem)
+
+
+@register_element(DEFAULT_ELEMENT_TYPE)
+def render_lines(context, lines):
+    """Draw line dicts as ``<line>`` elements, transformed and clipped as one batch."""
+    transform_x, transform_y = context.transform_x, context.transform_y
+    line_coords = {}
+    if context.clip_rect is not None:
+        # None marks a line outside the canvas
+        line_coords = clip_line_elements(
+            lines, transform_x, transform_y, context.clip_rect, context.precision
+        )
+    for index, line in enumerate(lines):
+        if index in line_coords:
+            if line_coords[index] is None:
+                continue
+            start, end = line_coords[index]
+        else:
+            start = (transform_x(line.get("x1")), transform_y(line.get("y1")))
+            end = (transform_x(line.get("x2")), transform_y(line.get("y2")))
+        _draw_line(context, line, line.get("type", DEFAULT_ELEMENT_TYPE), start, end)
+
+
+@register_element("axis")
+def render_axes(context, axes):
+    """Draw axis dicts as unclipped ``<line>`` elements ending with an arrow marker."""
+    transform_x, transform_y = context.transform_x, context.transform_y
+    for axis in axes:
+        start = (transform_x(axis.get("x1")), transform_y(axis.get("y1")))
+        end = (transform_x(axis.get("x2")), transform_y(axis.get("y2")))
+        _draw_line(context, axis, "axis", start, end)
+
+
+@register_element("tick")
+def render_ticks(context, ticks):
+    """Draw tick marks: short segments styled like lines, merged into one path per style.
+
+    Ticks come in long runs of identical marks, so every run of equally
+    styled ticks is written as a single ``line_batch`` path; ticks that
+    cannot be batched (an id, a marker, an opacity) are drawn as lines.
+    """
+    segments = [{**tick, "type": DEFAULT_ELEMENT_TYPE} for tick in ticks]
+    render_elements(context, batch_lines(segments, min_size=1))
+
+
+@register_element(LINE_BATCH_TYPE)
+def render_line_batches(context, batches):
+    """Draw ``line_batch`` elements as one path each (see batching.py).
+
+    The path carries the attributes a plain line with the batch's style would get.
+    """
+    for batch in batches:
+        path_data = batch_path_data(
+            batch, context.transform_x, context.transform_y, context.clip_rect, context.precision
+        )
+        if not path_data:
+            continue
+        class_value = batch.get("class", "") or ""
+        path_kwargs = {
+            "d": path_data,
+            "fill": "none",
+            "stroke_width": batch.get("stroke-width", batch.get("stroke_width", 1)),
+        }
+        if context.class_fallbacks:
+            fallback_color = get_color_from_class(class_value)
+            if fallback_color:
+                path_kwargs["stroke"] = fallback_color
+            elif batch.get("stroke"):
+                path_kwargs["stroke"] = batch.get("stroke")
+        elif "stroke-" not in class_value and batch.get("stroke") is not None:
+            path_kwargs["stroke"] = batch.get("stroke")
+        path_elem = context.drawing.path(**path_kwargs)
+        if batch.get("stroke-opacity") is not None:
+            path_elem["stroke-opacity"] = batch.get("stroke-opacity")
+        if batch.get("stroke-dasharray"):
+            path_elem["stroke-dasharray"] = batch.get("stroke-dasharray")
+        if class_value:
+            path_elem["class"] = class_value
+        elif not context.class_fallbacks:
+            path_elem["class"] = "line stroke-secondary"
+            # Ensure visible stroke even if CSS vars are missing
+            if "stroke" not in path_elem.attribs:
+                path_elem["stroke"] = "currentColor"
+        _set_optional(path_elem, batch, ("id", "style"))
+        context.parent.add(path_elem)
+
+
+def shape_paint(context, element, default_fill=None):
+    """Return the ``stroke_width``/``fill``/``stroke`` keyword arguments of a shape.
+
+    Scenes only set an explicit paint when the class has no matching utility
+    (the fill defaults to `default_fill`, None leaving it unset); multi-curve
+    graphs resolve DaisyUI classes to fallback colors and default the fill
+    to ``"none"``.
+    """
+    class_value = element.get("class", "") or ""
+    if not context.class_fallbacks:
+        kwargs = {"stroke_width": element.get("stroke-width", element.get("stroke_width", 1))}
+        fill = element.get("fill", default_fill)
+        if "fill-" not in class_value and fill is not None:
+            kwargs["fill"] = fill
+        if "stroke-" not in class_value and element.get("stroke") is not None:
+            kwargs["stroke"] = element.get("stroke")
+        return kwargs
+
+    kwargs = {"stroke_width": element.get("stroke-width", 1)}
+    # Add fallback colors from classes
+    stroke_fallback = get_color_from_class(class_value)
+    if stroke_fallback and "stroke-" in class_value:
+        kwargs["stroke"] = stroke_fallback
+    elif element.get("stroke"):
+        kwargs["stroke"] = element.get("stroke")
+    fill_fallback = get_color_from_class(class_value.replace("stroke-", "fill-"))
+    if fill_fallback and "fill-" in class_value:
+        kwargs["fill"] = fill_fallback
+    elif element.get("fill"):
+        kwargs["fill"] = element.get("fill")
+    else:
+        kwargs["fill"] = "none"
+    return kwargs
+
+
+def finish_shape(context, elem, element, default_class="stroke-base-content"):
+    """Set the class, id and style of a shape and add it to the plot area.
+
+    Scenes give shapes without a class `default_class` and a ``currentColor``
+    stroke so they stay visible when the theme CSS is missing.
+    """
+    if element.get("class"):
+        elem["class"] = element.get("class")
+    elif not context.class_fallbacks and default_class:
+        elem["class"] = default_class
+        # Ensure visible stroke even if CSS vars are missing
+        if "stroke" not in elem.attribs:
+            elem["stroke"] = "currentColor"
+    _set_optional(elem, element, ("id", "style"))
+    context.parent.add(elem)
+
+
+@register_element("circle")
+def render_circles(context, circles):
+    """Draw circle dicts (``cx``, ``cy`` in data space, ``r`` in pixels)."""
+    transform_x, transform_y = context.transform_x, context.transform_y
+    for circle in circles:
+        circle_elem = context.drawing.circle(
+            center=(transform_x(circle.get("cx", 0)), transform_y(circle.get("cy", 0))),
+            r=circle.get("r", 5),
+            **shape_paint(context, circle, default_fill="none"),
+        )
+        finish_shape(context, circle_elem, circle)
+
+
+@register_element("path")
+def render_paths(context, paths):
+    """Draw path dicts whose ``d`` is already in pixel space."""
+    for path in paths:
+        path_elem = context.drawing.path(d=path.get("d", ""), **shape_paint(context, path))
+        _set_optional(path_elem, path, ("fill-opacity", "stroke-opacity", "stroke-dasharray"))
+        finish_shape(context, path_elem, path)
+
+
+# Data-space shapes ------------------------------------------------------
+#
+# Coordinates and sizes are given in data units and transformed as arrays, so
+# a histogram is a run of ``rect`` dicts rather than four lines per bar:
+#
+#     {"type": "rect", "x": 0, "y": 0, "width": 1, "height": 3, "class": "fill-primary"}
+#     {"type": "ellipse", "cx": 0, "cy": 0, "rx": 2, "ry": 1}   # or "r": 1 for a circle
+#     {"type": "arc", "cx": 0, "cy": 0, "r": 0.5, "start": 0, "end": np.pi / 3, "sector": True}
+#     {"type": "polygon", "points": [[0, 0], [1, 2], [2, 0]]}   # or "x": [...], "y": [...]
+#     {"type": "polyline", "x": [0, 1, 2], "y": [0, 1, 0]}
+#     {"type": "text", "x": 1, "y": 2, "text": "A", "text-anchor": "middle"}
+
+# Presentation attributes copied from shape dicts onto their SVG element
+SHAPE_ATTRIBUTES = ("fill-opacity", "stroke-opacity", "stroke-dasharray")
+TEXT_ATTRIBUTES = ("text-anchor", "dominant-baseline", "font-size", "font-weight", "dx", "dy")
+
+
+def _column(elements, key, default=0.0):
+    """Gather `key` of every element as a float array."""
+    return np.array([element.get(key, default) for element in elements], dtype=float)
+
+
+def _pixels(values, precision):
+    """Convert a pixel array to a list of scalars written compactly (see number_format.py)."""
+    if precision is None:
+        return values.tolist()
+    return [quantize(value, precision) for value in values.tolist()]
+
+
+def _radii(element):
+    """Return the (rx, ry) data-space radii of an ellipse or arc; ``r`` sets both."""
+    radius = element.get("r", 1)
+    return element.get("rx", radius), element.get("ry", radius)
+
+
+def _arc_angles(element):
+    """Return the (start, end) angles of an arc in radians; a full turn by default."""
+    start = element.get("start", 0.0)
+    return start, element.get("end", start + 2 * np.pi)
+
+
+def _point_columns(element):
+    """Return the x and y arrays of a polygon or polyline dict."""
+    if "points" in element:
+        points = np.asarray(element["points"], dtype=float).reshape(-1, 2)
+        return points[:, 0], points[:, 1]
+    return np.asarray(element.get("x", []), dtype=float), np.asarray(
+        element.get("y", []), dtype=float
+    )
+
+
+def shape_bounds(element):
+    """Return the data-space (xs, ys) extents of a data-space shape dict, or empty lists."""
+    kind = element.get("type")
+    if kind == "rect":
+        x, y = element.get("x", 0), element.get("y", 0)
+        return [x, x + element.get("width", 0)], [y, y + element.get("height", 0)]
+    if kind == "ellipse":
+        cx, cy = element.get("cx", 0), element.get("cy", 0)
+        rx, ry = (abs(radius) for radius in _radii(element))
+        return [cx - rx, cx + rx], [cy - ry, cy + ry]
+    if kind == "arc":
+        cx, cy = element.get("cx", 0), element.get("cy", 0)
+        rx, ry = _radii(element)
+        angles = np.linspace(*_arc_angles(element), 65)
+        xs, ys = (cx + rx * np.cos(angles)).tolist(), (cy + ry * np.sin(angles)).tolist()
+        if element.get("sector"):
+            xs.append(cx)
+            ys.append(cy)
+        return xs, ys
+    if kind in ("polygon", "polyline"):
+        x, y = _point_columns(element)
+        return x[np.isfinite(x)].tolist(), y[np.isfinite(y)].tolist()
+    if kind == "text":
+        return [element.get("x", 0)], [element.get("y", 0)]
+    return [], []
+
+
+@register_element("rect")
+def render_rects(context, rects):
+    """Draw rect dicts: corner (``x``, ``y``) and signed ``width``/``height`` in data units.
+
+    ``rx``/``ry`` (corner radii) are in pixels, as for circles.
+    """
+    x, y = _column(rects, "x"), _column(rects, "y")
+    x0, x1 = context.transform_x(x), context.transform_x(x + _column(rects, "width"))
+    y0, y1 = context.transform_y(y), context.transform_y(y + _column(rects, "height"))
+    precision = context.precision
+    columns = (
+        _pixels(np.minimum(x0, x1), precision),
+        _pixels(np.minimum(y0, y1), precision),
+        _pixels(np.abs(x1 - x0), precision),
+        _pixels(np.abs(y1 - y0), precision),
+    )
+    for rect, left, top, width, height in zip(rects, *columns):
+        if not np.isfinite([left, top, width, height]).all():
+            continue
+        rect_elem = context.drawing.rect(
+            insert=(left, top),
+            size=(width, height),
+            **shape_paint(context, rect, default_fill="none"),
+        )
+        _set_optional(rect_elem, rect, ("rx", "ry") + SHAPE_ATTRIBUTES)
+        finish_shape(context, rect_elem, rect)
+
+
+@register_element("ellipse")
+def render_ellipses(context, ellipses):
+    """Draw ellipse dicts: center (``cx``, ``cy``) and radii ``rx``/``ry`` (or ``r``) in data units.
+
+    Each radius is scaled along its own axis, so a data-space circle drawn with
+    a non-uniform scale is the ellipse it really is on screen.
+    """
+    cx, cy = _column(ellipses, "cx"), _column(ellipses, "cy")
+    radii = np.array([_radii(ellipse) for ellipse in ellipses], dtype=float).reshape(-1, 2)
+    px, py = context.transform_x(cx), context.transform_y(cy)
+    rx = np.abs(context.transform_x(cx + radii[:, 0]) - px)
+    ry = np.abs(context.transform_y(cy + radii[:, 1]) - py)
+    precision = context.precision
+    columns = (_pixels(px, precision), _pixels(py, precision))
+    radii = (_pixels(rx, precision), _pixels(ry, precision))
+    for ellipse, x, y, radius_x, radius_y in zip(ellipses, *columns, *radii):
+        if not np.isfinite([x, y, radius_x, radius_y]).all():
+            continue
+        ellipse_elem = context.drawing.ellipse(
+            center=(x, y),
+            r=(radius_x, radius_y),
+            **shape_paint(context, ellipse, default_fill="none"),
+        )
+        _set_optional(ellipse_elem, ellipse, SHAPE_ATTRIBUTES)
+        finish_shape(context, ellipse_elem, ellipse)
+
+
+@register_element("arc")
+def render_arcs(context, arcs):
+    """Draw arcs of data-space circles or ellipses as SVG ``A`` commands.
+
+    ``cx``, ``cy`` and ``r`` (or ``rx``/``ry``) are in data units; ``start`` and
+    ``end`` are angles in radians, counterclockwise as in the plane (an arc
+    with ``end < start`` runs clockwise). Radii are scaled per axis, so under
+    a non-uniform scale a circle becomes an ellipse. ``"sector": True`` closes
+    the arc through the center (angle markers); an arc without angles is a
+    full ``<ellipse>``.
+    """
+    for arc in arcs:
+        if "start" not in arc and "end" not in arc and not arc.get("sector"):
+            render_ellipses(context, [arc])
+            continue
+        path_data = arc_path_data(arc, context.transform_x, context.transform_y, context.precision)
+        if not path_data:
+            continue
+        path_elem = context.drawing.path(
+            d=path_data, **shape_paint(context, arc, default_fill="none")
+        )
+        _set_optional(path_elem, arc, SHAPE_ATTRIBUTES)
+        finish_shape(context, path_elem, arc)
+
+
+def arc_path_data(arc, transform_x, transform_y, precision=None):
+    """Encode an ``arc`` dict (see render_arcs) as ``M``/``A`` path data.
+
+    The arc is split into pieces of at most half a turn so every ``A`` command
+    is a small arc, which keeps the flags unambiguous and allows full turns.
+
+    Returns:
+        str: Path data, or ``""`` for an empty or non-finite arc.
+    """
+    cx, cy = arc.get("cx", 0), arc.get("cy", 0)
+    rx, ry = _radii(arc)
+    start, end = _arc_angles(arc)
+    span = end - start
+    if not np.isfinite([cx, cy, rx, ry, start, end]).all() or span == 0:
+        return ""
+    pieces = max(int(np.ceil(abs(span) / np.pi - 1e-9)), 1)
+    angles = start + span * np.arange(pieces + 1) / pieces
+    px = np.asarray(transform_x(cx + rx * np.cos(angles)), dtype=float)
+    py = np.asarray(transform_y(cy + ry * np.sin(angles)), dtype=float)
+    center_x, center_y = transform_x(cx), transform_y(cy)
+    scale_x = transform_x(cx + abs(rx)) - center_x
+    scale_y = transform_y(cy + abs(ry)) - center_y
+    # Counterclockwise in the plane is the SVG negative-angle direction unless an axis is flipped
+    sweep = int((span > 0) == (scale_x * scale_y > 0))
+    radii = f"{abs(scale_x)},{abs(scale_y)}"
+    if precision is not None:
+        radii = f"{quantize(abs(scale_x), precision)},{quantize(abs(scale_y), precision)}"
+
+    templates = []
+    values = []
+    if arc.get("sector"):
+        templates.append("M {},{} L {},{} ")
+        values.extend([center_x, center_y, px[0], py[0]])
+    else:
+        templates.append("M {},{} ")
+        values.extend([px[0], py[0]])
+    templates.append(f"A {radii} 0 0,{sweep} {{}},{{}} " * pieces)
+    values.extend(np.stack([px[1:], py[1:]], axis=1).ravel().tolist())
+    if arc.get("sector"):
+        templates.append("Z")
+    path_data = "".join(templates).format(*values)
+    return path_data if precision is None else compact(path_data)
+
+
+def _render_point_shapes(context, shapes, closed):
+    """Draw polygons (`closed`) or polylines as paths; non-finite points split them."""
+    for shape in shapes:
+        x, y = _point_columns(shape)
+        px, py = transform_points(x, y, context.transform_x, context.transform_y)
+        px, py, starts = break_polyline(px, py)
+        path_data = encode_polyline(px, py, context.precision, starts)
+        if not path_data:
+            continue
+        if closed:
+            path_data = path_data.replace(" M ", " Z M ") + "Z"
+        path_elem = context.drawing.path(
+            d=path_data, **shape_paint(context, shape, default_fill="none")
+        )
+        _set_optional(path_elem, shape, SHAPE_ATTRIBUTES)
+        finish_shape(context, path_elem, shape)
+
+
+@register_element("polygon")
+def render_polygons(context, polygons):
+    """Draw closed polygons from ``points`` (pairs) or ``x``/``y`` columns in data units."""
+    _render_point_shapes(context, polygons, closed=True)
+
+
+@register_element("polyline")
+def render_polylines(context, polylines):
+    """Draw open polylines from ``points`` (pairs) or ``x``/``y`` columns in data units."""
+    _render_point_shapes(context, polylines, closed=False)
+
+
+@register_element("text")
+def render_texts(context, texts):
+    """Draw text dicts anchored at (``x``, ``y``) in data units.
+
+    The fill follows the current color unless given (scenes) or resolved from a
+    DaisyUI ``text-``/``fill-`` class (multi-curve graphs).
+    """
+    precision = context.precision
+    xs = _pixels(context.transform_x(_column(texts, "x")), precision)
+    ys = _pixels(context.transform_y(_column(texts, "y")), precision)
+    for text, x, y in zip(texts, xs, ys):
+        if not np.isfinite([x, y]).all():
+            continue
+        class_value = text.get("class", "") or ""
+        text_kwargs = {}
+        if context.class_fallbacks:
+            text_kwargs["fill"] = (
+                get_color_from_class(class_value) or text.get("fill") or "currentColor"
+            )
+        elif "fill-" not in class_value:
+            text_kwargs["fill"] = text.get("fill", "currentColor")
+        text_elem = context.drawing.text(str(text.get("text", "")), insert=(x, y), **text_kwargs)
+        _set_optional(text_elem, text, TEXT_ATTRIBUTES)
+        finish_shape(context, text_elem, text, default_class=None)
@@ -0,0 +1,366 @@
+"""Graph families: render the static layers once, re-render only what varies.
+
+Graphs generated from the same layout with different parameters (the
+``spe_sujet1_auto_10`` parabolas, whose slider only moves a label) share
+their grid, axes, axis labels and marker defs. A graph dict opts in by
+naming its family and flagging its parameter-dependent elements::
+
+    {"family": "spe_sujet1_auto_10_parabola",
+     "lines": [<axis>, <axis>, {"type": "circle", ..., "variable": True},
+               {"type": "curve", ..., "variable": True}],
+     "foreign_objects": [<x label>, <y label>, {"latex": "M(0;5)", ..., "variable": True}]}
+
+``graph_from_dict`` then renders it through ``render_family_member``:
+
+- the static part (the dict without its variable elements) is fingerprinted
+  and looked up in a package-wide LRU of templates; a template is the
+  markup of the static part with one slot for the variable lines, one for
+  the variable curves and one for the variable foreignObjects, rendered in
+  the domain of the graph pinned to its resolved bounds;
+- each variable unit (a run of same-type lines, a curve or a foreignObject)
+  is rendered alone in that domain and memoized in the template by its
+  fingerprint, so a slider change re-renders only the elements it changed.
+
+Templates and units are rendered with the backend of the call, which is part
+of the template key.
+
+The output is byte-identical to a plain render. The ``variable`` flag keeps
+a line out of line batches, so cutting lines into units never changes how
+they are drawn. A graph is rendered plainly when the split cannot be exact:
+variable elements must come after the static ones of their kind (lines,
+curves, foreignObjects), must not be ``axis`` lines (their arrow markers
+belong to the defs), and a variable line run must not continue a static run
+of the same type. When the domain is inferred from the data, the elements
+that feed the bounds are part of the template key.
+"""
+
+import threading
+from collections import OrderedDict
+
+from .elements import element_runs, element_type, register_element
+from .number_format import get_default_precision
+from .polynomial import POLYNOMIAL_TYPE
+from .render_cache import fingerprint
+from .svg_utils import _graph_from_dict, capture_drawings, get_default_backend
+from .svg_writer import StringElement
+
+FAMILY_KEY = "family"
+
+VARIABLE_KEY = "variable"
+
+CURVE_TYPES = ("curve", POLYNOMIAL_TYPE)
+
+# Templates kept across all families, and variable units memoized per template
+DEFAULT_MAX_TEMPLATES = 32
+MAX_UNITS_PER_TEMPLATE = 256
+
+_SLOT_TYPE = "_family_slot"
+
+# Curve drawn nowhere that keeps a partial render on the multi-curve path
+_NO_CURVE = {"type": "curve", "data": {"x": [], "y": []}}
+
+# Placeholder element written as a separator into a template; "<" is escaped
+# in attribute values and text, so the markup cannot occur in a render
+_SLOT_TAG = "family-slot"
+_SLOT_MARK = f"<{_SLOT_TAG} />"
+
+
+class _Slot(StringElement):
+    """Placeholder node of the string backend."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(_SLOT_TAG)
+
+    def write(self, out):
+        out.append(_SLOT_MARK)
+
+
+class _SvgwriteSlot:
+    """Placeholder node of the svgwrite backend."""
+
+    elementname = _SLOT_TAG
+
+    def get_xml(self):
+        from xml.etree.ElementTree import Element
+
+        return Element(_SLOT_TAG)
+
+
+def _add_slot(parent):
+    # Appended directly: svgwrite's validator rejects unknown child elements
+    parent.elements.append(_Slot() if isinstance(parent, StringElement) else _SvgwriteSlot())
+
+
+@register_element(_SLOT_TYPE)
+def _render_slots(context, slots):
+    _add_slot(context.parent)
+
+
+class FamilyTemplate:
+    """Static markup of a family layout and the memoized markup of its variable units."""
+
+    __slots__ = (
+        "head",
+        "middle",
+        "tail",
+        "empty",
+        "foreign_objects",
+        "layout",
+        "backend",
+        "units",
+    )
+
+    def __init__(self, head, middle, tail, empty, foreign_objects, layout, backend):
+        self.head = head
+        self.middle = middle
+        self.tail = tail
+        self.empty = empty
+        self.foreign_objects = foreign_objects
+        self.layout = layout
+        self.backend = backend
+        self.units = {}
+
+
+class FamilyCache:
+    """LRU of family templates keyed by the fingerprint of their static part."""
+
+    def __init__(self, max_templates=DEFAULT_MAX_TEMPLATES):
+        self.max_templates = max_templates
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.unit_hits = 0
+        self.unit_misses = 0
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, key):
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template
+
+    def put(self, key, template):
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+
+    def clear(self):
+        """Drop every template and reset the counters."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = self.unit_hits = self.unit_misses = 0
+
+    def stats(self):
+        """Return the counters as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "unit_hits": self.unit_hits,
+            "unit_misses": self.unit_misses,
+            "templates": len(self._templates),
+        }
+
+
+# Package-wide template cache used by render_family_member
+family_cache = FamilyCache()
+
+
+def _is_variable(element):
+    return isinstance(element, dict) and bool(element.get(VARIABLE_KEY))
+
+
+def _split_trailing(elements):
+    """(static, variable) when the variable elements of `elements` are its suffix, else None."""
+    count = 0
+    while count < len(elements) and _is_variable(elements[len(elements) - 1 - count]):
+        count += 1
+    static = elements[: len(elements) - count]
+    if any(_is_variable(element) for element in static):
+        return None
+    return static, elements[len(static) :]
+
+
+def split_family_member(graph_dict):
+    """Split the lines, curves and foreignObjects of `graph_dict` into static and variable parts.
+
+    Returns:
+        dict: ``{"lines": (static, variable), "curves": ..., "foreign_objects": ...}``,
+        or None when the graph cannot be rendered as static + variable parts.
+    """
+    lines = graph_dict.get("lines", [])
+    curves = [line for line in lines if isinstance(line, dict) and line.get("type") in CURVE_TYPES]
+    others = [
+        line for line in lines if not (isinstance(line, dict) and line.get("type") in CURVE_TYPES)
+    ]
+    parts = {
+        "lines": _split_trailing(others),
+        "curves": _split_trailing(curves),
+        "foreign_objects": _split_trailing(graph_dict.get("foreign_objects", [])),
+    }
+    if any(part is None for part in parts.values()):
+        return None
+    static_lines, variable_lines = parts["lines"]
+    if any(element_type(line) == "axis" for line in variable_lines):
+        return None
+    if static_lines and variable_lines:
+        if element_type(static_lines[-1]) == element_type(variable_lines[0]):
+            return None
+    return parts
+
+
+def _pinned(graph_dict, domain, lines, foreign_objects):
+    """A copy of `graph_dict` with the given elements and an explicit domain."""
+    x_min, x_max, y_min, y_max = domain
+    graph = {key: value for key, value in graph_dict.items() if key != FAMILY_KEY}
+    graph["domain"] = {"x_min": x_min, "x_max": x_max, "y_min": y_min, "y_max": y_max}
+    graph["lines"] = lines
+    graph["foreign_objects"] = foreign_objects
+    return graph
+
+
+def _render_captured(graph_dict, backend):
+    """Render `graph_dict` with `backend`; return (svg, drawing, markups, domain)."""
+    with capture_drawings() as captured:
+        svg = _graph_from_dict(graph_dict, backend)
+    drawing, markups, domain = captured[-1]
+    return svg, drawing, list(markups or []), domain
+
+
+def _plot_group(drawing):
+    return [element for element in drawing.elements if element.elementname == "g"][-1]
+
+
+def _template_key(graph_dict, parts, has_curves, backend):
+    """Key of the layout of a family member; None if it cannot be fingerprinted."""
+    static = {
+        key: value for key, value in graph_dict.items() if key not in ("lines", "foreign_objects")
+    }
+    static["lines"] = parts["lines"][0] + parts["curves"][0]
+    static["foreign_objects"] = parts["foreign_objects"][0]
+    domain = graph_dict.get("domain", {})
+    bounds = None
+    if any(domain.get(name) is None for name in ("x_min", "x_max", "y_min", "y_max")):
+        # The inferred bounds depend on the curves, or on every element without curves
+        if has_curves:
+            bounds = parts["curves"][1]
+        else:
+            bounds = (parts["lines"][1], parts["foreign_objects"][1])
+    try:
+        return fingerprint((static, bounds, has_curves, backend, get_default_precision()))
+    except TypeError:
+        return None
+
+
+def _build_template(graph_dict, parts, has_curves, domain, backend):
+    """Render the static part of a family member with slots for its variable units."""
+    static_lines = parts["lines"][0] + [{"type": _SLOT_TYPE}] + parts["curves"][0]
+    if has_curves and not parts["curves"][0]:
+        static_lines.append(_NO_CURVE)
+    graph = _pinned(graph_dict, domain, static_lines, parts["foreign_objects"][0])
+    _, drawing, markups, _ = _render_captured(graph, backend)
+    group = _plot_group(drawing)
+    empty = len(group.elements) == 1  # nothing but the slot
+    _add_slot(group)
+    head, middle, tail = drawing.tostring().split(_SLOT_MARK)
+
+    svg_class = graph_dict.get("svg", {}).get("class", "")
+    if svg_class:
+        head = head.replace("<svg ", f'<svg class="{svg_class}" ', 1)
+    tail = tail[: -len("</svg>")]
+
+    # Layout of the partial renders of the variable units: no grid, no axes
+    settings = {**graph_dict.get("settings", {}), "show_axes": False, "show_grid": False}
+    layout = _pinned({**graph_dict, "settings": settings}, domain, [], [])
+    return FamilyTemplate(head, middle, tail, empty, markups, layout, backend)
+
+
+def _unit_markup(template, has_curves, lines=(), foreign_objects=()):
+    """Markup of one variable unit (lines, a curve or a foreignObject), memoized in `template`."""
+    try:
+        key = fingerprint((list(lines), list(foreign_objects)))
+    except TypeError:
+        key = None
+    # Graphs of a batch may be rendered on several threads
+    with family_cache._lock:
+        markup = template.units.get(key) if key is not None else None
+        if markup is not None:
+            family_cache.unit_hits += 1
+            return markup
+        family_cache.unit_misses += 1
+
+    lines = list(lines)
+    if has_curves and not any(line.get("type") in CURVE_TYPES for line in lines):
+        lines.append(_NO_CURVE)
+    graph = {**template.layout, "lines": lines, "foreign_objects": list(foreign_objects)}
+    _, drawing, markups, _ = _render_captured(graph, template.backend)
+    if foreign_objects:
+        markup = markups
+    else:
+        markup = "".join(element.tostring() for element in _plot_group(drawing).elements)
+    if key is not None:
+        with family_cache._lock:
+            if len(template.units) >= MAX_UNITS_PER_TEMPLATE:
+                template.units.clear()
+            template.units[key] = markup
+    return markup
+
+
+def render_family_member(graph_dict, backend=None):
+    """Render a graph dict carrying a ``family`` key (see the module docstring).
+
+    Args:
+        graph_dict: Graph dictionary with a ``family`` key
+        backend: Rendering backend; defaults to the package-wide setting
+
+    Returns:
+        str: The SVG, identical to the plain render of the dict.
+    """
+    backend = backend or get_default_backend()
+    plain = {key: value for key, value in graph_dict.items() if key != FAMILY_KEY}
+    parts = split_family_member(graph_dict) if family_cache.enabled else None
+    if parts is None or not any(part[1] for part in parts.values()):
+        return _graph_from_dict(plain, backend)
+
+    has_curves = bool(parts["curves"][0] or parts["curves"][1])
+    key = _template_key(plain, parts, has_curves, backend)
+    template = family_cache.get(key) if key is not None else None
+    if template is None:
+        # First member of this layout: its plain render resolves the domain
+        svg, _, _, domain = _render_captured(plain, backend)
+        if key is not None:
+            family_cache.put(key, _build_template(plain, parts, has_curves, domain, backend))
+        return svg
+
+    line_markup = "".join(
+        _unit_markup(template, has_curves, lines=run) for _, run in element_runs(parts["lines"][1])
+    )
+    curve_markup = "".join(
+        _unit_markup(template, has_curves, lines=[curve]) for curve in parts["curves"][1]
+    )
+    if template.empty and not line_markup and not curve_markup:
+        # The plot group would be written as an empty element
+        return _graph_from_dict(plain, backend)
+    markups = list(template.foreign_objects)
+    for foreign_object in parts["foreign_objects"][1]:
+        markups.extend(_unit_markup(template, has_curves, foreign_objects=[foreign_object]))
+    foreign_markup = "\n".join(markups)
+    return (
+        template.head
+        + line_markup
+        + template.middle
+        + curve_markup
+        + template.tail
+        + foreign_markup
+        + "</svg>"
+    )
@@ -2,13 +2,52 @@
 
 This adapter provides functions to load and execute graph modules without
 relying on complex package structures or __init__.py files.
+
+Graph modules are imported once and kept: `get_graph_module` reloads a module
+only when its source file changes, and `get_graph_dict` memoizes the result
+of `get_graph_dict(**params)` per module and normalized parameters. Modules
+that read the injected globals in their module-level code (such as
+``spe_sujet1_auto_08_question_canonical``) are executed again, with the
+globals set, for each new set of values. Globals injected for one call are
+restored before the next, so a call never sees the values of an earlier one.
 """
 
+import ast
+import copy
+import hashlib
+import importlib
 import json
 import sys
 import traceback
 import types
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    # Injected into the worker's builtins by Nagini: sends a result back to JS
+    def missive(data: Any) -> None: ...
+
+
+GRAPHS_PACKAGE = "pca_graph_viz.tests.graphs"
+
+# get_graph_dict keyword -> module global that parameterized graph modules
+# expect to be injected (same mapping as PCAGraphLoader.js)
+PARAMETER_GLOBALS = {
+    "y_horizontal": "Y_LABEL_FOR_HORIZONTAL_LINE",
+    "a_affine": "A_FLOAT_FOR_AFFINE_LINE",
+    "b_affine": "B_FLOAT_FOR_AFFINE_LINE",
+    "a_shift": "A_SHIFT_MAGNITUDE",
+}
+
+# module name -> (module, source digest, globals it reads, globals read at import)
+_module_cache: Dict[str, Any] = {}
+
+# (module name, normalized params) -> graph dict
+_graph_dict_cache: Dict[Any, Dict[str, Any]] = {}
+
+# module name -> {injected global: its value before the first injection, or _UNSET}
+_injected_globals: Dict[str, Dict[str, Any]] = {}
+
+_UNSET = object()
 
 
 def ensure_package_structure():
@@ -36,11 +75,182 @@ def ensure_package_structure():
     return True
 
 
-def load_graph_module(module_name: str) -> Dict[str, Any]:
+def _source_digest(module) -> Optional[str]:
+    """Digest of a module's source file, or None when it cannot be read."""
+    path = getattr(module, "__file__", None)
+    if not path:
+        return None
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+
+def _parameter_globals_read(module):
+    """(globals read anywhere, globals read by module-level code) among PARAMETER_GLOBALS.
+
+    A global counts as read when the source names it, as a variable or as a
+    string (``globals()["A_SHIFT_MAGNITUDE"]``); function bodies are not
+    module-level code.
+    """
+    names = set(PARAMETER_GLOBALS.values())
+    try:
+        with open(module.__file__, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, TypeError, SyntaxError, UnicodeDecodeError):
+        # Without the source, assume every global may be read at import
+        return frozenset(names), frozenset(names)
+
+    def used(nodes):
+        found = set()
+        for node in nodes:
+            if isinstance(node, ast.Name) and node.id in names:
+                found.add(node.id)
+            elif isinstance(node, ast.Constant) and node.value in names:
+                found.add(node.value)
+        return found
+
+    module_level = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            # Decorators and defaults run at import, the body does not
+            pending.extend(getattr(node, "decorator_list", []))
+            pending.extend(node.args.defaults + [d for d in node.args.kw_defaults if d])
+            continue
+        module_level.append(node)
+        pending.extend(ast.iter_child_nodes(node))
+    return frozenset(used(ast.walk(tree))), frozenset(used(module_level))
+
+
+def get_graph_module(module_name: str):
+    """Import a graph module once, reloading it only when its source has changed."""
+    ensure_package_structure()
+    cached = _module_cache.get(module_name)
+    if cached is not None:
+        module, digest = cached[:2]
+        if _source_digest(module) == digest:
+            return module
+        module = importlib.reload(module)
+    else:
+        module = importlib.import_module(f"{GRAPHS_PACKAGE}.{module_name}")
+
+    # Results computed from the previous version of the module are stale
+    for key in [key for key in _graph_dict_cache if key[0] == module_name]:
+        del _graph_dict_cache[key]
+    _module_cache[module_name] = (
+        module,
+        _source_digest(module),
+        *_parameter_globals_read(module),
+    )
+    return module
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Map parameters to get_graph_dict keywords.
+
+    Accepts keyword names (``a_shift``) as well as the injected global names
+    used by the JS loader (``A_SHIFT_MAGNITUDE``); None values are dropped.
+    """
+    by_global = {name: keyword for keyword, name in PARAMETER_GLOBALS.items()}
+    normalized = {}
+    for name, value in (params or {}).items():
+        if value is not None:
+            normalized[by_global.get(name, name)] = value
+    return normalized
+
+
+def _restore_globals(module, originals: Dict[str, Any]):
+    """Give injected globals of `module` back their `originals` values (deleting _UNSET ones)."""
+    for name, value in originals.items():
+        if value is _UNSET:
+            module.__dict__.pop(name, None)
+        else:
+            setattr(module, name, value)
+
+
+def _load_graph_dict(module_name: str, params: Optional[Dict[str, Any]], memoize: bool = True):
+    """`get_graph_dict(**params)` of a graph module; the memoized dict is shared, not copied.
+
+    Returns:
+        tuple: (graph_dict, shared) where shared tells whether the dict is
+        held by the memo
+    """
+    import inspect
+
+    module = get_graph_module(module_name)
+    if not hasattr(module, "get_graph_dict"):
+        raise RuntimeError(f"get_graph_dict function not found in {module_name}")
+    _, _, read, read_at_import = _module_cache[module_name]
+
+    normalized = normalize_params(params)
+    accepted = inspect.signature(module.get_graph_dict).parameters
+    kwargs = {k: v for k, v in normalized.items() if k in accepted}
+    injected = {PARAMETER_GLOBALS[k]: v for k, v in normalized.items() if k in PARAMETER_GLOBALS}
+    # The dict depends on the arguments and on the injected globals the module reads
+    observed = {name: value for name, value in injected.items() if name in read}
+    key = (module_name, tuple(sorted(kwargs.items())), tuple(sorted(observed.items())))
+    graph_dict = _graph_dict_cache.get(key)
+    if graph_dict is not None:
+        return graph_dict, True
+
+    originals = _injected_globals.setdefault(module_name, {})
+    restored = [name for name in originals if name not in injected]
+    _restore_globals(module, {name: originals.pop(name) for name in restored})
+    for name, value in injected.items():
+        originals.setdefault(name, getattr(module, name, _UNSET))
+        setattr(module, name, value)
+    if any(name in read_at_import for name in [*injected, *restored]):
+        # Module-level code computed the graph from the globals: run it again
+        # with the new values, as the JS loader did by re-importing the module
+        module = importlib.reload(module)
+    graph_dict = module.get_graph_dict(**kwargs)
+    if memoize:
+        _graph_dict_cache[key] = graph_dict
+    return graph_dict, memoize
+
+
+def get_graph_dict(
+    module_name: str, params: Optional[Dict[str, Any]] = None, memoize: bool = True
+) -> Dict[str, Any]:
+    """Return `get_graph_dict(**params)` of a graph module, memoized per parameters.
+
+    Parameters the module's `get_graph_dict` does not accept are not passed
+    to it. Every value given for a PARAMETER_GLOBALS keyword (or global name)
+    is also injected as the module global parameterized modules check for;
+    modules whose module-level code reads these globals are executed again
+    with the new values. The result is a copy of the memoized dict, so
+    callers may modify it. With `memoize` unset, a dict that is not cached
+    yet is built without being kept (for one-off sweeps over many parameter
+    values).
+    """
+    graph_dict, shared = _load_graph_dict(module_name, params, memoize)
+    return copy.deepcopy(graph_dict) if shared else graph_dict
+
+
+def clear_module_cache():
+    """Forget all cached modules and graph dicts.
+
+    Modules that received injected globals are given their original values
+    back and dropped from ``sys.modules``, so the next import starts afresh.
+    """
+    for module_name, originals in _injected_globals.items():
+        module = sys.modules.pop(f"{GRAPHS_PACKAGE}.{module_name}", None)
+        if module is not None:
+            _restore_globals(module, originals)
+    _injected_globals.clear()
+    _module_cache.clear()
+    _graph_dict_cache.clear()
+
+
+def load_graph_module(module_name: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Load a graph module and extract its graph dictionary.
 
     Args:
         module_name: Name of the module (e.g., 'spe_sujet1_auto_07_question_small')
+        params: Optional parameters for parameterized modules (see `get_graph_dict`)
 
     Returns:
         Dict containing either:
@@ -48,20 +258,7 @@ def load_graph_module(module_name: str) -> Dict[str, Any]:
         - {"error": <error_msg>, "traceback": <traceback>} on failure
     """
     try:
-        # Ensure package structure exists
-        ensure_package_structure()
-
-        # Import the module
-        from importlib import import_module
-
-        module = import_module(f"pca_graph_viz.tests.graphs.{module_name}")
-
-        # Check if get_graph_dict exists
-        if not hasattr(module, "get_graph_dict"):
-            raise RuntimeError(f"get_graph_dict function not found in {module_name}")
-
-        # Get the graph dictionary
-        graph_dict = module.get_graph_dict()
+        graph_dict = get_graph_dict(module_name, params)
         title = graph_dict.get("title", module_name)
 
         print(f"✅ Loaded graph: {title}")
@@ -123,9 +320,20 @@ def load_graph_from_source(source_code: str, module_name: str) -> Dict[str, Any]
         return {"error": error_msg, "traceback": tb}
 
 
+def _with_default_margin(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Ensure reasonable defaults (without mutating the caller's dict)."""
+    settings = graph_dict.get("settings", {})
+    if "margin" not in settings:
+        graph_dict = {**graph_dict, "settings": {**settings, "margin": 16}}
+    return graph_dict
+
+
 def render_graph(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
     """Render a graph dictionary to SVG.
 
+    Repeated renders of the same dict are served from the package-wide
+    render cache (see core/render_cache.py).
+
     Args:
         graph_dict: Graph dictionary to render
 
@@ -137,13 +345,7 @@ def render_graph(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
     try:
         from pca_graph_viz import graph_from_dict
 
-        # Ensure reasonable defaults
-        if "settings" not in graph_dict:
-            graph_dict["settings"] = {}
-        if "margin" not in graph_dict["settings"]:
-            graph_dict["settings"]["margin"] = 16
-
-        svg_output = graph_from_dict(graph_dict)
+        svg_output = graph_from_dict(_with_default_margin(graph_dict))
 
         return {"svg": svg_output}
 
@@ -156,11 +358,75 @@ def render_graph(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
         return {"error": error_msg, "traceback": tb}
 
 
+def render_graphs(graph_dicts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Render several graph dictionaries at once (see core/batch_render.py).
+
+    Returns:
+        List with one dict per graph, in input order, each shaped like the
+        result of `render_graph`.
+    """
+    from pca_graph_viz.core.batch_render import render_many
+
+    results = render_many(_with_default_margin(graph_dict) for graph_dict in graph_dicts)
+    for result in results:
+        if "error" in result:
+            print(f"❌ Render error: {result['error']}")
+    return results
+
+
+def element_counts(graph_dict: Dict[str, Any]) -> Dict[str, int]:
+    """Count the elements of a graph dict by line type, plus its foreign objects."""
+    counts: Dict[str, int] = {}
+    for line in graph_dict.get("lines", []):
+        line_type = line.get("type", "line") if isinstance(line, dict) else "line"
+        counts[line_type] = counts.get(line_type, 0) + 1
+    counts["foreign_objects"] = len(graph_dict.get("foreign_objects", []))
+    return counts
+
+
+def load_and_render(
+    module_name: str, params: Optional[Dict[str, Any]] = None, include_dict: bool = False
+) -> Dict[str, Any]:
+    """Load a graph module and render it in one call, without a JSON round trip.
+
+    Args:
+        module_name: Name of the graph module
+        params: Optional parameters for parameterized modules (see `get_graph_dict`)
+        include_dict: Also return the graph dictionary (it is the largest part
+            of the result, so leave it out when the page only needs the SVG)
+
+    Returns:
+        Dict containing either:
+        - {"svg": <svg>, "title": <title>, "counts": <element counts>} on success,
+          plus "graph": <graph_dict> when `include_dict` is set
+        - {"error": <error_msg>, "traceback": <traceback>} on failure
+    """
+    try:
+        # Rendering does not modify the dict: the memoized one is used as is
+        graph_dict, shared = _load_graph_dict(module_name, params)
+    except Exception as e:
+        error_msg = str(e)
+        tb = traceback.format_exc()
+        print(f"❌ Error loading {module_name}: {error_msg}")
+        print(tb)
+
+        return {"error": error_msg, "traceback": tb}
+
+    result = render_graph(graph_dict)
+    if "error" in result:
+        return result
+    result["title"] = graph_dict.get("title", module_name)
+    result["counts"] = element_counts(graph_dict)
+    if include_dict:
+        result["graph"] = copy.deepcopy(graph_dict) if shared else graph_dict
+    return result
+
+
 # For use with missive in Nagini
-def load_and_send_graph(module_name: str):
+def load_and_send_graph(module_name: str, params: Optional[Dict[str, Any]] = None):
     """Load a graph module and send it via missive (for Nagini)."""
-    result = load_graph_module(module_name)
-    missive(result)  # type: ignore[name-defined]  # missive is injected by Nagini
+    result = load_graph_module(module_name, params)
+    missive(result)
 
 
 def render_and_send_graph(graph_dict_json: str):
@@ -168,6 +434,23 @@ def render_and_send_graph(graph_dict_json: str):
     try:
         graph_dict = json.loads(graph_dict_json)
         result = render_graph(graph_dict)
-        missive(result)  # type: ignore[name-defined]  # missive is injected by Nagini
+        missive(result)
     except json.JSONDecodeError as e:
-        missive({"error": f"JSON decode error: {e}", "traceback": traceback.format_exc()})  # type: ignore[name-defined]
+        missive({"error": f"JSON decode error: {e}", "traceback": traceback.format_exc()})
+
+
+def render_graphs_and_send(graph_dicts_json: str):
+    """Render a JSON list of graphs and send the list of results via missive (for Nagini)."""
+    try:
+        graph_dicts = json.loads(graph_dicts_json)
+        missive(render_graphs(graph_dicts))
+    except json.JSONDecodeError as e:
+        missive({"error": f"JSON decode error: {e}", "traceback": traceback.format_exc()})
+
+
+def load_render_and_send(
+    module_name: str, params: Optional[Dict[str, Any]] = None, include_dict: bool = False
+):
+    """Load and render a graph module and send the result via missive (for Nagini)."""
+    result = load_and_render(module_name, params, include_dict)
+    missive(result)
@@ -0,0 +1,63 @@
+"""Coordinate quantization and compact number formatting for SVG output.
+
+Pixel coordinates are quantized to ``precision`` decimal places before they
+are written, and written in their shortest form: trailing zeros and a bare
+``.0`` are dropped and ``-0`` becomes ``0``. Scalars are returned as ``int``
+when integral so that ``str()`` (used by both rendering backends) already
+yields the compact form.
+
+``precision=None`` disables quantization and keeps the full float repr.
+The package default can be changed with ``set_default_precision``; graph
+dicts override it with ``settings["precision"]``.
+"""
+
+import re
+
+import numpy as np
+
+# Sentinel meaning "use the package-wide default precision"
+DEFAULT = "default"
+
+# 0.01 px is far below anything a browser can display
+_default_precision = 2
+
+# Matches a trailing ".0" on a number written by repr() of a rounded float
+_TRAILING_ZERO = re.compile(r"\.0(?![0-9])")
+
+
+def set_default_precision(precision):
+    """Set the package-wide number of decimals for emitted coordinates (None = full)."""
+    global _default_precision
+    if precision is not None and (not isinstance(precision, int) or precision < 0):
+        raise ValueError(f"precision must be a non-negative int or None, got {precision!r}")
+    _default_precision = precision
+
+
+def get_default_precision():
+    """Return the package-wide coordinate precision."""
+    return _default_precision
+
+
+def resolve_precision(precision):
+    """Resolve the `DEFAULT` sentinel to the package-wide precision."""
+    return _default_precision if precision == DEFAULT else precision
+
+
+def quantize(value, precision):
+    """Round a coordinate (scalar or array) to `precision` decimals.
+
+    Scalars come back as ``int`` when integral and ``float`` otherwise; arrays
+    come back as float arrays without negative zeros. With `precision=None`
+    the value is returned unchanged.
+    """
+    if precision is None:
+        return value
+    if isinstance(value, np.ndarray):
+        return np.round(value, precision) + 0.0
+    q = round(float(value), precision) + 0.0
+    return int(q) if q.is_integer() else q
+
+
+def compact(text):
+    """Strip the ``.0`` suffix repr() leaves on integral rounded floats in `text`."""
+    return _TRAILING_ZERO.sub("", text)
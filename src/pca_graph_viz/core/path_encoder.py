@@ -0,0 +1,197 @@
+"""Vectorized SVG path-data encoding for sampled curves.
+
+Curves are transformed from data space to pixel space as whole NumPy arrays
+(the ``transform_x``/``transform_y`` closures of the renderers are plain
+affine expressions, so they broadcast over arrays), then interleaved and
+formatted with a single ``str.format`` call instead of growing the ``d``
+string point by point.
+
+The output format is unchanged: ``"M x0,y0 L x1,y1 ... "`` with shortest
+float repr and a trailing space. With a ``precision`` the coordinates are
+quantized and written compactly (see number_format.py).
+
+Curves are split into several ``M`` subpaths where samples are non-finite
+(1/x, tan, log of negatives, JSON ``null``), optionally where neighbouring
+samples jump by more than a pixel threshold, and where clipping cuts them.
+"""
+
+import numpy as np
+
+from .clipping import clip_polyline
+from .number_format import compact, quantize
+from .simplify import simplify_polyline, simplify_subpaths
+
+
+def interleave(px, py):
+    """Return a flat float array ``[x0, y0, x1, y1, ...]`` from two coordinate arrays."""
+    n = min(len(px), len(py))
+    coords = np.empty(2 * n, dtype=float)
+    coords[0::2] = px[:n]
+    coords[1::2] = py[:n]
+    return coords
+
+
+def encode_polyline(px, py, precision=None, starts=None):
+    """Encode pixel-space coordinates as ``M``/``L`` path data.
+
+    Args:
+        px, py: Pixel coordinates (array-like); extra points in the longer
+            array are ignored, as with ``zip``.
+        precision: Decimal places to keep, or None for the full float repr
+        starts: Optional boolean mask, True where a new subpath (``M``)
+            begins; the first point always starts one.
+
+    Returns:
+        str: Path data, or ``""`` when fewer than two points are given.
+    """
+    coords = interleave(np.asarray(px, dtype=float), np.asarray(py, dtype=float))
+    n = len(coords) // 2
+    if n < 2:
+        return ""
+    if starts is None or not np.any(np.asarray(starts[1:n], dtype=bool)):
+        template = "M {},{} " + "L {},{} " * (n - 1)
+    else:
+        commands = np.where(np.asarray(starts[:n], dtype=bool), "M {},{} ", "L {},{} ")
+        commands[0] = "M {},{} "
+        template = "".join(commands.tolist())
+    if precision is None:
+        return template.format(*coords.tolist())
+    coords = quantize(coords, precision)
+    return compact(template.format(*coords.tolist()))
+
+
+def encode_segments(x1, y1, x2, y2, precision=None):
+    """Encode independent pixel-space segments as ``M x1,y1 L x2,y2`` pairs of one path.
+
+    Returns:
+        str: Path data, or ``""`` when there are no segments.
+    """
+    columns = [np.asarray(values, dtype=float) for values in (x1, y1, x2, y2)]
+    n = min(len(values) for values in columns)
+    if n == 0:
+        return ""
+    coords = np.empty((n, 4), dtype=float)
+    for index, values in enumerate(columns):
+        coords[:, index] = values[:n]
+    template = "M {},{} L {},{} " * n
+    if precision is None:
+        return template.format(*coords.ravel().tolist())
+    coords = quantize(coords.ravel(), precision)
+    return compact(template.format(*coords.tolist()))
+
+
+def resolve_jump(discontinuity, plot_height):
+    """Map a `settings["discontinuity"]` value to a pixel jump threshold or None.
+
+    True uses the plot height: a jump across the whole plot between two
+    neighbouring samples is treated as an asymptote, not a steep slope.
+    """
+    if discontinuity is None or discontinuity is False:
+        return None
+    if discontinuity is True:
+        return float(plot_height)
+    return float(discontinuity)
+
+
+def break_polyline(px, py, jump=None):
+    """Split a pixel-space polyline at non-finite samples and vertical jumps.
+
+    Args:
+        px, py: Pixel coordinates
+        jump: Optional threshold in pixels; a segment whose vertical extent
+            exceeds it is dropped
+
+    Returns:
+        tuple: (px, py, starts) keeping only points that belong to at least one
+        drawable segment, or starts=None when the polyline needs no break.
+    """
+    n = min(len(px), len(py))
+    px, py = px[:n], py[:n]
+    finite = np.isfinite(px) & np.isfinite(py)
+    link = finite[:-1] & finite[1:]
+    if jump is not None:
+        with np.errstate(invalid="ignore"):
+            link &= np.abs(np.diff(py)) <= jump
+    if link.all():
+        return px, py, None
+
+    keep = np.zeros(n, dtype=bool)
+    keep[:-1] |= link
+    keep[1:] |= link
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = ~link
+    return px[keep], py[keep], starts[keep]
+
+
+def transform_points(x_data, y_data, transform_x, transform_y):
+    """Map data-space arrays to pixel space in one vectorized step."""
+    px = transform_x(np.asarray(x_data, dtype=float))
+    py = transform_y(np.asarray(y_data, dtype=float))
+    return np.asarray(px, dtype=float), np.asarray(py, dtype=float)
+
+
+def encode_curve(
+    x_data,
+    y_data,
+    transform_x,
+    transform_y,
+    tolerance=None,
+    stats=None,
+    precision=None,
+    clip_rect=None,
+    jump=None,
+):
+    """Transform a data-space curve and encode it as path data.
+
+    Args:
+        x_data, y_data: Data-space samples
+        transform_x, transform_y: Data -> pixel transforms (must accept arrays)
+        tolerance: Optional pixel tolerance; when set the curve is simplified
+            in pixel space before encoding (see simplify.py)
+        stats: Optional dict; `points_removed` is incremented by the number
+            of samples dropped by simplification
+        precision: Decimal places to keep, or None for the full float repr
+        clip_rect: Optional pixel rectangle (x_min, y_min, x_max, y_max); the
+            curve is clipped to it and split into subpaths where it leaves
+            and re-enters (see clipping.py)
+        jump: Optional pixel threshold above which a vertical step between
+            neighbouring samples is treated as a discontinuity
+
+    Returns:
+        str: Path data, or ``""`` when the curve has fewer than two points.
+    """
+    px, py = transform_points(x_data, y_data, transform_x, transform_y)
+    px, py, starts = break_polyline(px, py, jump)
+    if clip_rect is not None:
+        px, py, starts = clip_polyline(px, py, clip_rect, starts)
+    if tolerance is not None:
+        if starts is None:
+            px, py, removed = simplify_polyline(px, py, tolerance)
+        else:
+            px, py, starts, removed = simplify_subpaths(px, py, starts, tolerance)
+        if stats is not None:
+            stats["points_removed"] = stats.get("points_removed", 0) + removed
+    return encode_polyline(px, py, precision, starts)
+
+
+def encode_grid_lines(positions, extent, vertical, precision=None):
+    """Encode parallel full-length grid lines as the data of a single path.
+
+    Args:
+        positions: Pixel positions of the lines (x for vertical lines, y otherwise)
+        extent: Pixel length of every line (plot height or width)
+        vertical: True for vertical lines (``M x,0 V h``), False for horizontal
+            ones (``M 0,y H w``)
+        precision: Decimal places to keep, or None for the full float repr
+
+    Returns:
+        str: Path data, or ``""`` when there are no lines.
+    """
+    positions = np.asarray(positions, dtype=float)
+    if len(positions) == 0:
+        return ""
+    template = ("M {},0 V %s " if vertical else "M 0,{} H %s ") % extent
+    if precision is None:
+        return (template * len(positions)).format(*positions.tolist())
+    positions = quantize(positions, precision)
+    return compact((template * len(positions)).format(*positions.tolist()))
@@ -0,0 +1,194 @@
+"""Exact Bézier emission for polynomial curves of degree up to 3.
+
+A ``type: "polynomial"`` line describes a curve by its coefficients instead
+of samples::
+
+    {"type": "polynomial", "coefficients": [-2, 0, 0.5], "interval": [-3, 3],
+     "class": "stroke-primary"}
+
+Coefficients are given in increasing powers (c0 + c1 x + c2 x² + c3 x³, as in
+``numpy.polynomial``); the interval defaults to the x range of the graph
+domain. On any interval a polynomial of degree n ≤ 3 is exactly a Bézier
+curve of order n, and the data -> pixel transform is affine, so transforming
+its control points gives the exact pixel-space curve: a parabola that used to
+be 1000 ``L`` commands becomes one ``Q`` command.
+
+The interval is first cut to the visible x range and split where the curve
+crosses the top and bottom of the visible canvas (see clipping.py); pieces
+outside are dropped. Higher degrees are sampled (see sampling.py).
+"""
+
+import numpy as np
+from numpy.polynomial import polynomial as P
+
+from .number_format import compact
+from .sampling import pixel_size_for, sample_function
+
+POLYNOMIAL_TYPE = "polynomial"
+
+# Highest degree drawn as an exact Bézier curve
+MAX_EXACT_DEGREE = 3
+
+# Path command of the Bézier curve of each order (number of control points)
+_COMMANDS = {2: "L", 3: "Q", 4: "C"}
+
+
+def polynomial_coefficients(coefficients):
+    """Return the coefficients as a float array without zero highest-power terms."""
+    coefficients = np.atleast_1d(np.asarray(coefficients, dtype=float))
+    nonzero = np.flatnonzero(coefficients)
+    return coefficients[: nonzero[-1] + 1] if len(nonzero) else coefficients[:1]
+
+
+def polynomial_key_points(coefficients, interval):
+    """Sample the interval ends and the interior critical points of a polynomial.
+
+    These points span the extent of the curve, which is all the renderer
+    needs to infer missing domain bounds.
+
+    Returns:
+        tuple: (x, y) float arrays sorted by x
+    """
+    coefficients = polynomial_coefficients(coefficients)
+    start, end = sorted(interval)
+    x = [start, end]
+    if len(coefficients) > 2:
+        roots = P.polyroots(P.polyder(coefficients))
+        real = roots[np.abs(roots.imag) < 1e-12].real
+        x.extend(real[(real > start) & (real < end)].tolist())
+    x = np.array(sorted(x))
+    return x, P.polyval(x, coefficients)
+
+
+def visible_pieces(coefficients, interval, view=None):
+    """Split `interval` where the curve enters and leaves `view`.
+
+    Args:
+        coefficients: Polynomial coefficients in increasing powers
+        interval: (start, end) in data units
+        view: Optional data-space rectangle (x_min, x_max, y_min, y_max)
+
+    Returns:
+        tuple: (starts, ends) arrays of the sub-intervals where the curve lies in `view`
+    """
+    start, end = sorted(interval)
+    if view is None:
+        return np.array([start]), np.array([end])
+    x_min, x_max, y_min, y_max = view
+    start, end = max(start, x_min), min(end, x_max)
+    if not start < end:
+        return np.array([]), np.array([])
+
+    cuts = [start, end]
+    if len(coefficients) > 1:
+        for bound in (y_min, y_max):
+            shifted = coefficients.copy()
+            shifted[0] -= bound
+            roots = P.polyroots(shifted)
+            real = roots[np.abs(roots.imag) < 1e-12].real
+            cuts.extend(real[(real > start) & (real < end)].tolist())
+    cuts = np.unique(cuts)
+    middle = P.polyval((cuts[:-1] + cuts[1:]) / 2, coefficients)
+    inside = (middle >= y_min) & (middle <= y_max)
+    return cuts[:-1][inside], cuts[1:][inside]
+
+
+def bezier_controls(coefficients, starts, ends):
+    """Data-space Bézier control points of a polynomial of degree ≤ 3 on each piece.
+
+    Returns:
+        tuple: (x, y) arrays of shape (pieces, degree + 1), at least a line
+    """
+    starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+    degree = max(len(coefficients) - 1, 1)
+    derivative = P.polyder(coefficients)
+    step = (ends - starts) / degree
+    y_start, y_end = P.polyval(starts, coefficients), P.polyval(ends, coefficients)
+    if degree == 1:
+        return np.stack([starts, ends], axis=1), np.stack([y_start, y_end], axis=1)
+    slope_start = P.polyval(starts, derivative)
+    if degree == 2:
+        x = np.stack([starts, starts + step, ends], axis=1)
+        y = np.stack([y_start, y_start + step * slope_start, y_end], axis=1)
+        return x, y
+    slope_end = P.polyval(ends, derivative)
+    x = np.stack([starts, starts + step, ends - step, ends], axis=1)
+    y = np.stack([y_start, y_start + step * slope_start, y_end - step * slope_end, y_end], axis=1)
+    return x, y
+
+
+def encode_polynomial(coefficients, interval, transform_x, transform_y, view=None, precision=None):
+    """Encode a polynomial of degree ≤ 3 as exact ``Q``/``C`` path data.
+
+    Args:
+        coefficients: Coefficients in increasing powers
+        interval: (start, end) in data units
+        transform_x, transform_y: Affine data -> pixel transforms (must accept arrays)
+        view: Optional data-space rectangle (x_min, x_max, y_min, y_max) the
+            curve is cut to
+        precision: Decimal places to keep, or None for the full float repr
+
+    Returns:
+        str: Path data, or ``""`` when no part of the curve is visible.
+    """
+    coefficients = polynomial_coefficients(coefficients)
+    if len(coefficients) - 1 > MAX_EXACT_DEGREE:
+        raise ValueError(
+            f"Only polynomials up to degree {MAX_EXACT_DEGREE} are drawn exactly, "
+            f"got degree {len(coefficients) - 1}"
+        )
+    if not np.isfinite(coefficients).all() or not np.isfinite(interval).all():
+        return ""
+    starts, ends = visible_pieces(coefficients, interval, view)
+    if len(starts) == 0:
+        return ""
+
+    x, y = bezier_controls(coefficients, starts, ends)
+    px = np.asarray(transform_x(x), dtype=float)
+    py = np.asarray(transform_y(y), dtype=float)
+    points = np.stack([px, py], axis=2).reshape(len(starts), -1).tolist()
+    segment = _COMMANDS[x.shape[1]] + " {},{}" * (x.shape[1] - 1) + " "
+
+    # A piece continues the previous subpath when it starts where that one ended
+    templates = []
+    values = []
+    for index, piece in enumerate(points):
+        if index == 0 or starts[index] != ends[index - 1]:
+            templates.append("M {},{} ")
+            values.extend(piece[:2])
+        templates.append(segment)
+        values.extend(piece[2:])
+    path_data = "".join(templates).format(*values)
+    return path_data if precision is None else compact(path_data)
+
+
+def polynomial_curve_data(line, domain, size):
+    """Resolve a ``polynomial`` line into curve samples and an exact spec.
+
+    Args:
+        line: The ``{"type": "polynomial", ...}`` dict
+        domain: Graph domain dict (provides the default interval)
+        size: Rendered width in pixels, used to sample higher degrees
+
+    Returns:
+        tuple: (x, y, spec) where spec is (coefficients, interval) for degrees
+        up to 3 and x, y are its key points, or None with x, y sampled
+        densely enough for the output resolution.
+    """
+    interval = line.get("interval")
+    if interval is None:
+        if domain.get("x_min") is None or domain.get("x_max") is None:
+            raise ValueError("A polynomial needs an 'interval' or a domain with x_min and x_max")
+        interval = (domain["x_min"], domain["x_max"])
+    interval = tuple(float(bound) for bound in interval)
+    coefficients = polynomial_coefficients(line.get("coefficients", [0]))
+    if len(coefficients) - 1 <= MAX_EXACT_DEGREE:
+        x, y = polynomial_key_points(coefficients, interval)
+        return x, y, (coefficients, interval)
+    x, y = sample_function(
+        lambda values: P.polyval(values, coefficients),
+        min(interval),
+        max(interval),
+        pixel_size=pixel_size_for(domain, size),
+    )
+    return x, y, None
@@ -0,0 +1,135 @@
+"""Bounded LRU cache of rendered SVG strings.
+
+The gallery and the JS loader render the same graph dicts over and over.
+``graph_from_dict`` looks its input up here first, keyed by ``fingerprint``:
+a BLAKE2 digest of the canonical structure of the dict. Dict keys are hashed
+in sorted order, and lists of ints or of floats and NumPy arrays are hashed
+through their raw bytes (dtype + shape + buffer) rather than serialized to
+JSON (mixed lists are hashed item by item, with their types), so a
+fingerprint of a dict with 1000-point curves costs a few microseconds.
+
+The cache is bounded by the total size of the stored SVG strings; the least
+recently used entries are evicted first.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+# Total size of cached SVG strings before eviction kicks in
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _update(digest, obj):
+    """Feed the canonical form of `obj` into `digest`."""
+    if isinstance(obj, dict):
+        digest.update(b"d%d:" % len(obj))
+        for key in sorted(obj, key=repr):
+            _update(digest, key)
+            _update(digest, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        # Only lists of one number type: [1, 2.0] and [1.0, 2] make the same
+        # array but may render differently ("1" vs "1.0" without rounding)
+        if obj and type(obj[0]) in (int, float) and len(set(map(type, obj))) == 1:
+            try:
+                array = np.asarray(obj)
+            except (ValueError, TypeError):
+                array = None
+            if array is not None and array.dtype.kind in "iuf":
+                _update(digest, array)
+                return
+        digest.update(b"l%d:" % len(obj))
+        for item in obj:
+            _update(digest, item)
+    elif isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "O":
+            _update(digest, obj.tolist())
+            return
+        digest.update(b"a%s%r:" % (obj.dtype.str.encode(), obj.shape))
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, np.generic):
+        _update(digest, obj.item())
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8", "surrogatepass")
+        digest.update(b"s%d:" % len(data))
+        digest.update(data)
+    elif obj is None or isinstance(obj, (bool, int, float, complex)):
+        digest.update(b"%s:%s;" % (type(obj).__name__.encode(), repr(obj).encode()))
+    else:
+        # Arbitrary objects (Line models, ...) have no reliable content identity
+        raise TypeError(f"cannot fingerprint {type(obj).__name__} objects")
+
+
+def fingerprint(obj):
+    """Return a hex digest identifying the content of a graph dict (or any nested value).
+
+    Raises:
+        TypeError: if `obj` contains values other than dicts, lists, tuples,
+            NumPy arrays, strings, numbers and None.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    _update(digest, obj)
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """LRU mapping from render keys to SVG strings, bounded by total string size."""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return the cached SVG for `key` (marking it recently used) or None."""
+        svg = self._entries.get(key)
+        if svg is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return svg
+
+    def put(self, key, svg):
+        """Store `svg` under `key`, evicting the least recently used entries if needed."""
+        size = len(svg)
+        if key in self._entries:
+            self.current_bytes -= len(self._entries.pop(key))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = svg
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= len(evicted)
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return the counters as a dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# Package-wide cache used by graph_from_dict
+render_cache = RenderCache()
@@ -0,0 +1,154 @@
+"""Memory-mapped transport of curve samples to worker processes.
+
+Sending graph dicts to a process pool pickles every curve: a 1000-point
+``x``/``y`` list is written as 1000 floats, copied through a pipe, rebuilt
+as 1000 Python floats in the worker and only then converted to an array.
+``pack_graph_dicts`` instead writes the samples of every curve into one
+scratch file and replaces them in (shallow copies of) the dicts with
+``ArrayRef`` descriptors of a few bytes. ``unpack_graph_dicts`` runs in the
+worker, maps the file and turns the descriptors back into read-only NumPy
+views of the mapping: the renderer transforms and encodes the samples
+without copying them.
+
+The scratch file lives in ``/dev/shm`` when available, so on Linux it is
+shared memory; unlike ``multiprocessing.shared_memory`` it needs no
+resource tracker, whose per-worker bookkeeping before Python 3.13 reports
+blocks attached by pool workers as leaked.
+
+Samples shared by several curves (the same list or array object) are stored
+once and come back as the same array, so the renderer still converts a
+shared x axis only once. Short curves are left in the dicts, where pickling
+them is cheaper than referencing them.
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+# Curves with fewer samples stay in the pickled dict
+MIN_SHARED_SIZE = 256
+
+_DTYPE = np.dtype(np.float64)
+
+# RAM-backed file system used for scratch files when present
+_SHM_DIR = "/dev/shm"
+
+
+class ArrayRef:
+    """Location of a float64 array in a scratch file (in items)."""
+
+    __slots__ = ("offset", "length")
+
+    def __init__(self, offset, length):
+        self.offset = offset
+        self.length = length
+
+    def __repr__(self):
+        return f"ArrayRef(offset={self.offset}, length={self.length})"
+
+
+def _samples(values, min_size):
+    """`values` as a float64 array when it is a large enough 1-D numeric sequence, else None."""
+    if isinstance(values, np.ndarray):
+        if values.ndim != 1 or values.dtype.kind not in "iuf" or len(values) < min_size:
+            return None
+        return values
+    if not isinstance(values, (list, tuple)) or len(values) < min_size:
+        return None
+    try:
+        array = np.asarray(values)
+    except ValueError:
+        return None
+    # Lists holding None or strings are left to the renderer's own conversion
+    if array.ndim != 1 or array.dtype.kind not in "iuf":
+        return None
+    return array
+
+
+def scratch_dir():
+    """Directory of the scratch files: ``/dev/shm`` when writable, else the temp directory."""
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return tempfile.gettempdir()
+
+
+def pack_graph_dicts(graph_dicts, min_size=MIN_SHARED_SIZE):
+    """Move the large curve samples of `graph_dicts` into one scratch file.
+
+    The input dicts are not modified: curves are replaced in shallow copies
+    of the dicts, their ``lines`` lists and the ``data`` dicts of the curves.
+
+    Returns:
+        tuple: (path, packed_dicts) where path is the scratch file holding
+        the samples (the caller removes it once the workers are done), or
+        (None, graph_dicts) when nothing is shared.
+    """
+    arrays = []
+    refs = {}  # id(samples) -> ArrayRef
+    offset = 0
+    packed = []
+    for graph_dict in graph_dicts:
+        lines = graph_dict.get("lines") if isinstance(graph_dict, dict) else None
+        if not isinstance(lines, list):
+            packed.append(graph_dict)
+            continue
+        new_lines = []
+        for line in lines:
+            data = line.get("data") if isinstance(line, dict) else None
+            if not isinstance(data, dict) or line.get("type") != "curve":
+                new_lines.append(line)
+                continue
+            new_data = dict(data)
+            for axis in ("x", "y"):
+                values = data.get(axis)
+                ref = refs.get(id(values))
+                if ref is None:
+                    array = _samples(values, min_size)
+                    if array is None:
+                        continue
+                    ref = refs[id(values)] = ArrayRef(offset, len(array))
+                    arrays.append((array, values))  # keep `values` alive while ids are in use
+                    offset += len(array)
+                new_data[axis] = ref
+            new_lines.append({**line, "data": new_data})
+        packed.append({**graph_dict, "lines": new_lines})
+
+    if not offset:
+        return None, graph_dicts
+    fd, path = tempfile.mkstemp(prefix="pca_graph_viz-", suffix=".f8", dir=scratch_dir())
+    with os.fdopen(fd, "wb") as f:
+        for array, _ in arrays:
+            f.write(np.ascontiguousarray(array, dtype=_DTYPE).data)
+    return path, packed
+
+
+def unpack_graph_dicts(packed_dicts, path):
+    """Replace the ``ArrayRef`` descriptors of `packed_dicts` with views of the file at `path`.
+
+    Args:
+        packed_dicts: Dicts returned by `pack_graph_dicts` (unpickled in the worker)
+        path: The scratch file returned by `pack_graph_dicts`
+
+    Returns:
+        list: The graph dicts with read-only float64 views in place of the
+        descriptors; descriptors of the same samples give the same view.
+    """
+    samples = np.memmap(path, dtype=_DTYPE, mode="r")
+    views = {}
+    for graph_dict in packed_dicts:
+        if not isinstance(graph_dict, dict):
+            continue
+        for line in graph_dict.get("lines") or ():
+            data = line.get("data") if isinstance(line, dict) else None
+            if not isinstance(data, dict):
+                continue
+            for axis in ("x", "y"):
+                ref = data.get(axis)
+                if isinstance(ref, ArrayRef):
+                    key = (ref.offset, ref.length)
+                    if key not in views:
+                        # Plain ndarray views: memmap subclasses leak into ufunc results
+                        views[key] = samples[ref.offset : ref.offset + ref.length].view(np.ndarray)
+                    data[axis] = views[key]
+    return packed_dicts
@@ -0,0 +1,141 @@
+"""Pixel-tolerance simplification of sampled curves.
+
+Graph modules sample curves at a fixed density (100 or 1000 points) whatever
+the output size. Once a curve is in pixel space most of those samples are
+redundant: several land on the same pixel, and on straight stretches the
+intermediate points deviate from the chord by a tiny fraction of a pixel.
+
+``simplify_polyline`` removes both kinds of points:
+
+1. consecutive points that round to the same pixel are collapsed, then
+2. Douglas–Peucker keeps only the points that deviate more than
+   ``tolerance`` pixels from the simplified polyline.
+
+The first and last points are always kept.
+"""
+
+import numpy as np
+
+# Default tolerance (in pixels) used when simplification is enabled with `True`
+DEFAULT_TOLERANCE = 0.25
+
+
+def resolve_tolerance(simplify):
+    """Map a `settings["simplify"]` value to a pixel tolerance or None (disabled)."""
+    if simplify is None or simplify is False:
+        return None
+    if simplify is True:
+        return DEFAULT_TOLERANCE
+    return float(simplify)
+
+
+def same_pixel_mask(px, py):
+    """Boolean mask keeping the first point of each run landing on the same pixel."""
+    n = len(px)
+    keep = np.ones(n, dtype=bool)
+    if n > 2:
+        cell_x = np.round(px)
+        cell_y = np.round(py)
+        keep[1:] = (cell_x[1:] != cell_x[:-1]) | (cell_y[1:] != cell_y[:-1])
+        keep[-1] = True
+    return keep
+
+
+def douglas_peucker_mask(px, py, tolerance):
+    """Boolean mask of the points kept by Douglas–Peucker at `tolerance` pixels.
+
+    Distances are measured to the chord *segment* (not the infinite line), so
+    curves that double back along their chord are preserved.
+    """
+    n = len(px)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        x0, y0 = px[start], py[start]
+        dx, dy = px[end] - x0, py[end] - y0
+        rel_x = px[start + 1 : end] - x0
+        rel_y = py[start + 1 : end] - y0
+
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
+            dist = np.hypot(rel_x, rel_y)
+        else:
+            t = np.clip((rel_x * dx + rel_y * dy) / length_sq, 0.0, 1.0)
+            dist = np.hypot(rel_x - t * dx, rel_y - t * dy)
+
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def simplify_polyline(px, py, tolerance=DEFAULT_TOLERANCE):
+    """Simplify a pixel-space polyline.
+
+    Args:
+        px, py: Pixel coordinates (NumPy arrays of equal length)
+        tolerance: Maximum allowed deviation in pixels
+
+    Returns:
+        tuple: (px, py, removed) with the kept coordinates and the number of
+        points dropped. Polylines containing non-finite values are returned
+        unchanged.
+    """
+    n = min(len(px), len(py))
+    px = np.asarray(px, dtype=float)[:n]
+    py = np.asarray(py, dtype=float)[:n]
+    if n < 3 or not (np.isfinite(px).all() and np.isfinite(py).all()):
+        return px, py, 0
+
+    keep = same_pixel_mask(px, py)
+    px, py = px[keep], py[keep]
+    keep = douglas_peucker_mask(px, py, tolerance)
+    px, py = px[keep], py[keep]
+    return px, py, n - len(px)
+
+
+def simplify_subpaths(px, py, starts, tolerance=DEFAULT_TOLERANCE):
+    """Simplify each subpath of a broken polyline independently.
+
+    Args:
+        px, py: Pixel coordinates
+        starts: Boolean mask, True where a subpath begins
+        tolerance: Maximum allowed deviation in pixels
+
+    Returns:
+        tuple: (px, py, starts, removed)
+    """
+    bounds = np.append(np.flatnonzero(starts), len(px))
+    if len(bounds) <= 2:
+        px, py, removed = simplify_polyline(px, py, tolerance)
+        new_starts = np.zeros(len(px), dtype=bool)
+        new_starts[:1] = True
+        return px, py, new_starts, removed
+
+    parts_x, parts_y, parts_starts = [], [], []
+    removed = 0
+    for begin, end in zip(bounds[:-1], bounds[1:]):
+        sx, sy, dropped = simplify_polyline(px[begin:end], py[begin:end], tolerance)
+        part_starts = np.zeros(len(sx), dtype=bool)
+        part_starts[:1] = True
+        parts_x.append(sx)
+        parts_y.append(sy)
+        parts_starts.append(part_starts)
+        removed += dropped
+    return (
+        np.concatenate(parts_x),
+        np.concatenate(parts_y),
+        np.concatenate(parts_starts),
+        removed,
+    )
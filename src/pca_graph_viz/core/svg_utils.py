@@ -1,13 +1,111 @@
 # Shared SVG creation utilities
+import contextlib
 import re
+import threading
 
 import numpy as np
-import svgwrite
+
+from .batching import batch_lines
+from .clipping import canvas_rect, data_view, resolve_padding
+from .color_utils import get_color_from_class
+from .elements import RenderContext, render_elements, shape_bounds
+from .number_format import DEFAULT, get_default_precision, quantize, resolve_precision
+from .path_encoder import encode_curve, encode_grid_lines, resolve_jump
+from .polynomial import POLYNOMIAL_TYPE, encode_polynomial, polynomial_curve_data
+from .render_cache import fingerprint, render_cache
+from .simplify import resolve_tolerance
+from .svg_writer import StringDrawing
+from .ticks import DEFAULT_MAX_TICKS, tick_values
 
 # Note: ForeignObject, Line and related functions are loaded in global namespace by Pyodide
 
 
+def __getattr__(name):
+    # Kept importable from here; color_utils builds the mapping on first use
+    if name == "DAISYUI_COLOR_FALLBACKS":
+        from .color_utils import DAISYUI_COLOR_FALLBACKS
+
+        return DAISYUI_COLOR_FALLBACKS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Rendering backends: "svgwrite" builds an svgwrite DOM, "string" writes the markup
+# directly into a buffer (see svg_writer.py). Both produce byte-identical output.
+SVG_BACKENDS = ("svgwrite", "string")
+_default_backend = "svgwrite"
+
+
+def set_default_backend(backend):
+    """Select the rendering backend used when a call does not pass `backend`."""
+    global _default_backend
+    if backend not in SVG_BACKENDS:
+        raise ValueError(f"Unknown SVG backend: {backend}. Available: {list(SVG_BACKENDS)}")
+    _default_backend = backend
+
+
+def get_default_backend():
+    """Return the name of the current default rendering backend."""
+    return _default_backend
+
+
+def new_drawing(size, backend=None):
+    """Create an empty drawing of `size` (width, height) for the given backend."""
+    backend = backend or _default_backend
+    if backend == "string":
+        return StringDrawing(size=size)
+    if backend == "svgwrite":
+        import svgwrite
+
+        return svgwrite.Drawing(size=size)
+    raise ValueError(f"Unknown SVG backend: {backend}. Available: {list(SVG_BACKENDS)}")
+
+
+# Per-thread list receiving (drawing, extra markups, domain) while capture_drawings() is active
+_capture = threading.local()
+
+
+@contextlib.contextmanager
+def capture_drawings():
+    """Record every drawing finalized in this thread inside the block.
+
+    Yields a list that receives, per render, the drawing, its foreignObject
+    markups and the resolved (x_min, x_max, y_min, y_max) domain (used by
+    families.py to cut a graph into static and variable parts).
+    """
+    previous = getattr(_capture, "drawings", None)
+    _capture.drawings = []
+    try:
+        yield _capture.drawings
+    finally:
+        _capture.drawings = previous
+
+
+def finalize_drawing(drawing, extra_markups=None, domain=None):
+    """Serialize `drawing`, appending raw markup (foreignObjects) before `</svg>`."""
+    captured = getattr(_capture, "drawings", None)
+    if captured is not None:
+        captured.append((drawing, extra_markups, domain))
+    extra_markup = "\n".join(extra_markups) if extra_markups else None
+    if isinstance(drawing, StringDrawing):
+        return drawing.tostring(extra_markup)
+
+    svg_string = drawing.tostring()
+    if extra_markup is None:
+        return svg_string
+    injection_point = svg_string.rfind("</svg>")
+    return svg_string[:injection_point] + extra_markup + svg_string[injection_point:]
+
+
 # Simple color resolution
+def finite_range(values, default=(0, 1)):
+    """(min, max) of the finite entries of `values`, or `default` when there are none."""
+    values = np.asarray(values, dtype=float)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return default
+    return np.min(values), np.max(values)
+
+
 def resolve_color(color):
     """Resolve color to appropriate format for SVG"""
     if not color:
@@ -15,43 +113,42 @@ def resolve_color(color):
     return color
 
 
-# DaisyUI class to fallback color mapping
-DAISYUI_COLOR_FALLBACKS = {
-    "stroke-primary": "#3b82f6",  # Blue
-    "stroke-secondary": "#8b5cf6",  # Purple
-    "stroke-accent": "#f59e0b",  # Amber
-    "stroke-base-content": "#1f2937",  # Dark gray
-    "stroke-base-100": "#ffffff",  # White
-    "stroke-base-200": "#e5e7eb",  # Light gray
-    "stroke-base-300": "#d1d5db",  # Gray
-    "fill-primary": "#3b82f6",
-    "fill-secondary": "#8b5cf6",
-    "fill-accent": "#f59e0b",
-    "fill-base-content": "#1f2937",
-    "fill-base-100": "#ffffff",
-    "fill-base-200": "#e5e7eb",
-    "fill-base-300": "#d1d5db",
-    "text-primary": "#3b82f6",
-    "text-secondary": "#8b5cf6",
-    "text-accent": "#f59e0b",
-    "text-base-content": "#1f2937",
-}
-
-
-def get_color_from_class(class_string):
-    """Extract fallback color from DaisyUI class string"""
-    if not class_string:
-        return None
-
-    # Check each class in the string
-    for cls in class_string.split():
-        if cls in DAISYUI_COLOR_FALLBACKS:
-            return DAISYUI_COLOR_FALLBACKS[cls]
-    return None
+# Per-thread (drawing type, id, color, size) -> marker element, while shared_markers() is active
+_shared_markers = threading.local()
+
+
+@contextlib.contextmanager
+def shared_markers():
+    """Reuse the arrow marker elements of every drawing rendered in this thread inside the block.
+
+    A marker is never modified once defined, so drawings of the same backend
+    can hold the same element (see render_many in batch_render.py).
+    """
+    if getattr(_shared_markers, "markers", None) is not None:
+        yield
+        return
+    _shared_markers.markers = {}
+    try:
+        yield
+    finally:
+        _shared_markers.markers = None
 
 
 def define_arrow_marker(drawing, arrow_id, color, arrow_size):
     """Defines an arrowhead marker."""
+    shared = getattr(_shared_markers, "markers", None)
+    if shared is not None:
+        key = (type(drawing), arrow_id, color, arrow_size)
+        marker = shared.get(key)
+        if marker is None:
+            marker = shared[key] = _arrow_marker(drawing, arrow_id, color, arrow_size)
+    else:
+        marker = _arrow_marker(drawing, arrow_id, color, arrow_size)
+    drawing.defs.add(marker)
+
+
+def _arrow_marker(drawing, arrow_id, color, arrow_size):
+    """Build the arrowhead marker element defined by `define_arrow_marker`."""
     marker = drawing.marker(
         id=arrow_id,
         viewBox="0 0 8 8",
@@ -64,7 +161,43 @@ def define_arrow_marker(drawing, arrow_id, color, arrow_size):
     )
     # Less wide, shorter arrow shape (fallback to black if color is falsy)
     marker.add(drawing.path(d="M 0 2 L 6 4 L 0 6 z", fill=color or "black"))
-    drawing.defs.add(marker)
+    return marker
+
+
+def draw_grid_paths(
+    drawing,
+    parent,
+    transform_x,
+    transform_y,
+    x_min,
+    x_max,
+    y_min,
+    y_max,
+    width,
+    height,
+    color,
+    max_lines=DEFAULT_MAX_TICKS,
+    precision=None,
+    grid_width=0.5,
+    grid_opacity=0.3,
+):
+    """Draws the grid as one path per orientation, at "nice" steps (see ticks.py)."""
+    orientations = (
+        (transform_x(tick_values(x_min, x_max, max_lines)), height, True),
+        (transform_y(tick_values(y_min, y_max, max_lines)), width, False),
+    )
+    for positions, extent, vertical in orientations:
+        path_data = encode_grid_lines(positions, extent, vertical, precision)
+        if path_data:
+            parent.add(
+                drawing.path(
+                    d=path_data,
+                    fill="none",
+                    stroke=color,
+                    stroke_width=grid_width,
+                    stroke_opacity=grid_opacity,
+                )
+            )
 
 
 def draw_axes(
@@ -79,14 +212,21 @@ def draw_axes(
     stroke_width=1,
     include_arrows=True,
     arrow_size=8,  # Increased default size
+    parent=None,
+    precision=None,
 ):
     """
     Draws the X and Y axes, with optional arrows.
     The arrows are sized based on the `arrow_size` parameter.
+    Elements are created with `drawing` (which also receives the markers) and
+    added to `parent` when given, e.g. the translated plot group.
     """
+    if parent is None:
+        parent = drawing
+
     # Determine origin point
-    x_origin = width * (-x_min / (x_max - x_min))
-    y_origin = height * (y_max / (y_max - y_min))
+    x_origin = quantize(width * (-x_min / (x_max - x_min)), precision)
+    y_origin = quantize(height * (y_max / (y_max - y_min)), precision)
 
     # Define unique arrow markers for each axis
     arrow_id_x = "arrow-x"
@@ -95,7 +235,7 @@ def draw_axes(
     define_arrow_marker(drawing, arrow_id_y, color, arrow_size)
 
     # Y-axis
-    drawing.add(
+    parent.add(
         drawing.line(
             start=(x_origin, height),
             end=(x_origin, 0),
@@ -106,7 +246,7 @@ def draw_axes(
     )
 
     # X-axis
-    drawing.add(
+    parent.add(
         drawing.line(
             start=(0, y_origin),
             end=(width, y_origin),
@@ -149,29 +289,21 @@ class SVGScene:
         if not self.show_grid:
             return
 
-        # Draw vertical lines
-        for x in np.arange(self.x_min, self.x_max + 1, 1):
-            drawing.add(
-                drawing.line(
-                    start=(self.transform_x(x), 0),
-                    end=(self.transform_x(x), self.height),
-                    stroke=color,
-                    stroke_width=grid_width,
-                    stroke_opacity=grid_opacity,
-                )
-            )
-
-        # Draw horizontal lines
-        for y in np.arange(self.y_min, self.y_max + 1, 1):
-            drawing.add(
-                drawing.line(
-                    start=(0, self.transform_y(y)),
-                    end=(self.width, self.transform_y(y)),
-                    stroke=color,
-                    stroke_width=grid_width,
-                    stroke_opacity=grid_opacity,
-                )
-            )
+        draw_grid_paths(
+            drawing,
+            drawing,
+            self.transform_x,
+            self.transform_y,
+            self.x_min,
+            self.x_max,
+            self.y_min,
+            self.y_max,
+            self.width,
+            self.height,
+            color,
+            grid_width=grid_width,
+            grid_opacity=grid_opacity,
+        )
 
     def draw_axes(
         self, drawing, color="currentColor", stroke_width=1, include_arrows=True, arrow_size=4
@@ -218,11 +350,8 @@ class SVGScene:
             y_data = curve_data["y_data"]
             # No inline color; rely on classes applied elsewhere
 
-            points = [(self.transform_x(x), self.transform_y(y)) for x, y in zip(x_data, y_data)]
-            if len(points) > 1:
-                path_data = f"M {points[0][0]},{points[0][1]} "
-                for point in points[1:]:
-                    path_data += f"L {point[0]},{point[1]} "
+            path_data = encode_curve(x_data, y_data, self.transform_x, self.transform_y)
+            if path_data:
                 drawing.add(drawing.path(d=path_data, stroke_width=2, fill="none"))
 
     def draw_lines(self, drawing):
@@ -330,9 +459,9 @@ class SVGScene:
                 svg_y = self.transform_y(y)
                 drawing.add(drawing.circle(center=(svg_x, svg_y), r=3, fill="red"))
 
-    def to_svg(self):
+    def to_svg(self, backend=None):
         """Converts the SVGScene object to an SVG string."""
-        dwg = svgwrite.Drawing(size=(self.width, self.height))
+        dwg = new_drawing((self.width, self.height), backend)
 
         self.draw_grid(dwg, color=self.grid_color)
         self.draw_axes(dwg, color=self.axes_color)
@@ -359,10 +488,33 @@ def create_svg_scene(
     x_max=None,
     y_min=None,
     y_max=None,
+    backend=None,
+    simplify=None,
+    stats=None,
+    precision=DEFAULT,
+    grid_max_lines=DEFAULT_MAX_TICKS,
+    clip=True,
+    discontinuity=None,
+    batch=True,
     **kwargs,
 ):
-    """Minimal SVG creator with lines, curves, and optional LaTeX injection via foreignObject elements"""
-    dwg = svgwrite.Drawing(size=(size, size))
+    """Minimal SVG creator with lines, curves, and optional LaTeX injection via foreignObject elements
+
+    `simplify` (True or a pixel tolerance) drops curve samples that are invisible at
+    the output resolution; the number removed is added to `stats["points_removed"]`.
+    `precision` sets the decimals kept in emitted coordinates (None = full repr,
+    default = package setting, see number_format.py). The grid is drawn at "nice"
+    steps with at most `grid_max_lines` intervals per axis (see ticks.py).
+    Curves and plain lines are clipped to the visible canvas grown by `clip` pixels
+    (True = default padding, False = no clipping, see clipping.py). Non-finite samples
+    always break a curve; `discontinuity` (True = plot height, or pixels) also breaks it
+    where neighbouring samples jump further than that.
+    With `batch`, adjacent plain lines of identical style are drawn as a single path
+    (see batching.py). Each element of `lines` is drawn by the renderer registered
+    for its type (see elements.py).
+    """
+    precision = resolve_precision(precision)
+    dwg = new_drawing((size, size), backend)
 
     # Scale data to fit
     # Handle margin which can be a number or a dict {top,right,bottom,left}; default 0
@@ -398,9 +550,9 @@ def create_svg_scene(
             for obj in iter_lines:
                 # Line or axis with x1,x2,y1,y2
                 if "x1" in obj and "x2" in obj:
-                    bounds_x.extend([obj["x1"], obj["x2"]])
+                    bounds_x.extend(np.ravel([obj["x1"], obj["x2"]]).tolist())
                 if "y1" in obj and "y2" in obj:
-                    bounds_y.extend([obj["y1"], obj["y2"]])
+                    bounds_y.extend(np.ravel([obj["y1"], obj["y2"]]).tolist())
                 # Circle with center and radius
                 if "cx" in obj and "cy" in obj:
                     r = obj.get("r", 0)
@@ -413,6 +565,10 @@ def create_svg_scene(
                     ]
                     bounds_x.extend(coords[0::2])
                     bounds_y.extend(coords[1::2])
+                # Data-space shapes (rect, ellipse, polygon, polyline, text)
+                shape_xs, shape_ys = shape_bounds(obj)
+                bounds_x.extend(shape_xs)
+                bounds_y.extend(shape_ys)
 
         # Foreign objects (LaTeX labels)
         if foreign_objects:
@@ -431,8 +587,8 @@ def create_svg_scene(
         else:
             data_x_min, data_x_max, data_y_min, data_y_max = 0, 1, 0, 1
     else:
-        data_x_min, data_x_max = np.min(x_data), np.max(x_data)
-        data_y_min, data_y_max = np.min(y_data), np.max(y_data)
+        data_x_min, data_x_max = finite_range(x_data)
+        data_y_min, data_y_max = finite_range(y_data)
 
     # Use explicit bounds if provided, otherwise use data bounds with padding
     if x_min is None:
@@ -450,10 +606,16 @@ def create_svg_scene(
 
     # Transform functions without margin (will use g transform)
     def transform_x(x):
-        return (x - x_min) / (x_max - x_min) * plot_width
+        return quantize((x - x_min) / (x_max - x_min) * plot_width, precision)
 
     def transform_y(y):
-        return plot_height - (y - y_min) / (y_max - y_min) * plot_height
+        return quantize(plot_height - (y - y_min) / (y_max - y_min) * plot_height, precision)
+
+    padding = resolve_padding(clip)
+    clip_rect = None
+    if padding is not None:
+        margins = (margin_top, margin_right, margin_bottom, margin_left)
+        clip_rect = canvas_rect(plot_width, plot_height, margins, padding)
 
     # Resolve colors
     axes_color = resolve_color(axes_color) if axes_color else None
@@ -465,31 +627,26 @@ def create_svg_scene(
 
     # Draw grid first (behind everything)
     if show_grid and grid_color and grid_color != "none":
-        # Draw grid lines manually
-        for x in np.arange(np.ceil(x_min), np.floor(x_max) + 1):
-            line_elem = dwg.line(
-                start=(transform_x(x), 0),
-                end=(transform_x(x), plot_height),
-                stroke=grid_color,
-                stroke_width=0.5,
-                stroke_opacity=0.3,
-            )
-            plot_group.add(line_elem)
-
-        for y in np.arange(np.ceil(y_min), np.floor(y_max) + 1):
-            line_elem = dwg.line(
-                start=(0, transform_y(y)),
-                end=(plot_width, transform_y(y)),
-                stroke=grid_color,
-                stroke_width=0.5,
-                stroke_opacity=0.3,
-            )
-            plot_group.add(line_elem)
+        draw_grid_paths(
+            dwg,
+            plot_group,
+            transform_x,
+            transform_y,
+            x_min,
+            x_max,
+            y_min,
+            y_max,
+            plot_width,
+            plot_height,
+            grid_color,
+            max_lines=grid_max_lines,
+            precision=precision,
+        )
 
     # Draw axes
     if show_axes:
         draw_axes(
-            plot_group,
+            dwg,
             plot_width,
             plot_height,
             x_min,
@@ -497,6 +654,8 @@ def create_svg_scene(
             y_min,
             y_max,
             color=axes_color if axes_color else "currentColor",
+            parent=plot_group,
+            precision=precision,
         )
     else:
         # Even if show_axes is False, we need to define arrow markers for custom axis lines
@@ -509,149 +668,28 @@ def create_svg_scene(
     # Add custom lines if provided
     if lines:
         all_lines.extend(lines if isinstance(lines, list) else [lines])
+    if batch:
+        all_lines = batch_lines(all_lines)
 
-    # Draw all lines and shapes
-    for line in all_lines:
-        # Handle both Line objects and dictionaries
-        if hasattr(line, "to_svg_line"):
-            # Line object
-            line_elem = dwg.line(
-                start=(transform_x(line.x1), transform_y(line.y1)),
-                end=(transform_x(line.x2), transform_y(line.y2)),
-                stroke_width=line.stroke_width,
-            )
-            if line.stroke_opacity is not None:
-                line_elem["stroke-opacity"] = line.stroke_opacity
-            if line.stroke_dasharray:
-                line_elem["stroke-dasharray"] = line.stroke_dasharray
-            if line.class_:
-                line_elem["class"] = line.class_
-            if line.id:
-                line_elem["id"] = line.id
-            if line.style:
-                line_elem["style"] = line.style
-            # Check for type field to add arrow
-            if hasattr(line, "type") and line.type == "axis":
-                # Determine which arrow to use based on line orientation
-                if abs(line.y2 - line.y1) > abs(line.x2 - line.x1):
-                    line_elem["marker-end"] = "url(#arrow-y)"
-                else:
-                    line_elem["marker-end"] = "url(#arrow-x)"
-            plot_group.add(line_elem)
-        elif isinstance(line, dict):
-            # Dictionary - check type to handle different elements
-            line_type = line.get("type", "line")
-
-            if line_type == "circle":
-                # Handle circle elements
-                class_value = line.get("class", "") or ""
-                circle_kwargs = {
-                    "center": (transform_x(line.get("cx", 0)), transform_y(line.get("cy", 0))),
-                    "r": line.get("r", 5),
-                    "stroke_width": line.get("stroke-width", line.get("stroke_width", 1)),
-                }
-                if "fill-" not in class_value:
-                    circle_kwargs["fill"] = line.get("fill", "none")
-                if "stroke-" not in class_value:
-                    circle_kwargs["stroke"] = line.get("stroke", None)
-                circle_elem = dwg.circle(**circle_kwargs)
-                # Default to base-content stroke if no class provided
-                if line.get("class"):
-                    circle_elem["class"] = line.get("class")
-                else:
-                    circle_elem["class"] = "stroke-base-content"
-                    # Ensure visible stroke even if CSS vars are missing
-                    if "stroke" not in circle_elem.attribs:
-                        circle_elem["stroke"] = "currentColor"
-                if line.get("id"):
-                    circle_elem["id"] = line.get("id")
-                if line.get("style"):
-                    circle_elem["style"] = line.get("style")
-                plot_group.add(circle_elem)
-
-            elif line_type == "path":
-                # Handle path elements
-                class_value = line.get("class", "") or ""
-                path_kwargs = {
-                    "d": line.get("d", ""),
-                    "stroke_width": line.get("stroke-width", line.get("stroke_width", 1)),
-                }
-                if "fill-" not in class_value:
-                    path_kwargs["fill"] = line.get("fill")
-                if "stroke-" not in class_value:
-                    path_kwargs["stroke"] = line.get("stroke")
-                path_elem = dwg.path(**path_kwargs)
-                if line.get("fill-opacity"):
-                    path_elem["fill-opacity"] = line.get("fill-opacity")
-                if line.get("stroke-opacity"):
-                    path_elem["stroke-opacity"] = line.get("stroke-opacity")
-                if line.get("stroke-dasharray"):
-                    path_elem["stroke-dasharray"] = line.get("stroke-dasharray")
-                if line.get("class"):
-                    path_elem["class"] = line.get("class")
-                else:
-                    path_elem["class"] = "stroke-base-content"
-                    # Ensure visible stroke even if CSS vars are missing
-                    if "stroke" not in path_elem.attribs:
-                        path_elem["stroke"] = "currentColor"
-                if line.get("id"):
-                    path_elem["id"] = line.get("id")
-                if line.get("style"):
-                    path_elem["style"] = line.get("style")
-                plot_group.add(path_elem)
-
-            else:
-                # Default to line/axis handling
-                class_value = line.get("class", "") or ""
-                line_kwargs = {
-                    "start": (transform_x(line.get("x1")), transform_y(line.get("y1"))),
-                    "end": (transform_x(line.get("x2")), transform_y(line.get("y2"))),
-                    "stroke_width": line.get("stroke-width", line.get("stroke_width", 1)),
-                }
-                if "stroke-" not in class_value and line.get("stroke") is not None:
-                    line_kwargs["stroke"] = line.get("stroke")
-                line_elem = dwg.line(**line_kwargs)
-                if line.get("stroke-opacity") is not None:
-                    line_elem["stroke-opacity"] = line.get("stroke-opacity")
-                if line.get("stroke-dasharray"):
-                    line_elem["stroke-dasharray"] = line.get("stroke-dasharray")
-                # Apply default classes if missing
-                if line.get("class"):
-                    line_elem["class"] = line.get("class")
-                else:
-                    # Determine axis orientation for sensible defaults
-                    if line_type == "axis":
-                        x1, y1 = line.get("x1", 0), line.get("y1", 0)
-                        x2, y2 = line.get("x2", 0), line.get("y2", 0)
-                        is_vertical = abs(y2 - y1) > abs(x2 - x1)
-                        axis_cls = "y-axis" if is_vertical else "x-axis"
-                        line_elem["class"] = f"axis {axis_cls} stroke-base-content"
-                    else:
-                        line_elem["class"] = "line stroke-secondary"
-                    # Ensure visible stroke even if CSS vars are missing
-                    if "stroke" not in line_elem.attribs:
-                        line_elem["stroke"] = "currentColor"
-                if line.get("id"):
-                    line_elem["id"] = line.get("id")
-                if line.get("style"):
-                    line_elem["style"] = line.get("style")
-                # Check for type field to add arrow
-                if line_type == "axis":
-                    # Determine which arrow to use based on line orientation
-                    x1, y1 = line.get("x1", 0), line.get("y1", 0)
-                    x2, y2 = line.get("x2", 0), line.get("y2", 0)
-                    if abs(y2 - y1) > abs(x2 - x1):
-                        line_elem["marker-end"] = "url(#arrow-y)"
-                    else:
-                        line_elem["marker-end"] = "url(#arrow-x)"
-                plot_group.add(line_elem)
+    # Draw all lines and shapes, each run of same-type elements by its renderer
+    context = RenderContext(
+        dwg, plot_group, transform_x, transform_y, clip_rect, precision, class_fallbacks=False
+    )
+    render_elements(context, all_lines)
 
     # Draw curve
-    points = [(transform_x(x), transform_y(y)) for x, y in zip(x_data, y_data)]
-    if len(points) > 1:
-        path_data = f"M {points[0][0]},{points[0][1]} "
-        for point in points[1:]:
-            path_data += f"L {point[0]},{point[1]} "
+    path_data = encode_curve(
+        x_data,
+        y_data,
+        transform_x,
+        transform_y,
+        resolve_tolerance(simplify),
+        stats,
+        precision,
+        clip_rect,
+        resolve_jump(discontinuity, plot_height),
+    )
+    if path_data:
         path_elem = dwg.path(d=path_data, stroke_width=2, fill="none")
         # Default curve class styling when not provided elsewhere
         path_elem["class"] = "curve stroke-primary"
@@ -662,21 +700,9 @@ def create_svg_scene(
     # Add the plot group to the drawing
     dwg.add(plot_group)
 
-    svg_string = dwg.tostring()
-
-    # Aggressively ensure arrows are present
-    # This function is no longer defined, so we'll skip this for now
-    # svg_string = ensure_arrows_in_svg(svg_string)
-
     # Inject foreign objects if provided
+    foreign_object_xmls = []
     if foreign_objects:
-        # Validate and convert to ForeignObject instances
-        if isinstance(foreign_objects, list) and len(foreign_objects) > 0:
-            if isinstance(foreign_objects[0], dict):
-                # This function is no longer defined, so we'll skip foreign object validation for now
-                pass
-
-        foreign_object_xmls = []
         for obj in foreign_objects:
             # Handle both dictionary and object formats
             if isinstance(obj, dict):
@@ -703,7 +729,8 @@ def create_svg_scene(
                 offset_x = margin_left
                 offset_y = margin_top
                 foreign_object_xmls.append(
-                    f'<foreignObject x="{svg_x - width / 2 + offset_x}" y="{svg_y - height / 2 + offset_y}" '
+                    f'<foreignObject x="{quantize(svg_x - width / 2 + offset_x, precision)}" '
+                    f'y="{quantize(svg_y - height / 2 + offset_y, precision)}" '
                     f'width="{width}" height="{height}">'
                     f'<div xmlns="http://www.w3.org/1999/xhtml" class="{classes}" '
                     f'style="{style_str}">{latex}</div>'
@@ -727,14 +754,7 @@ def create_svg_scene(
                 svg_y = transform_y(y)
                 foreign_object_xmls.append(f'<circle cx="{svg_x}" cy="{svg_y}" r="3" fill="red"/>')
 
-        injection_point = svg_string.rfind("</svg>")
-        svg_string = (
-            svg_string[:injection_point]
-            + "\n".join(foreign_object_xmls)
-            + svg_string[injection_point:]
-        )
-
-    return svg_string
+    return finalize_drawing(dwg, foreign_object_xmls, (x_min, x_max, y_min, y_max))
 
 
 def create_multi_curve_svg(
@@ -754,14 +774,45 @@ def create_multi_curve_svg(
     y_min=None,
     y_max=None,
     curve_classes=None,
+    x_data_list=None,
+    backend=None,
+    simplify=None,
+    stats=None,
+    precision=DEFAULT,
+    grid_max_lines=DEFAULT_MAX_TICKS,
+    clip=True,
+    discontinuity=None,
+    batch=True,
+    polynomials=None,
     **kwargs,
 ):
-    """Create SVG with multiple curves, lines, and optional foreignObject elements"""
+    """Create SVG with multiple curves, lines, and optional foreignObject elements
+
+    `simplify` (True or a pixel tolerance) drops curve samples that are invisible at
+    the output resolution; the number removed is added to `stats["points_removed"]`.
+    `precision` sets the decimals kept in emitted coordinates (None = full repr,
+    default = package setting, see number_format.py). The grid is drawn at "nice"
+    steps with at most `grid_max_lines` intervals per axis (see ticks.py).
+    Curves and plain lines are clipped to the visible canvas grown by `clip` pixels
+    (True = default padding, False = no clipping, see clipping.py). Non-finite samples
+    always break a curve; `discontinuity` (True = plot height, or pixels) also breaks it
+    where neighbouring samples jump further than that.
+    With `batch`, adjacent plain lines of identical style are drawn as a single path
+    (see batching.py). Each element of `lines` is drawn by the renderer registered
+    for its type (see elements.py).
+
+    Every curve uses `x_data` unless `x_data_list` gives one x array per curve.
+    `polynomials` optionally gives, per curve, None or the (coefficients, interval)
+    of a polynomial of degree up to 3; such a curve is drawn as exact Bézier
+    segments cut to the canvas, its samples only serving the bounds (see polynomial.py).
+    """
+    precision = resolve_precision(precision)
+    curve_x_list = x_data_list if x_data_list is not None else [x_data] * len(y_data_list)
     if colors is None:
         colors = ["blue", "red", "green", "orange", "purple"]
 
     # Use first curve to set up the SVG
-    dwg = svgwrite.Drawing(size=(size, size))
+    dwg = new_drawing((size, size), backend)
 
     # Scale data to fit (use all curves to determine range)
     # Handle margin which can be a number or a dict {top,right,bottom,left}; default 0
@@ -788,16 +839,13 @@ def create_multi_curve_svg(
 
     # Use explicit bounds if provided, otherwise calculate from data
     if x_min is None or x_max is None or y_min is None or y_max is None:
-        all_x = []
-        all_y = []
-        for y_data in y_data_list:
-            all_x.extend(x_data)
-            all_y.extend(y_data)
+        all_x = [np.asarray(x, dtype=float).ravel() for x in curve_x_list]
+        all_y = [np.asarray(y, dtype=float).ravel() for y in y_data_list]
+        all_x = np.concatenate(all_x) if all_x else []
+        all_y = np.concatenate(all_y) if all_y else []
 
-        data_x_min = np.min(all_x) if all_x else 0
-        data_x_max = np.max(all_x) if all_x else 1
-        data_y_min = np.min(all_y) if all_y else 0
-        data_y_max = np.max(all_y) if all_y else 1
+        data_x_min, data_x_max = finite_range(all_x)
+        data_y_min, data_y_max = finite_range(all_y)
 
         # Use explicit values if provided, otherwise use data bounds with padding
         if x_min is None:
@@ -815,10 +863,16 @@ def create_multi_curve_svg(
 
     # Transform functions without margin (will use g transform)
     def transform_x(x):
-        return (x - x_min) / (x_max - x_min) * plot_width
+        return quantize((x - x_min) / (x_max - x_min) * plot_width, precision)
 
     def transform_y(y):
-        return plot_height - (y - y_min) / (y_max - y_min) * plot_height
+        return quantize(plot_height - (y - y_min) / (y_max - y_min) * plot_height, precision)
+
+    padding = resolve_padding(clip)
+    clip_rect = None
+    if padding is not None:
+        margins = (margin_top, margin_right, margin_bottom, margin_left)
+        clip_rect = canvas_rect(plot_width, plot_height, margins, padding)
 
     # Resolve colors (no hard defaults; allow CSS to drive color via currentColor)
     axes_color = resolve_color(axes_color) if axes_color else None
@@ -829,31 +883,26 @@ def create_multi_curve_svg(
 
     # Draw grid first (behind everything)
     if show_grid and grid_color and grid_color != "none":
-        # Draw grid lines manually
-        for x in np.arange(np.ceil(x_min), np.floor(x_max) + 1):
-            line_elem = dwg.line(
-                start=(transform_x(x), 0),
-                end=(transform_x(x), plot_height),
-                stroke=grid_color,
-                stroke_width=0.5,
-                stroke_opacity=0.3,
-            )
-            plot_group.add(line_elem)
-
-        for y in np.arange(np.ceil(y_min), np.floor(y_max) + 1):
-            line_elem = dwg.line(
-                start=(0, transform_y(y)),
-                end=(plot_width, transform_y(y)),
-                stroke=grid_color,
-                stroke_width=0.5,
-                stroke_opacity=0.3,
-            )
-            plot_group.add(line_elem)
+        draw_grid_paths(
+            dwg,
+            plot_group,
+            transform_x,
+            transform_y,
+            x_min,
+            x_max,
+            y_min,
+            y_max,
+            plot_width,
+            plot_height,
+            grid_color,
+            max_lines=grid_max_lines,
+            precision=precision,
+        )
 
     # Draw axes
     if show_axes:
         draw_axes(
-            plot_group,
+            dwg,
             plot_width,
             plot_height,
             x_min,
@@ -861,6 +910,8 @@ def create_multi_curve_svg(
             y_min,
             y_max,
             color=axes_color if axes_color else "currentColor",
+            parent=plot_group,
+            precision=precision,
         )
     else:
         # Even if show_axes is False, we need to define arrow markers for custom axis lines
@@ -873,6 +924,8 @@ def create_multi_curve_svg(
     # Add custom lines if provided
     if lines:
         all_lines.extend(lines if isinstance(lines, list) else [lines])
+    if batch:
+        all_lines = batch_lines(all_lines)
 
     # Create arrow markers for axis lines with their specific colors
     arrow_markers_created = set()
@@ -890,170 +943,38 @@ def create_multi_curve_svg(
                 define_arrow_marker(dwg, marker_id, stroke_color, 12)  # Bigger arrow markers
                 arrow_markers_created.add(marker_id)
 
-    # Draw all lines and shapes
-    for line in all_lines:
-        # Handle both Line objects and dictionaries
-        if hasattr(line, "x1"):
-            # Line object
-            line_kwargs = {
-                "start": (transform_x(line.x1), transform_y(line.y1)),
-                "end": (transform_x(line.x2), transform_y(line.y2)),
-                "stroke_width": line.stroke_width,
-            }
-
-            # Get fallback color from class if present
-            line_class = getattr(line, "class_", "")
-            fallback_color = get_color_from_class(line_class)
-            if fallback_color:
-                line_kwargs["stroke"] = fallback_color
-            elif hasattr(line, "stroke"):
-                line_kwargs["stroke"] = line.stroke
-
-            line_elem = dwg.line(**line_kwargs)
-
-            if line.stroke_opacity is not None:
-                line_elem["stroke-opacity"] = line.stroke_opacity
-            if line.stroke_dasharray:
-                line_elem["stroke-dasharray"] = line.stroke_dasharray
-            if line.class_:
-                line_elem["class"] = line.class_
-            if line.id:
-                line_elem["id"] = line.id
-            if line.style:
-                line_elem["style"] = line.style
-            # Check for type field to add arrow
-            if hasattr(line, "type") and line.type == "axis":
-                # Use color-specific arrow marker
-                stroke_color = (
-                    fallback_color if fallback_color else getattr(line, "stroke", "black")
-                )
-                marker_id = f"arrow-{stroke_color.replace('#', '')}"
-                line_elem["marker-end"] = f"url(#{marker_id})"
-            plot_group.add(line_elem)
-        elif isinstance(line, dict):
-            # Dictionary - check type to handle different elements
-            line_type = line.get("type", "line")
-
-            if line_type == "circle":
-                # Handle circle elements
-                circle_kwargs = {
-                    "center": (transform_x(line.get("cx", 0)), transform_y(line.get("cy", 0))),
-                    "r": line.get("r", 5),
-                    "stroke_width": line.get("stroke-width", 1),
-                }
-
-                # Add fallback colors from classes
-                line_class = line.get("class", "")
-                stroke_fallback = get_color_from_class(line_class)
-                if stroke_fallback and "stroke-" in line_class:
-                    circle_kwargs["stroke"] = stroke_fallback
-                elif line.get("stroke"):
-                    circle_kwargs["stroke"] = line.get("stroke")
-
-                fill_fallback = get_color_from_class(line_class.replace("stroke-", "fill-"))
-                if fill_fallback and "fill-" in line_class:
-                    circle_kwargs["fill"] = fill_fallback
-                elif line.get("fill"):
-                    circle_kwargs["fill"] = line.get("fill")
-                else:
-                    circle_kwargs["fill"] = "none"
-
-                circle_elem = dwg.circle(**circle_kwargs)
-                if line.get("class"):
-                    circle_elem["class"] = line.get("class")
-                if line.get("id"):
-                    circle_elem["id"] = line.get("id")
-                if line.get("style"):
-                    circle_elem["style"] = line.get("style")
-                plot_group.add(circle_elem)
-
-            elif line_type == "path":
-                # Handle path elements
-                path_kwargs = {
-                    "d": line.get("d", ""),
-                    "stroke_width": line.get("stroke-width", 1),
-                }
-
-                # Add fallback colors from classes
-                line_class = line.get("class", "")
-                stroke_fallback = get_color_from_class(line_class)
-                if stroke_fallback and "stroke-" in line_class:
-                    path_kwargs["stroke"] = stroke_fallback
-                elif line.get("stroke"):
-                    path_kwargs["stroke"] = line.get("stroke")
-
-                fill_fallback = get_color_from_class(line_class.replace("stroke-", "fill-"))
-                if fill_fallback and "fill-" in line_class:
-                    path_kwargs["fill"] = fill_fallback
-                elif line.get("fill"):
-                    path_kwargs["fill"] = line.get("fill")
-                else:
-                    path_kwargs["fill"] = "none"
-
-                path_elem = dwg.path(**path_kwargs)
-                if line.get("fill-opacity"):
-                    path_elem["fill-opacity"] = line.get("fill-opacity")
-                if line.get("stroke-opacity"):
-                    path_elem["stroke-opacity"] = line.get("stroke-opacity")
-                if line.get("stroke-dasharray"):
-                    path_elem["stroke-dasharray"] = line.get("stroke-dasharray")
-                if line.get("class"):
-                    path_elem["class"] = line.get("class")
-                if line.get("id"):
-                    path_elem["id"] = line.get("id")
-                if line.get("style"):
-                    path_elem["style"] = line.get("style")
-                plot_group.add(path_elem)
-
-            else:
-                # Default to line/axis handling
-                line_kwargs = {
-                    "start": (transform_x(line.get("x1")), transform_y(line.get("y1"))),
-                    "end": (transform_x(line.get("x2")), transform_y(line.get("y2"))),
-                    "stroke_width": line.get("stroke-width", line.get("stroke_width", 1)),
-                }
-
-                # Add fallback stroke color if class contains color directive
-                line_class = line.get("class", "")
-                fallback_color = get_color_from_class(line_class)
-                if fallback_color:
-                    line_kwargs["stroke"] = fallback_color
-                elif line.get("stroke"):
-                    line_kwargs["stroke"] = line.get("stroke")
-
-                line_elem = dwg.line(**line_kwargs)
-
-                if line.get("stroke-opacity") is not None:
-                    line_elem["stroke-opacity"] = line.get("stroke-opacity")
-                if line.get("stroke-dasharray"):
-                    line_elem["stroke-dasharray"] = line.get("stroke-dasharray")
-                if line.get("class"):
-                    line_elem["class"] = line.get("class")
-                if line.get("id"):
-                    line_elem["id"] = line.get("id")
-                if line.get("style"):
-                    line_elem["style"] = line.get("style")
-                # Check for type field to add arrow
-                if line_type == "axis":
-                    # Skip arrow if line has 'no-arrow' class
-                    if "no-arrow" not in line.get("class", ""):
-                        # Use color-specific arrow marker with fallback
-                        line_class = line.get("class", "")
-                        fallback_color = get_color_from_class(line_class)
-                        stroke_color = (
-                            fallback_color if fallback_color else line.get("stroke", "black")
-                        )
-                        marker_id = f"arrow-{stroke_color.replace('#', '')}"
-                        line_elem["marker-end"] = f"url(#{marker_id})"
-                plot_group.add(line_elem)
+    # Draw all lines and shapes, each run of same-type elements by its renderer
+    context = RenderContext(
+        dwg, plot_group, transform_x, transform_y, clip_rect, precision, class_fallbacks=True
+    )
+    render_elements(context, all_lines)
 
     # Draw curves
-    for i, y_data in enumerate(y_data_list):
-        points = [(transform_x(x), transform_y(y)) for x, y in zip(x_data, y_data)]
-        if len(points) > 1:
-            path_data = f"M {points[0][0]},{points[0][1]} "
-            for point in points[1:]:
-                path_data += f"L {point[0]},{point[1]} "
+    tolerance = resolve_tolerance(simplify)
+    jump = resolve_jump(discontinuity, plot_height)
+    view = None
+    if clip_rect is not None:
+        view = data_view(clip_rect, x_min, x_max, y_min, y_max, plot_width, plot_height)
+    for i, (curve_x, y_data) in enumerate(zip(curve_x_list, y_data_list)):
+        polynomial = polynomials[i] if polynomials and i < len(polynomials) else None
+        if polynomial is not None:
+            coefficients, interval = polynomial
+            path_data = encode_polynomial(
+                coefficients, interval, transform_x, transform_y, view, precision
+            )
+        else:
+            path_data = encode_curve(
+                curve_x,
+                y_data,
+                transform_x,
+                transform_y,
+                tolerance,
+                stats,
+                precision,
+                clip_rect,
+                jump,
+            )
+        if path_data:
             # Build path with class-based styling support
             path_kwargs = {"d": path_data, "stroke_width": 2, "fill": "none"}
             curve_class = None
@@ -1083,21 +1004,9 @@ def create_multi_curve_svg(
     # Add the plot group to the drawing
     dwg.add(plot_group)
 
-    svg_string = dwg.tostring()
-
-    # Aggressively ensure arrows are present
-    # This function is no longer defined, so we'll skip this for now
-    # svg_string = ensure_arrows_in_svg(svg_string)
-
     # Inject foreign objects if provided
+    foreign_object_xmls = []
     if foreign_objects:
-        # Validate and convert to ForeignObject instances
-        if isinstance(foreign_objects, list) and len(foreign_objects) > 0:
-            if isinstance(foreign_objects[0], dict):
-                # This function is no longer defined, so we'll skip foreign object validation for now
-                pass
-
-        foreign_object_xmls = []
         for obj in foreign_objects:
             # Handle both dictionary and object formats
             if isinstance(obj, dict):
@@ -1124,7 +1033,8 @@ def create_multi_curve_svg(
                 offset_x = margin_left
                 offset_y = margin_top
                 foreign_object_xmls.append(
-                    f'<foreignObject x="{svg_x - width / 2 + offset_x}" y="{svg_y - height / 2 + offset_y}" '
+                    f'<foreignObject x="{quantize(svg_x - width / 2 + offset_x, precision)}" '
+                    f'y="{quantize(svg_y - height / 2 + offset_y, precision)}" '
                     f'width="{width}" height="{height}">'
                     f'<div xmlns="http://www.w3.org/1999/xhtml" class="{classes}" '
                     f'style="{style_str}">{latex}</div>'
@@ -1148,17 +1058,10 @@ def create_multi_curve_svg(
                 svg_y = transform_y(y)
                 foreign_object_xmls.append(f'<circle cx="{svg_x}" cy="{svg_y}" r="3" fill="red"/>')
 
-        injection_point = svg_string.rfind("</svg>")
-        svg_string = (
-            svg_string[:injection_point]
-            + "\n".join(foreign_object_xmls)
-            + svg_string[injection_point:]
-        )
-
-    return svg_string
+    return finalize_drawing(dwg, foreign_object_xmls, (x_min, x_max, y_min, y_max))
 
 
-def graph_from_dict(graph_dict):
+def graph_from_dict(graph_dict, backend=None, stats=None, cache=True):
     """
     Generate SVG from a standardized graph dictionary (V2 - curves in lines).
 
@@ -1166,11 +1069,38 @@ def graph_from_dict(graph_dict):
 
     Args:
         graph_dict: Dictionary containing all graph parameters
+        backend: Rendering backend ("svgwrite" or "string"); defaults to the
+            package-wide setting, see `set_default_backend`
+        stats: Optional dict filled with render statistics (e.g. `points_removed`
+            when `settings["simplify"]` is enabled); bypasses the cache
+        cache: Look the result up in (and store it into) the package-wide
+            render cache, see render_cache.py
 
     Returns:
         str: SVG string
     """
-    import numpy as np
+    if not cache or stats is not None or not render_cache.enabled:
+        return _graph_from_dict(graph_dict, backend, stats)
+
+    backend = backend or _default_backend
+    try:
+        key = (fingerprint(graph_dict), backend, get_default_precision())
+    except TypeError:
+        # Dicts holding arbitrary objects are rendered uncached
+        return _graph_from_dict(graph_dict, backend, stats)
+    svg = render_cache.get(key)
+    if svg is None:
+        svg = _graph_from_dict(graph_dict, backend, stats)
+        render_cache.put(key, svg)
+    return svg
+
+
+def _graph_from_dict(graph_dict, backend=None, stats=None):
+    """Render `graph_dict` without going through the render cache."""
+    if stats is None and graph_dict.get("family"):
+        from .families import render_family_member
+
+        return render_family_member(graph_dict, backend)
 
     # Extract SVG parameters
     svg_params = graph_dict.get("svg", {})
@@ -1192,118 +1122,95 @@ def graph_from_dict(graph_dict):
     other_lines = []
 
     for line in lines:
-        if line.get("type") == "curve":
+        if line.get("type") in ("curve", POLYNOMIAL_TYPE):
             curves.append(line)
         else:
             other_lines.append(line)
 
     # If we have curves, use multi-curve SVG
     if curves:
-        # Check if all curves share the same x data
         x_data_arrays = []
         y_data_arrays = []
         colors = []
         curve_classes = []
+        polynomials = []
 
+        # Curves sharing the same x samples (same list object or same content)
+        # share a single array, converted once
+        shared_x = {}
         for curve in curves:
+            if curve.get("type") == POLYNOMIAL_TYPE:
+                # Key points for the bounds; drawn from the coefficients
+                x_poly, y_poly, polynomial = polynomial_curve_data(curve, domain, size)
+                x_data_arrays.append(x_poly)
+                y_data_arrays.append(y_poly)
+                polynomials.append(polynomial)
+                colors.append(curve.get("stroke"))
+                curve_classes.append(curve.get("class", ""))
+                continue
+            polynomials.append(None)
             curve_data = curve.get("data", {})
-            x_data_arrays.append(np.array(curve_data.get("x", [])))
+            x_raw = curve_data.get("x", [])
+            key = id(x_raw)
+            if key not in shared_x:
+                try:
+                    key = fingerprint(x_raw)
+                except TypeError:
+                    pass
+            if key not in shared_x:
+                shared_x[key] = shared_x[id(x_raw)] = np.asarray(x_raw)
+            x_data_arrays.append(shared_x[key])
             y_data_arrays.append(np.array(curve_data.get("y", [])))
             colors.append(curve.get("stroke"))
             curve_classes.append(curve.get("class", ""))
 
-        # Check if all x arrays are the same
-        all_same_x = True
-        if x_data_arrays:
-            first_x = x_data_arrays[0]
-            for x_arr in x_data_arrays[1:]:
-                if len(x_arr) != len(first_x) or not np.allclose(x_arr, first_x):
-                    all_same_x = False
-                    break
-
-        if all_same_x and x_data_arrays:
-            # All curves share the same x, use multi-curve SVG
-            x_data = x_data_arrays[0]
-
-            # Filter settings to only include accepted parameters
-            multi_curve_settings = {
-                k: v
-                for k, v in settings.items()
-                if k
-                in [
-                    "bg_color",
-                    "axes_color",
-                    "grid_color",
-                    "show_axes",
-                    "show_grid",
-                    "margin",
-                    "margin_left",
-                    "margin_right",
-                    "margin_top",
-                    "margin_bottom",
-                ]
-            }
-
-            svg_result = create_multi_curve_svg(
-                x_data=x_data,
-                y_data_list=y_data_arrays,
-                size=size,
-                colors=colors,
-                lines=other_lines,
-                foreign_objects=foreign_objects,
-                x_min=domain.get("x_min"),
-                x_max=domain.get("x_max"),
-                y_min=domain.get("y_min"),
-                y_max=domain.get("y_max"),
-                **{"curve_classes": curve_classes},
-                **multi_curve_settings,
-            )
-            # Add class attribute to SVG if specified
-            if svg_class:
-                svg_result = svg_result.replace("<svg ", f'<svg class="{svg_class}" ', 1)
-            return svg_result
-        else:
-            # Different x arrays - render each curve separately
-            # For now, we'll still use the first x as reference
-            # TODO: Implement proper handling for different x arrays
-            x_data = x_data_arrays[0] if x_data_arrays else np.array([])
-
-            multi_curve_settings = {
-                k: v
-                for k, v in settings.items()
-                if k
-                in [
-                    "bg_color",
-                    "axes_color",
-                    "grid_color",
-                    "show_axes",
-                    "show_grid",
-                    "margin",
-                    "margin_left",
-                    "margin_right",
-                    "margin_top",
-                    "margin_bottom",
-                ]
-            }
+        # Filter settings to only include accepted parameters
+        multi_curve_settings = {
+            k: v
+            for k, v in settings.items()
+            if k
+            in [
+                "bg_color",
+                "axes_color",
+                "grid_color",
+                "show_axes",
+                "show_grid",
+                "margin",
+                "margin_left",
+                "margin_right",
+                "margin_top",
+                "margin_bottom",
+                "simplify",
+                "precision",
+                "grid_max_lines",
+                "clip",
+                "discontinuity",
+                "batch",
+            ]
+        }
 
-            svg_result = create_multi_curve_svg(
-                x_data=x_data,
-                y_data_list=y_data_arrays,
-                size=size,
-                colors=colors,
-                lines=other_lines,
-                foreign_objects=foreign_objects,
-                x_min=domain.get("x_min"),
-                x_max=domain.get("x_max"),
-                y_min=domain.get("y_min"),
-                y_max=domain.get("y_max"),
-                **{"curve_classes": curve_classes},
-                **multi_curve_settings,
-            )
-            # Add class attribute to SVG if specified
-            if svg_class:
-                svg_result = svg_result.replace("<svg ", f'<svg class="{svg_class}" ', 1)
-            return svg_result
+        svg_result = create_multi_curve_svg(
+            x_data=x_data_arrays[0],
+            y_data_list=y_data_arrays,
+            size=size,
+            colors=colors,
+            lines=other_lines,
+            foreign_objects=foreign_objects,
+            x_min=domain.get("x_min"),
+            x_max=domain.get("x_max"),
+            y_min=domain.get("y_min"),
+            y_max=domain.get("y_max"),
+            **{"curve_classes": curve_classes},
+            **multi_curve_settings,
+            x_data_list=x_data_arrays,
+            polynomials=polynomials if any(p is not None for p in polynomials) else None,
+            backend=backend,
+            stats=stats,
+        )
+        # Add class attribute to SVG if specified
+        if svg_class:
+            svg_result = svg_result.replace("<svg ", f'<svg class="{svg_class}" ', 1)
+        return svg_result
     else:
         # No curves, just render lines and foreign objects
         scene_settings = {
@@ -1322,6 +1229,12 @@ def graph_from_dict(graph_dict):
                 "margin_right",
                 "margin_top",
                 "margin_bottom",
+                "simplify",
+                "precision",
+                "grid_max_lines",
+                "clip",
+                "discontinuity",
+                "batch",
             ]
         }
 
@@ -1336,6 +1249,8 @@ def graph_from_dict(graph_dict):
             y_min=domain.get("y_min"),
             y_max=domain.get("y_max"),
             **scene_settings,
+            backend=backend,
+            stats=stats,
         )
         # Add class attribute to SVG if specified
         if svg_class:
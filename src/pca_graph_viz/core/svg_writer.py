@@ -0,0 +1,215 @@
+"""Direct string emitter for SVG output (svgwrite-free rendering backend).
+
+``StringDrawing`` implements the small subset of the svgwrite ``Drawing`` API
+used by ``svg_utils`` (``line``, ``circle``, ``ellipse``, ``rect``, ``path``,
+``text``, ``g``, ``marker``, ``defs``, ``add``, item assignment, ``attribs``
+and ``tostring``), but keeps each element as a plain name/attribute/children
+record and writes the final markup into a single list buffer.
+
+Serialization follows svgwrite + ElementTree exactly: attributes are sorted
+by name, ``None`` and empty values are dropped, values are converted with
+``str()``, and attribute escaping matches ``xml.etree.ElementTree``. For
+the element subset above the output is byte-identical to svgwrite's
+``tostring()``. The one documented difference is that no attribute
+validation is performed (svgwrite's debug-mode validator is skipped).
+"""
+
+SVG_NAMESPACE = "http://www.w3.org/2000/svg"
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
+EV_NAMESPACE = "http://www.w3.org/2001/xml-events"
+
+
+def escape_attrib(text):
+    """Escape an attribute value the way ElementTree does."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+def escape_cdata(text):
+    """Escape element text content the way ElementTree does."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+class StringElement:
+    """Lightweight SVG element: a tag name, an attribute dict and children."""
+
+    __slots__ = ("elementname", "attribs", "elements")
+
+    def __init__(self, elementname, **extra):
+        self.elementname = elementname
+        self.attribs = {}
+        self.elements = []
+        self.update(extra)
+
+    def update(self, attribs):
+        """Set attributes using svgwrite's keyword rules (``class_`` -> ``class``,
+        ``stroke_width`` -> ``stroke-width``)."""
+        for key, value in attribs.items():
+            self.attribs[key.rstrip("_").replace("_", "-")] = value
+
+    def __getitem__(self, key):
+        return self.attribs[key]
+
+    def __setitem__(self, key, value):
+        self.attribs[key] = value
+
+    def add(self, element):
+        self.elements.append(element)
+        return element
+
+    def write_start(self, out):
+        """Append the opening tag with its sorted attributes (left unclosed) to ``out``."""
+        out.append("<" + self.elementname)
+        for key, value in sorted(self.attribs.items()):
+            if value is None:
+                continue
+            value = str(value)
+            if value:
+                out.append(f' {key}="{escape_attrib(value)}"')
+
+    def write(self, out):
+        """Append the markup of this element and its children to ``out``."""
+        self.write_start(out)
+        if self.elements:
+            out.append(">")
+            for element in self.elements:
+                element.write(out)
+            out.append(f"</{self.elementname}>")
+        else:
+            out.append(" />")
+
+    def tostring(self):
+        out = []
+        self.write(out)
+        return "".join(out)
+
+
+class StringText(StringElement):
+    """``<text>`` element carrying its text content."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text="", **extra):
+        super().__init__("text", **extra)
+        self.text = text
+
+    def write(self, out):
+        if not self.text and not self.elements:
+            return super().write(out)
+        self.write_start(out)
+        out.append(">")
+        if self.text:
+            out.append(escape_cdata(str(self.text)))
+        for element in self.elements:
+            element.write(out)
+        out.append("</text>")
+
+
+class StringDrawing(StringElement):
+    """Root ``<svg>`` element with svgwrite-compatible element factories."""
+
+    __slots__ = ("defs",)
+
+    def __init__(self, size=("100%", "100%"), **extra):
+        super().__init__("svg", **extra)
+        self.attribs["width"], self.attribs["height"] = size
+        self.defs = self.add(StringElement("defs"))
+
+    # Element factories -------------------------------------------------
+
+    def line(self, start=(0, 0), end=(0, 0), **extra):
+        element = StringElement("line", **extra)
+        element.attribs["x1"], element.attribs["y1"] = start
+        element.attribs["x2"], element.attribs["y2"] = end
+        return element
+
+    def circle(self, center=(0, 0), r=1, **extra):
+        element = StringElement("circle", **extra)
+        element.attribs["cx"], element.attribs["cy"] = center
+        element.attribs["r"] = r
+        return element
+
+    def ellipse(self, center=(0, 0), r=(1, 1), **extra):
+        element = StringElement("ellipse", **extra)
+        element.attribs["cx"], element.attribs["cy"] = center
+        element.attribs["rx"], element.attribs["ry"] = r
+        return element
+
+    def rect(self, insert=(0, 0), size=(1, 1), **extra):
+        element = StringElement("rect", **extra)
+        element.attribs["x"], element.attribs["y"] = insert
+        element.attribs["width"], element.attribs["height"] = size
+        return element
+
+    def text(self, text, insert=None, **extra):
+        element = StringText(text, **extra)
+        if insert is not None:
+            element.attribs["x"], element.attribs["y"] = insert
+        return element
+
+    def path(self, d=None, **extra):
+        element = StringElement("path", **extra)
+        element.attribs["d"] = d
+        return element
+
+    def g(self, **extra):
+        return StringElement("g", **extra)
+
+    def marker(self, insert=None, size=None, orient=None, **extra):
+        element = StringElement("marker", **extra)
+        if insert is not None:
+            element.attribs["refX"], element.attribs["refY"] = insert
+        if size is not None:
+            element.attribs["markerWidth"], element.attribs["markerHeight"] = size
+        if orient is not None:
+            element.attribs["orient"] = orient
+        return element
+
+    def foreignObject(self, insert=None, size=None, **extra):
+        element = StringElement("foreignObject", **extra)
+        if insert is not None:
+            element.attribs["x"], element.attribs["y"] = insert
+        if size is not None:
+            element.attribs["width"], element.attribs["height"] = size
+        return element
+
+    # Serialization -----------------------------------------------------
+
+    def tostring(self, extra_markup=None):
+        """Serialize the drawing.
+
+        Args:
+            extra_markup: Optional raw markup written just before the closing
+                ``</svg>`` tag (used for foreignObject injection, replacing
+                the ``rfind("</svg>")`` splice needed with svgwrite).
+        """
+        self.attribs["xmlns"] = SVG_NAMESPACE
+        self.attribs["xmlns:xlink"] = XLINK_NAMESPACE
+        self.attribs["xmlns:ev"] = EV_NAMESPACE
+        self.attribs["baseProfile"] = "full"
+        self.attribs["version"] = "1.1"
+
+        out = []
+        self.write(out)
+        if extra_markup:
+            out.insert(len(out) - 1, extra_markup)
+        return "".join(out)
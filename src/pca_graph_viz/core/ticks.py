@@ -0,0 +1,38 @@
+"""Adaptive "nice numbers" tick generation for grids.
+
+Grids used to get one line per integer over the whole domain, so a domain of
+±10,000 produced tens of thousands of elements. ``tick_values`` picks a step
+from the 1-2-5 sequence (1, 2, 5, 10, 20, 50, ...) so that at most
+``max_ticks`` intervals fit in the range, and never goes below ``min_step``
+(1 by default, which keeps the historical integer grid for small domains).
+"""
+
+import math
+
+import numpy as np
+
+# Upper bound on the number of grid intervals per orientation
+DEFAULT_MAX_TICKS = 40
+
+
+def nice_step(span, max_ticks=DEFAULT_MAX_TICKS, min_step=1.0):
+    """Smallest step from the 1-2-5 sequence giving at most `max_ticks` intervals over `span`."""
+    if not math.isfinite(span) or span <= 0 or max_ticks < 1:
+        return min_step
+    raw = span / max_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        step = factor * magnitude
+        if step >= raw:
+            break
+    return max(step, min_step)
+
+
+def tick_values(v_min, v_max, max_ticks=DEFAULT_MAX_TICKS, min_step=1.0):
+    """Multiples of the nice step lying in [v_min, v_max], as a float array."""
+    if not (math.isfinite(v_min) and math.isfinite(v_max)) or v_max < v_min:
+        return np.array([], dtype=float)
+    step = nice_step(v_max - v_min, max_ticks, min_step)
+    first = math.ceil(v_min / step)
+    last = math.floor(v_max / step)
+    return np.arange(first, last + 1, dtype=float) * step
@@ -1,8 +1,68 @@
-"""Data models for lines, curves, and foreign objects."""
+"""Data models for lines, curves, and foreign objects.
 
-from .line_model import Line, LineType
-from .curve_model import CurveDefinition
-from .line_object import LineObject
-from .foreign_object import ForeignObject
+Attributes are loaded lazily (PEP 562): the pydantic models (`LineObject`,
+`ForeignObject`) import pydantic only when first accessed. `Line` is a
+slotted record and never imports pydantic.
+"""
 
-__all__ = ["Line", "LineType", "CurveDefinition", "LineObject", "ForeignObject"]
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> (submodule, attribute)
+_LAZY_ATTRIBUTES = {
+    "Line": (".line_model", "Line"),
+    "LineType": (".line_model", "LineType"),
+    "CurveDefinition": (".curve_model", "CurveDefinition"),
+    "LineObject": (".pydantic_models", "Line"),
+    "ForeignObject": (".pydantic_models", "ForeignObject"),
+    # Slotted records and bulk validation
+    "LineRecord": (".records", "LineRecord"),
+    "ForeignObjectRecord": (".records", "ForeignObjectRecord"),
+    "validate_line_dicts": (".records", "validate_line_dicts"),
+    "validate_foreign_object_dicts": (".records", "validate_foreign_object_dicts"),
+    "set_debug_validation": (".records", "set_debug_validation"),
+    "get_debug_validation": (".records", "get_debug_validation"),
+}
+
+if TYPE_CHECKING:
+    from .curve_model import CurveDefinition
+    from .line_model import Line, LineType
+    from .pydantic_models import ForeignObject
+    from .pydantic_models import Line as LineObject
+    from .records import (
+        ForeignObjectRecord,
+        LineRecord,
+        get_debug_validation,
+        set_debug_validation,
+        validate_foreign_object_dicts,
+        validate_line_dicts,
+    )
+
+__all__ = [
+    "Line",
+    "LineType",
+    "CurveDefinition",
+    "LineObject",
+    "ForeignObject",
+    # Slotted records and bulk validation
+    "LineRecord",
+    "ForeignObjectRecord",
+    "validate_line_dicts",
+    "validate_foreign_object_dicts",
+    "set_debug_validation",
+    "get_debug_validation",
+]
+
+
+def __getattr__(name):
+    """Import public attributes from their submodule on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(module, __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
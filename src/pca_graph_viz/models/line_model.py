@@ -1,7 +1,16 @@
-from pydantic import BaseModel
-from typing import Optional
+"""
+Line model of the graph dicts: a slotted record with a line type
+
+`Line` is a `records.LineRecord` (no pydantic import, so it can be used in
+Pyodide without pydantic) with the defaults of the graph dicts and a `type`:
+axis lines get arrow markers. The pydantic variant, with full validation,
+is `pydantic_models.TypedLine`.
+"""
+
 from enum import Enum
 
+from .records import LineRecord
+
 
 class LineType(str, Enum):
     """Type of line to draw"""
@@ -10,26 +19,25 @@ class LineType(str, Enum):
     AXIS = "axis"
 
 
-class Line(BaseModel):
-    """Pydantic model for a line in SVG graphs"""
+class Line(LineRecord):
+    """Line in SVG graphs (see pydantic_models.TypedLine for the pydantic model)"""
 
-    x1: float
-    y1: float
-    x2: float
-    y2: float
-    stroke: str
-    stroke_width: float = 2.0
-    stroke_opacity: Optional[float] = None
-    stroke_dasharray: Optional[str] = None
-    class_: Optional[str] = None  # 'class' is reserved, so use 'class_'
-    id: Optional[str] = None
-    style: Optional[str] = None
-    type: LineType = LineType.CURVE  # Default to curve (no arrows)
+    __slots__ = ("type",)
 
-    class Config:
-        # Allow using 'class' as field name in dict input
-        fields = {"class_": "class"}
-        use_enum_values = True  # This allows string values to be used
+    def __init__(
+        self,
+        x1=None,
+        y1=None,
+        x2=None,
+        y2=None,
+        stroke="black",
+        stroke_width=2.0,
+        type=LineType.CURVE,
+        **attributes,
+    ):
+        super().__init__(x1, y1, x2, y2, stroke, stroke_width, **attributes)
+        # Stored as the plain string, as with pydantic's use_enum_values
+        self.type = LineType(type).value
 
 
 # Example usage:
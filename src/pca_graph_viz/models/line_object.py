@@ -1,120 +1,32 @@
 """
-Line model for SVG lines using Pydantic validation
+Line elements for SVG graphs
+
+Lines are `LineRecord` instances (see records.py). The pydantic `Line` model
+is still importable from here but is only loaded on first access; with
+`set_debug_validation(True)` the helpers below return pydantic models.
 """
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Any
 
+from .records import LineRecord, get_debug_validation, validate_line_dicts
 
-class Line(BaseModel):
-    """
-    Model for SVG line elements with exact SVG attributes.
 
-    Coordinates can be in data space and will be transformed to SVG space.
-    """
+def __getattr__(name):
+    """Load the pydantic `Line` model on first access."""
+    if name == "Line":
+        from .pydantic_models import Line
+
+        return Line
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # Line endpoints (required)
-    x1: float = Field(..., description="Start X coordinate in data space")
-    y1: float = Field(..., description="Start Y coordinate in data space")
-    x2: float = Field(..., description="End X coordinate in data space")
-    y2: float = Field(..., description="End Y coordinate in data space")
-
-    # SVG line attributes
-    stroke: str = Field(default="black", description="Stroke color")
-    stroke_width: float = Field(default=1, description="Stroke width")
-    stroke_opacity: Optional[float] = Field(
-        default=None, ge=0, le=1, description="Stroke opacity (0-1)"
-    )
-    stroke_dasharray: Optional[str] = Field(default=None, description="Dash pattern (e.g., '5,5')")
-    stroke_linecap: Optional[str] = Field(
-        default=None, description="Line cap style: butt, round, square"
-    )
-    stroke_linejoin: Optional[str] = Field(
-        default=None, description="Line join style: miter, round, bevel"
-    )
-
-    # Standard SVG attributes
-    id: Optional[str] = Field(default=None, description="Element ID")
-    class_: Optional[str] = Field(default=None, alias="class", description="CSS class names")
-    style: Optional[str] = Field(default=None, description="Inline CSS style")
-    transform: Optional[str] = Field(default=None, description="SVG transform")
-
-    @field_validator("stroke")
-    @classmethod
-    def validate_color(cls, v: str) -> str:
-        """Basic color validation"""
-        if not v:
-            raise ValueError("Stroke color cannot be empty")
-        return v
-
-    @field_validator("stroke_linecap")
-    @classmethod
-    def validate_linecap(cls, v: Optional[str]) -> Optional[str]:
-        """Validate line cap values"""
-        if v and v not in ["butt", "round", "square"]:
-            raise ValueError(f"Invalid stroke-linecap: {v}")
-        return v
-
-    @field_validator("stroke_linejoin")
-    @classmethod
-    def validate_linejoin(cls, v: Optional[str]) -> Optional[str]:
-        """Validate line join values"""
-        if v and v not in ["miter", "round", "bevel"]:
-            raise ValueError(f"Invalid stroke-linejoin: {v}")
-        return v
-
-    def to_svg_line(self, transform_x: callable = None, transform_y: callable = None) -> str:
-        """
-        Generate the SVG line element string.
-
-        Args:
-            transform_x: Optional function to transform x coordinates from data to SVG space
-            transform_y: Optional function to transform y coordinates from data to SVG space
-
-        Returns:
-            XML string for the line element
-        """
-        # Apply coordinate transformation if provided
-        svg_x1 = transform_x(self.x1) if transform_x else self.x1
-        svg_y1 = transform_y(self.y1) if transform_y else self.y1
-        svg_x2 = transform_x(self.x2) if transform_x else self.x2
-        svg_y2 = transform_y(self.y2) if transform_y else self.y2
-
-        # Build attribute string
-        attrs = [
-            f'x1="{svg_x1}"',
-            f'y1="{svg_y1}"',
-            f'x2="{svg_x2}"',
-            f'y2="{svg_y2}"',
-            f'stroke="{self.stroke}"',
-            f'stroke-width="{self.stroke_width}"',
-        ]
-
-        if self.stroke_opacity is not None:
-            attrs.append(f'stroke-opacity="{self.stroke_opacity}"')
-
-        if self.stroke_dasharray:
-            attrs.append(f'stroke-dasharray="{self.stroke_dasharray}"')
-
-        if self.stroke_linecap:
-            attrs.append(f'stroke-linecap="{self.stroke_linecap}"')
-
-        if self.stroke_linejoin:
-            attrs.append(f'stroke-linejoin="{self.stroke_linejoin}"')
-
-        if self.id:
-            attrs.append(f'id="{self.id}"')
-
-        if self.class_:
-            attrs.append(f'class="{self.class_}"')
-
-        if self.style:
-            attrs.append(f'style="{self.style}"')
-
-        if self.transform:
-            attrs.append(f'transform="{self.transform}"')
-
-        return f"<line {' '.join(attrs)} />"
+
+def _debug_models(lines: List[LineRecord]) -> list:
+    """Re-validate records with the pydantic model when debug validation is on."""
+    if not get_debug_validation():
+        return lines
+    from .pydantic_models import Line
+
+    return [Line(**line.dict(by_alias=True)) for line in lines]
 
 
 def create_axis_lines(
@@ -124,7 +36,7 @@ def create_axis_lines(
     y_max: float,
     axes_color: str = "black",
     axes_width: float = 2,
-) -> List[Line]:
+) -> List[LineRecord]:
     """
     Create horizontal and vertical axis lines at y=0 and x=0.
 
@@ -137,16 +49,19 @@ def create_axis_lines(
     Returns:
         List containing x-axis and/or y-axis lines if they're in range
     """
+    # Same coercion as the pydantic model (float fields), so the markup is unchanged
+    x_min, x_max, y_min, y_max = float(x_min), float(x_max), float(y_min), float(y_max)
+    axes_width = float(axes_width)
     lines = []
 
     # X-axis (horizontal line at y=0)
     if y_min <= 0 <= y_max:
         lines.append(
-            Line(
+            LineRecord(
                 x1=x_min,
-                y1=0,
+                y1=0.0,
                 x2=x_max,
-                y2=0,
+                y2=0.0,
                 stroke=axes_color,
                 stroke_width=axes_width,
                 class_="axis x-axis",
@@ -156,10 +71,10 @@ def create_axis_lines(
     # Y-axis (vertical line at x=0)
     if x_min <= 0 <= x_max:
         lines.append(
-            Line(
-                x1=0,
+            LineRecord(
+                x1=0.0,
                 y1=y_min,
-                x2=0,
+                x2=0.0,
                 y2=y_max,
                 stroke=axes_color,
                 stroke_width=axes_width,
@@ -167,7 +82,7 @@ def create_axis_lines(
             )
         )
 
-    return lines
+    return _debug_models(lines)
 
 
 def create_grid_lines(
@@ -179,7 +94,7 @@ def create_grid_lines(
     grid_color: str = "lightgray",
     grid_width: float = 0.5,
     grid_opacity: float = 0.3,
-) -> List[Line]:
+) -> List[LineRecord]:
     """
     Create grid lines.
 
@@ -194,13 +109,16 @@ def create_grid_lines(
     Returns:
         List of grid lines
     """
+    # Same coercion as the pydantic model (float fields), so the markup is unchanged
+    x_min, x_max, y_min, y_max = float(x_min), float(x_max), float(y_min), float(y_max)
+    grid_width, grid_opacity = float(grid_width), float(grid_opacity)
     lines = []
 
     # Vertical grid lines
     for i in range(grid_count + 1):
         x = x_min + i * (x_max - x_min) / grid_count
         lines.append(
-            Line(
+            LineRecord(
                 x1=x,
                 y1=y_min,
                 x2=x,
@@ -216,7 +134,7 @@ def create_grid_lines(
     for i in range(grid_count + 1):
         y = y_min + i * (y_max - y_min) / grid_count
         lines.append(
-            Line(
+            LineRecord(
                 x1=x_min,
                 y1=y,
                 x2=x_max,
@@ -228,17 +146,24 @@ def create_grid_lines(
             )
         )
 
-    return lines
+    return _debug_models(lines)
 
 
-def validate_lines(lines: List[Dict[str, Any]]) -> List[Line]:
+def validate_lines(lines: List[Dict[str, Any]]) -> List[LineRecord]:
     """
     Validate a list of line dictionaries.
 
+    All lines are checked in one pass (see records.validate_line_dicts); in
+    debug mode each line is validated by the pydantic model instead.
+
     Args:
         lines: List of dictionaries with line data
 
     Returns:
-        List of validated Line instances
+        List of validated LineRecord (or pydantic Line) instances
     """
-    return [Line(**line) for line in lines]
+    if get_debug_validation():
+        from .pydantic_models import Line
+
+        return [Line(**line) for line in lines]
+    return validate_line_dicts(lines)
@@ -0,0 +1,232 @@
+"""
+Pydantic models for SVG lines and foreignObjects
+
+Used for full validation in debug mode (see records.set_debug_validation).
+This module is the only place the element models import pydantic; the
+renderer and the default validators work with the slotted records of
+records.py.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from .line_model import LineType
+
+
+class Line(BaseModel):
+    """
+    Model for SVG line elements with exact SVG attributes.
+
+    Coordinates can be in data space and will be transformed to SVG space.
+    """
+
+    # Line endpoints (required)
+    x1: float = Field(..., description="Start X coordinate in data space")
+    y1: float = Field(..., description="Start Y coordinate in data space")
+    x2: float = Field(..., description="End X coordinate in data space")
+    y2: float = Field(..., description="End Y coordinate in data space")
+
+    # SVG line attributes
+    stroke: str = Field(default="black", description="Stroke color")
+    stroke_width: float = Field(default=1, description="Stroke width")
+    stroke_opacity: Optional[float] = Field(
+        default=None, ge=0, le=1, description="Stroke opacity (0-1)"
+    )
+    stroke_dasharray: Optional[str] = Field(default=None, description="Dash pattern (e.g., '5,5')")
+    stroke_linecap: Optional[str] = Field(
+        default=None, description="Line cap style: butt, round, square"
+    )
+    stroke_linejoin: Optional[str] = Field(
+        default=None, description="Line join style: miter, round, bevel"
+    )
+
+    # Standard SVG attributes
+    id: Optional[str] = Field(default=None, description="Element ID")
+    class_: Optional[str] = Field(default=None, alias="class", description="CSS class names")
+    style: Optional[str] = Field(default=None, description="Inline CSS style")
+    transform: Optional[str] = Field(default=None, description="SVG transform")
+
+    @field_validator("stroke")
+    @classmethod
+    def validate_color(cls, v: str) -> str:
+        """Basic color validation"""
+        if not v:
+            raise ValueError("Stroke color cannot be empty")
+        return v
+
+    @field_validator("stroke_linecap")
+    @classmethod
+    def validate_linecap(cls, v: Optional[str]) -> Optional[str]:
+        """Validate line cap values"""
+        if v and v not in ["butt", "round", "square"]:
+            raise ValueError(f"Invalid stroke-linecap: {v}")
+        return v
+
+    @field_validator("stroke_linejoin")
+    @classmethod
+    def validate_linejoin(cls, v: Optional[str]) -> Optional[str]:
+        """Validate line join values"""
+        if v and v not in ["miter", "round", "bevel"]:
+            raise ValueError(f"Invalid stroke-linejoin: {v}")
+        return v
+
+    def to_svg_line(self, transform_x: callable = None, transform_y: callable = None) -> str:
+        """
+        Generate the SVG line element string.
+
+        Args:
+            transform_x: Optional function to transform x coordinates from data to SVG space
+            transform_y: Optional function to transform y coordinates from data to SVG space
+
+        Returns:
+            XML string for the line element
+        """
+        # Apply coordinate transformation if provided
+        svg_x1 = transform_x(self.x1) if transform_x else self.x1
+        svg_y1 = transform_y(self.y1) if transform_y else self.y1
+        svg_x2 = transform_x(self.x2) if transform_x else self.x2
+        svg_y2 = transform_y(self.y2) if transform_y else self.y2
+
+        # Build attribute string
+        attrs = [
+            f'x1="{svg_x1}"',
+            f'y1="{svg_y1}"',
+            f'x2="{svg_x2}"',
+            f'y2="{svg_y2}"',
+            f'stroke="{self.stroke}"',
+            f'stroke-width="{self.stroke_width}"',
+        ]
+
+        if self.stroke_opacity is not None:
+            attrs.append(f'stroke-opacity="{self.stroke_opacity}"')
+
+        if self.stroke_dasharray:
+            attrs.append(f'stroke-dasharray="{self.stroke_dasharray}"')
+
+        if self.stroke_linecap:
+            attrs.append(f'stroke-linecap="{self.stroke_linecap}"')
+
+        if self.stroke_linejoin:
+            attrs.append(f'stroke-linejoin="{self.stroke_linejoin}"')
+
+        if self.id:
+            attrs.append(f'id="{self.id}"')
+
+        if self.class_:
+            attrs.append(f'class="{self.class_}"')
+
+        if self.style:
+            attrs.append(f'style="{self.style}"')
+
+        if self.transform:
+            attrs.append(f'transform="{self.transform}"')
+
+        return f"<line {' '.join(attrs)} />"
+
+
+class TypedLine(Line):
+    """
+    `Line` with a line type (pydantic variant of line_model.Line).
+
+    Axis lines get arrow markers; curves and reference lines do not.
+    """
+
+    model_config = ConfigDict(use_enum_values=True)
+
+    stroke_width: float = Field(default=2.0, description="Stroke width")
+    type: LineType = Field(default=LineType.CURVE, description="Line type: curve or axis")
+
+
+class ForeignObject(BaseModel):
+    """
+    Model for SVG foreignObject elements containing LaTeX content.
+
+    Uses exact SVG foreignObject attributes plus data attributes for content.
+    """
+
+    # SVG foreignObject positioning attributes (required for our use case)
+    x: float = Field(..., description="X coordinate in SVG space")
+    y: float = Field(..., description="Y coordinate in SVG space")
+
+    # SVG foreignObject dimension attributes
+    width: int = Field(default=80, gt=0, description="Width in pixels")
+    height: int = Field(default=30, gt=0, description="Height in pixels")
+
+    # Standard HTML/SVG attributes
+    id: Optional[str] = Field(default=None, description="Element ID")
+    class_: Optional[str] = Field(default="svg-latex", alias="class", description="CSS class names")
+    style: Optional[str] = Field(default=None, description="Inline CSS style")
+    transform: Optional[str] = Field(default=None, description="SVG transform")
+
+    # Data attributes (custom attributes prefixed with data-)
+    data_latex: str = Field(..., alias="data-latex", description="LaTeX expression to render")
+
+    # Additional rendering options (not HTML attributes)
+    show_point: bool = Field(
+        default=False, description="Show a red dot at the coordinate (helper, not an attribute)"
+    )
+
+    @field_validator("style")
+    @classmethod
+    def validate_style(cls, v: Optional[str]) -> Optional[str]:
+        """Validate CSS style string"""
+        if v is None:
+            return v
+        # Basic validation - should be CSS property: value pairs
+        if v and ":" not in v:
+            raise ValueError(f"Invalid CSS style string: {v}")
+        return v
+
+    @field_validator("class_")
+    @classmethod
+    def validate_class(cls, v: Optional[str]) -> Optional[str]:
+        """Ensure svg-latex is always included in classes"""
+        if v is None:
+            return "svg-latex"
+        if "svg-latex" not in v:
+            return f"svg-latex {v}"
+        return v
+
+    def to_foreign_object_xml(
+        self, transform_x: callable = None, transform_y: callable = None, margin: float = 0
+    ) -> str:
+        """
+        Generate the foreignObject XML string.
+
+        Args:
+            transform_x: Optional function to transform x coordinate from data to SVG space
+            transform_y: Optional function to transform y coordinate from data to SVG space
+            margin: Margin offset to add to coordinates (default 0)
+
+        Returns:
+            XML string for the foreignObject element
+        """
+        # Apply coordinate transformation if provided
+        svg_x = transform_x(self.x) if transform_x else self.x
+        svg_y = transform_y(self.y) if transform_y else self.y
+
+        # Center foreignObject on the point and add margin
+        fo_x = svg_x - self.width / 2 + margin
+        fo_y = svg_y - self.height / 2 + margin
+
+        # Build attribute string
+        attrs = [f'x="{fo_x}"', f'y="{fo_y}"', f'width="{self.width}"', f'height="{self.height}"']
+
+        if self.id:
+            attrs.append(f'id="{self.id}"')
+
+        if self.transform:
+            attrs.append(f'transform="{self.transform}"')
+
+        # Build inner div attributes
+        div_attrs = [
+            'xmlns="http://www.w3.org/1999/xhtml"',
+            f'class="{self.class_}"',
+            f'data-latex="{self.data_latex}"',
+        ]
+
+        if self.style:
+            div_attrs.append(f'style="{self.style}"')
+
+        return f"<foreignObject {' '.join(attrs)}><div {' '.join(div_attrs)}></div></foreignObject>"
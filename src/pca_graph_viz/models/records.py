@@ -0,0 +1,417 @@
+"""
+Lightweight line and foreignObject records with bulk validation
+
+`LineRecord` and `ForeignObjectRecord` hold the same attributes as the
+pydantic `Line` and `ForeignObject` models (see pydantic_models.py) and
+render the same markup, but are plain slotted objects: creating one costs a
+few attribute stores instead of a pydantic validation.
+
+`validate_line_dicts` and `validate_foreign_object_dicts` check a whole list
+of dicts in one pass and report every invalid entry in a single ValueError.
+
+Full pydantic validation is a debug mode (`set_debug_validation(True)`):
+pydantic is only imported when it is enabled, since pydantic-core is slow to
+load in Pyodide.
+"""
+
+# Full pydantic validation instead of the bulk validators
+_debug_validation = False
+
+
+def set_debug_validation(enabled):
+    """Validate elements with the pydantic models (slower, stricter error messages)."""
+    global _debug_validation
+    _debug_validation = bool(enabled)
+
+
+def get_debug_validation():
+    """Return True when elements are validated with the pydantic models."""
+    return _debug_validation
+
+
+class _Record:
+    """Base class for slotted element records; fields are the `__slots__`."""
+
+    __slots__ = ()
+    # Attribute name -> key used in dicts with by_alias=True
+    _aliases = {}
+    # Slots of the record class and of its record bases, in definition order
+    _fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(
+            name for klass in reversed(cls.__mro__) for name in klass.__dict__.get("__slots__", ())
+        )
+
+    def dict(self, by_alias=False):
+        """Return the fields as a dict (same layout as the pydantic model's `dict()`)."""
+        aliases = self._aliases if by_alias else {}
+        return {aliases.get(name, name): getattr(self, name) for name in self._fields}
+
+    model_dump = dict
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class LineRecord(_Record):
+    """SVG line element with endpoints in data space (see pydantic_models.Line)."""
+
+    __slots__ = (
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+        "stroke",
+        "stroke_width",
+        "stroke_opacity",
+        "stroke_dasharray",
+        "stroke_linecap",
+        "stroke_linejoin",
+        "id",
+        "class_",
+        "style",
+        "transform",
+    )
+    _aliases = {"class_": "class"}
+
+    def __init__(
+        self,
+        x1=None,
+        y1=None,
+        x2=None,
+        y2=None,
+        stroke="black",
+        stroke_width=1,
+        stroke_opacity=None,
+        stroke_dasharray=None,
+        stroke_linecap=None,
+        stroke_linejoin=None,
+        id=None,
+        class_=None,
+        style=None,
+        transform=None,
+    ):
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+        self.stroke = stroke
+        self.stroke_width = stroke_width
+        self.stroke_opacity = stroke_opacity
+        self.stroke_dasharray = stroke_dasharray
+        self.stroke_linecap = stroke_linecap
+        self.stroke_linejoin = stroke_linejoin
+        self.id = id
+        self.class_ = class_
+        self.style = style
+        self.transform = transform
+
+    def to_svg_line(self, transform_x=None, transform_y=None):
+        """Generate the SVG line element string (same output as `Line.to_svg_line`)."""
+        svg_x1 = transform_x(self.x1) if transform_x else self.x1
+        svg_y1 = transform_y(self.y1) if transform_y else self.y1
+        svg_x2 = transform_x(self.x2) if transform_x else self.x2
+        svg_y2 = transform_y(self.y2) if transform_y else self.y2
+
+        attrs = [
+            f'x1="{svg_x1}"',
+            f'y1="{svg_y1}"',
+            f'x2="{svg_x2}"',
+            f'y2="{svg_y2}"',
+            f'stroke="{self.stroke}"',
+            f'stroke-width="{self.stroke_width}"',
+        ]
+        if self.stroke_opacity is not None:
+            attrs.append(f'stroke-opacity="{self.stroke_opacity}"')
+        for attribute, value in (
+            ("stroke-dasharray", self.stroke_dasharray),
+            ("stroke-linecap", self.stroke_linecap),
+            ("stroke-linejoin", self.stroke_linejoin),
+            ("id", self.id),
+            ("class", self.class_),
+            ("style", self.style),
+            ("transform", self.transform),
+        ):
+            if value:
+                attrs.append(f'{attribute}="{value}"')
+
+        return f"<line {' '.join(attrs)} />"
+
+
+class ForeignObjectRecord(_Record):
+    """SVG foreignObject holding a LaTeX expression (see pydantic_models.ForeignObject)."""
+
+    __slots__ = (
+        "x",
+        "y",
+        "width",
+        "height",
+        "id",
+        "class_",
+        "style",
+        "transform",
+        "data_latex",
+        "show_point",
+    )
+    _aliases = {"class_": "class", "data_latex": "data-latex"}
+
+    def __init__(
+        self,
+        x=None,
+        y=None,
+        width=80,
+        height=30,
+        id=None,
+        class_="svg-latex",
+        style=None,
+        transform=None,
+        data_latex=None,
+        show_point=False,
+    ):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.id = id
+        self.class_ = class_
+        self.style = style
+        self.transform = transform
+        self.data_latex = data_latex
+        self.show_point = show_point
+
+    def to_foreign_object_xml(self, transform_x=None, transform_y=None, margin=0):
+        """Generate the foreignObject XML string (same output as the pydantic model)."""
+        svg_x = transform_x(self.x) if transform_x else self.x
+        svg_y = transform_y(self.y) if transform_y else self.y
+
+        # Center foreignObject on the point and add margin
+        fo_x = svg_x - self.width / 2 + margin
+        fo_y = svg_y - self.height / 2 + margin
+
+        attrs = [f'x="{fo_x}"', f'y="{fo_y}"', f'width="{self.width}"', f'height="{self.height}"']
+        if self.id:
+            attrs.append(f'id="{self.id}"')
+        if self.transform:
+            attrs.append(f'transform="{self.transform}"')
+
+        div_attrs = [
+            'xmlns="http://www.w3.org/1999/xhtml"',
+            f'class="{self.class_}"',
+            f'data-latex="{self.data_latex}"',
+        ]
+        if self.style:
+            div_attrs.append(f'style="{self.style}"')
+
+        return f"<foreignObject {' '.join(attrs)}><div {' '.join(div_attrs)}></div></foreignObject>"
+
+
+# Field checks: each returns the converted value or raises ValueError/TypeError
+
+
+def _number(value):
+    if isinstance(value, bool) or value is None:
+        raise TypeError("must be a number")
+    return float(value)
+
+
+def _positive_int(value):
+    if isinstance(value, bool) or value is None:
+        raise TypeError("must be an integer")
+    number = float(value)
+    if number != int(number):
+        raise ValueError("must be an integer")
+    if number <= 0:
+        raise ValueError("must be greater than 0")
+    return int(number)
+
+
+def _optional_string(value):
+    if value is not None and not isinstance(value, str):
+        raise TypeError("must be a string")
+    return value
+
+
+def _string(value):
+    if not isinstance(value, str):
+        raise TypeError("must be a string")
+    return value
+
+
+def _color(value):
+    if not _string(value):
+        raise ValueError("stroke color cannot be empty")
+    return value
+
+
+def _opacity(value):
+    if value is None:
+        return None
+    value = _number(value)
+    if not 0 <= value <= 1:
+        raise ValueError("must be between 0 and 1")
+    return value
+
+
+def _choice(*allowed):
+    def check(value):
+        if value and value not in allowed:
+            raise ValueError(f"must be one of {', '.join(allowed)}")
+        return _optional_string(value)
+
+    return check
+
+
+def _style(value):
+    if value and ":" not in _string(value):
+        raise ValueError(f"invalid CSS style string: {value}")
+    return value
+
+
+def _latex_class(value):
+    """Ensure svg-latex is always included in the classes"""
+    if value is None:
+        return "svg-latex"
+    if "svg-latex" not in _string(value):
+        return f"svg-latex {value}"
+    return value
+
+
+# (attribute, dict keys accepted for it, check, required)
+_LINE_FIELDS = (
+    ("x1", ("x1",), _number, True),
+    ("y1", ("y1",), _number, True),
+    ("x2", ("x2",), _number, True),
+    ("y2", ("y2",), _number, True),
+    ("stroke", ("stroke",), _color, False),
+    ("stroke_width", ("stroke_width",), _number, False),
+    ("stroke_opacity", ("stroke_opacity",), _opacity, False),
+    ("stroke_dasharray", ("stroke_dasharray",), _optional_string, False),
+    ("stroke_linecap", ("stroke_linecap",), _choice("butt", "round", "square"), False),
+    ("stroke_linejoin", ("stroke_linejoin",), _choice("miter", "round", "bevel"), False),
+    ("id", ("id",), _optional_string, False),
+    ("class_", ("class", "class_"), _optional_string, False),
+    ("style", ("style",), _optional_string, False),
+    ("transform", ("transform",), _optional_string, False),
+)
+
+_FOREIGN_OBJECT_FIELDS = (
+    ("x", ("x",), _number, True),
+    ("y", ("y",), _number, True),
+    ("width", ("width",), _positive_int, False),
+    ("height", ("height",), _positive_int, False),
+    ("id", ("id",), _optional_string, False),
+    ("class_", ("class", "class_"), _latex_class, False),
+    ("style", ("style",), _style, False),
+    ("transform", ("transform",), _optional_string, False),
+    ("data_latex", ("data-latex", "data_latex", "latex"), _string, True),
+    ("show_point", ("show_point",), bool, False),
+)
+
+# Old foreignObject format with separate style properties -> CSS property
+_LEGACY_STYLE_KEYS = {
+    "bg_color": "background-color",
+    "text_color": "color",
+    "border_radius": "border-radius",
+    "font_weight": "font-weight",
+    "font_size": "font-size",
+    "padding": "padding",
+}
+
+
+def _compile_schema(fields):
+    """Index a field table by dict key: ({key: (attribute, check, label)}, required keys)."""
+    by_key = {}
+    required = []
+    for name, keys, check, is_required in fields:
+        for key in keys:
+            by_key[key] = (name, check, keys[0])
+        if is_required:
+            required.append(keys)
+    return by_key, tuple(required)
+
+
+_LINE_SCHEMA = _compile_schema(_LINE_FIELDS)
+_FOREIGN_OBJECT_SCHEMA = _compile_schema(_FOREIGN_OBJECT_FIELDS)
+
+
+def _validate_dicts(items, record_class, schema, kind):
+    """Build records from `items` in one pass, collecting every error before raising."""
+    by_key, required = schema
+    records = []
+    errors = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            errors.append(f"[{index}] expected a dict, got {type(item).__name__}")
+            continue
+        # Only the keys present are checked; defaults come from the record's __init__
+        values = {}
+        for key, value in item.items():
+            field = by_key.get(key)
+            if field is None:
+                continue
+            name, check, label = field
+            try:
+                values[name] = check(value)
+            except (TypeError, ValueError, OverflowError) as error:
+                errors.append(f"[{index}] {label}: {error}")
+        for keys in required:
+            for key in keys:
+                if key in item:
+                    break
+            else:
+                errors.append(f"[{index}] {keys[0]}: field required")
+        records.append(record_class(**values))
+
+    if errors:
+        raise ValueError(f"{len(errors)} invalid {kind} field(s):\n  " + "\n  ".join(errors))
+    return records
+
+
+def validate_line_dicts(lines):
+    """Validate a list of line dicts and return LineRecord instances.
+
+    Raises:
+        ValueError: listing every invalid field of every line
+    """
+    return _validate_dicts(lines, LineRecord, _LINE_SCHEMA, "line")
+
+
+def normalize_foreign_object_dict(obj):
+    """Convert the old format (bg_color, text_color, ...) to a `style` string.
+
+    Returns a new dict; dicts in the current format are returned unchanged.
+    """
+    if not any(key in obj for key in _LEGACY_STYLE_KEYS if key != "font_size"):
+        return obj
+    style_parts = [f"{css}: {obj[key]}" for key, css in _LEGACY_STYLE_KEYS.items() if obj.get(key)]
+    return {
+        "x": obj["x"],
+        "y": obj["y"],
+        "data-latex": obj.get("latex", obj.get("data-latex", "")),
+        "width": obj.get("width", 80),
+        "height": obj.get("height", 30),
+        "style": "; ".join(style_parts) if style_parts else None,
+        "show_point": obj.get("show_point", False),
+    }
+
+
+def validate_foreign_object_dicts(objects):
+    """Validate a list of foreignObject dicts and return ForeignObjectRecord instances.
+
+    Handles both the old format (with separate style properties) and the new one.
+
+    Raises:
+        ValueError: listing every invalid field of every object
+    """
+    objects = [
+        normalize_foreign_object_dict(obj) if isinstance(obj, dict) else obj for obj in objects
+    ]
+    return _validate_dicts(objects, ForeignObjectRecord, _FOREIGN_OBJECT_SCHEMA, "foreignObject")
@@ -0,0 +1,337 @@
+"""Pre-render a parameterized graph over a grid of parameter values.
+
+The parameterized graphs (``spe_sujet1_auto_07``, ``08`` and the ``10``
+parabolas) are rendered in the browser each time a slider moves. Sliders
+move in fixed steps, so their values form a grid that can be rendered once
+at build time::
+
+    python -m pca_graph_viz.sweep spe_sujet1_auto_08_question_small \\
+        --param a_affine=-3:3:0.25 --param b_affine=-5:5:0.5 --out build/sweeps
+
+Each ``--param`` is ``name=start:stop:step`` (both ends included) or
+``name=value``; names are ``get_graph_dict`` keywords (``a_affine``) or the
+globals of the JS loader (``A_FLOAT_FOR_AFFINE_LINE``), and every parameter
+of the module must be given. The grid is written to one archive,
+``<module>.sweep.json``::
+
+    {"module": ..., "renderer": "<hash of the renderer sources>", "source_hash": ...,
+     "params": [{"name": "a_affine", "global": "A_FLOAT_FOR_AFFINE_LINE",
+                 "start": -3, "step": 0.25, "count": 25}, ...],
+     "index": [0, 1, 1, ...],
+     "head": "<svg ...", "tail": "...</svg>", "svgs": ["<path d=...", ...]}
+
+``index`` holds one SVG id per grid point in row-major order (-1 for a
+point that failed to render). Identical SVGs are stored once, and without
+the markup all of them share (``head``, ``tail``): the SVG with id ``i``
+is ``head + svgs[i] + tail``. For the parabolas, whose grid, axes and
+curve do not move, that leaves a few dozen bytes per SVG. No keys
+are stored: the position of a parameter tuple follows from the starts and
+steps of the axes (``lookup`` here, ``PCAGraphLoader.lookupSweep`` in the
+browser), and values off the grid are left to Python.
+
+Grid values are quantized to their step, and integral values are passed as
+ints, like the JSON numbers sent by the JS loader, so an archived SVG is
+byte-identical to the one the browser would render for the same values.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .build import GRAPHS_PACKAGE, graph_hash, renderer_hash
+
+DEFAULT_OUT_DIR = os.path.join("build", "sweeps")
+
+ARCHIVE_SUFFIX = ".sweep.json"
+
+# Graphs built and rendered per block, bounding the dicts held in memory
+BLOCK_SIZE = 256
+
+# Grid values are rounded to this many decimals, so that start + i * step is
+# the value a slider shows (0.3, not 0.30000000000000004)
+_DECIMALS = 10
+
+# Distance to the nearest grid value (in steps) still accepted by lookups
+_TOLERANCE = 1e-6
+
+
+def parse_param(spec):
+    """Parse ``name=start:stop:step`` or ``name=value``.
+
+    Returns:
+        tuple: (name, start, stop, step); a single value has a step of 1
+    """
+    name, sep, values = spec.partition("=")
+    parts = values.split(":")
+    if not sep or not name or len(parts) not in (1, 3):
+        raise ValueError(f"Expected name=start:stop:step or name=value, got {spec!r}")
+    try:
+        numbers = [float(part) for part in parts]
+    except ValueError:
+        raise ValueError(f"Non-numeric values in {spec!r}") from None
+    if len(numbers) == 1:
+        return name, numbers[0], numbers[0], 1.0
+    start, stop, step = numbers
+    if step <= 0 or stop < start:
+        raise ValueError(f"Expected start <= stop and a positive step in {spec!r}")
+    return name, start, stop, step
+
+
+def _number(value):
+    """A grid value as the JSON number the JS loader sends (ints when integral)."""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def grid_axes(params):
+    """Quantized values of each parameter axis.
+
+    Args:
+        params: List of (name, start, stop, step)
+
+    Returns:
+        list: One 1-D float array per parameter
+    """
+    axes = []
+    for _, start, stop, step in params:
+        count = int(math.floor((stop - start) / step + _TOLERANCE)) + 1
+        axes.append(np.round(start + step * np.arange(count), _DECIMALS))
+    return axes
+
+
+def grid_points(axes):
+    """Every combination of the axis values, as an (n_points, n_params) array in row-major order."""
+    mesh = np.meshgrid(*axes, indexing="ij")
+    return np.stack(mesh, axis=-1).reshape(-1, len(axes))
+
+
+def _check_params(module_name, names):
+    """Raise ValueError unless `names` are exactly the parameters of the module."""
+    import inspect
+
+    from .core.nagini_adapter import get_graph_module
+
+    # Import the real graphs package before the adapter registers its
+    # Pyodide stand-in (whose path is relative to the working directory)
+    importlib.import_module(GRAPHS_PACKAGE)
+    module = get_graph_module(module_name)
+    accepted = set(inspect.signature(module.get_graph_dict).parameters)
+    unknown = sorted(set(names) - accepted)
+    if unknown:
+        raise ValueError(f"{module_name}.get_graph_dict takes no parameter {unknown}")
+    missing = sorted(accepted - set(names))
+    if missing:
+        raise ValueError(f"No values given for {module_name} parameters {missing}")
+
+
+def _shared_ends(svgs):
+    """(head, tail): the longest prefix and suffix of all `svgs` that do not overlap."""
+    if not svgs:
+        return "", ""
+    head = os.path.commonprefix(svgs)
+    tail = os.path.commonprefix([svg[len(head) :][::-1] for svg in svgs])[::-1]
+    return head, tail
+
+
+def sweep(module_name, params, jobs=1, log=print):
+    """Render `module_name` at every point of a parameter grid.
+
+    Args:
+        module_name: Graph module of ``tests/graphs``
+        params: List of (name, start, stop, step) (see `parse_param`)
+        jobs: Worker processes (None = CPU count, 1 = render in this process)
+        log: Callable receiving progress messages (None for silence)
+
+    Returns:
+        dict: The archive (see the module docstring)
+    """
+    from .core.batch_render import render_many
+    from .core.nagini_adapter import (
+        PARAMETER_GLOBALS,
+        _with_default_margin,
+        get_graph_dict,
+        normalize_params,
+    )
+
+    names = [name for name, *_ in params]
+    keywords = list(normalize_params(dict.fromkeys(names, 0)))
+    if len(keywords) != len(names):
+        raise ValueError(f"Parameters given twice: {names}")
+    params = [(keyword, *rest) for keyword, (_, *rest) in zip(keywords, params)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        _check_params(module_name, keywords)
+
+    axes = grid_axes(params)
+    points = grid_points(axes)
+    svg_ids = {}
+    index = np.full(len(points), -1, dtype=np.int64)
+    failed = []
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs != 1 else None
+    try:
+        for start in range(0, len(points), BLOCK_SIZE):
+            block = [
+                dict(zip(keywords, map(_number, point)))
+                for point in points[start : start + BLOCK_SIZE]
+            ]
+            graph_dicts = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for values in block:
+                    try:
+                        graph_dict = get_graph_dict(module_name, values, memoize=False)
+                    except Exception as e:
+                        graph_dict = e
+                    graph_dicts.append(graph_dict)
+            rendered = iter(
+                render_many(
+                    [_with_default_margin(g) for g in graph_dicts if isinstance(g, dict)],
+                    executor=executor,
+                )
+            )
+            for offset, (values, graph_dict) in enumerate(zip(block, graph_dicts)):
+                if isinstance(graph_dict, dict):
+                    result = next(rendered)
+                else:
+                    result = {"error": f"{type(graph_dict).__name__}: {graph_dict}"}
+                if "svg" in result:
+                    index[start + offset] = svg_ids.setdefault(result["svg"], len(svg_ids))
+                else:
+                    failed.append((values, result["error"]))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    svgs = list(svg_ids)
+    head, tail = _shared_ends(svgs)
+    archive = {
+        "module": module_name,
+        "renderer": renderer_hash(),
+        "source_hash": graph_hash(module_name),
+        "params": [
+            {
+                "name": keyword,
+                "global": PARAMETER_GLOBALS.get(keyword),
+                "start": _number(axis[0]),
+                "step": _number(step),
+                "count": len(axis),
+            }
+            for (keyword, _, _, step), axis in zip(params, axes)
+        ],
+        "index": index.tolist(),
+        "head": head,
+        "tail": tail,
+        "svgs": [svg[len(head) : len(svg) - len(tail)] for svg in svgs],
+    }
+    if log is not None:
+        for values, error in failed:
+            log(f"{values}: {error}")
+        log(
+            f"{module_name}: {len(points)} grid points, {len(svg_ids)} distinct SVGs, "
+            f"failed {len(failed)}"
+        )
+    return archive
+
+
+def archive_path(out_dir, module_name):
+    """Path of the archive of `module_name` in `out_dir`."""
+    return os.path.join(out_dir, module_name + ARCHIVE_SUFFIX)
+
+
+def write_archive(archive, out_dir=DEFAULT_OUT_DIR):
+    """Write `archive` to ``<out_dir>/<module>.sweep.json``; return the path."""
+    os.makedirs(out_dir, exist_ok=True)
+    path = archive_path(out_dir, archive["module"])
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(archive, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+    return path
+
+
+def load_archive(path):
+    """Read an archive written by `write_archive`."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def lookup_ids(archive, values):
+    """SVG ids of parameter tuples, -1 for tuples off the grid or that failed.
+
+    Args:
+        archive: A sweep archive
+        values: Array-like of shape (..., n_params), in the order of ``archive["params"]``
+
+    Returns:
+        np.ndarray: Integer ids of shape ``values.shape[:-1]``
+    """
+    params = archive["params"]
+    values = np.asarray(values, dtype=float)
+    starts = np.array([param["start"] for param in params], dtype=float)
+    steps = np.array([param["step"] for param in params], dtype=float)
+    counts = np.array([param["count"] for param in params])
+    with np.errstate(invalid="ignore"):
+        raw = (values - starts) / steps
+        positions = np.rint(raw)
+        on_grid = (np.abs(raw - positions) <= _TOLERANCE) & (positions >= 0) & (positions < counts)
+    on_grid = on_grid.all(axis=-1)
+    strides = np.cumprod(np.concatenate([[1], counts[:0:-1]]))[::-1]
+    flat = (np.where(on_grid[..., None], positions, 0).astype(np.int64) * strides).sum(axis=-1)
+    return np.where(on_grid, np.asarray(archive["index"], dtype=np.int64)[flat], -1)
+
+
+def lookup(archive, params):
+    """Pre-rendered SVG of one parameter set, or None when it is not in the archive.
+
+    Args:
+        archive: A sweep archive
+        params: Dict of parameter values, by keyword or JS loader global name
+
+    Returns:
+        str or None
+    """
+    from .core.nagini_adapter import normalize_params
+
+    given = normalize_params(params)
+    try:
+        values = [given[param["name"]] for param in archive["params"]]
+    except KeyError:
+        return None
+    svg_id = int(lookup_ids(archive, values))
+    if svg_id < 0:
+        return None
+    return archive["head"] + archive["svgs"][svg_id] + archive["tail"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m pca_graph_viz.sweep",
+        description="Pre-render a parameterized graph over a parameter grid.",
+    )
+    parser.add_argument("module", help="graph module, e.g. spe_sujet1_auto_08_question_small")
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=START:STOP:STEP",
+        help="grid of one parameter (repeat for each parameter)",
+    )
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (default: 1)")
+    args = parser.parse_args(argv)
+    try:
+        params = [parse_param(spec) for spec in args.param]
+        archive = sweep(args.module, params, args.jobs)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    print(f"-> {write_archive(archive, args.out)}")
+    return 1 if -1 in archive["index"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
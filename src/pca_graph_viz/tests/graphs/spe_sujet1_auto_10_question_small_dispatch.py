@@ -266,6 +266,7 @@ def generate_parabola_graph(
             "stroke-width": 2,
             "fill": "none",
             "class": "curve stroke-base-content",
+            "variable": True,
         }
     )
 
@@ -278,6 +279,7 @@ def generate_parabola_graph(
             "r": 4,
             "class": "fill-base-content",
             "stroke": "none",
+            "variable": True,
         }
     )
 
@@ -314,10 +316,14 @@ def generate_parabola_graph(
             "height": 20,
             "class": "svg-latex text-base-content text-xs",
             "style": "background: rgba(255, 255, 255, 0.8); padding: 1px 2px; border-radius: var(--radius-box, 4px);",
+            "variable": True,
         },
     ]
 
     return {
+        # Graphs of the same configuration share their axes and labels; the
+        # elements marked "variable" are re-rendered (see core/families.py)
+        "family": "spe_sujet1_auto_10_parabola",
         "id": f"parabola_sign_{parabola_sign}_a_{int(a_shift)}_small",
         "title": filename,
         "description": f"Parabola y = {'x^2' if parabola_sign == 1 else '-x^2'} + a with a={a_shift}",
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for rendering many graph dicts in one call."""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core import render_many
+from pca_graph_viz.core.nagini_adapter import render_graphs
+from pca_graph_viz.core.render_cache import render_cache
+
+
+def _graph(slope):
+    x = np.linspace(-2, 2, 50)
+    return {
+        "svg": {"width": 120},
+        "domain": {"x_min": -2, "x_max": 2, "y_min": -4, "y_max": 4},
+        "settings": {"show_axes": True},
+        "lines": [{"type": "curve", "data": {"x": x.tolist(), "y": (slope * x).tolist()}}],
+    }
+
+
+# A polynomial needs an interval or a domain
+BROKEN = {"lines": [{"type": "polynomial", "coefficients": [0, 1]}]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    render_cache.clear()
+    yield
+    render_cache.clear()
+
+
+@pytest.mark.parametrize("backend", ["svgwrite", "string"])
+def test_results_match_single_renders(backend):
+    graphs = [_graph(0.5), _graph(1.0), _graph(0.5)]
+    expected = [graph_from_dict(graph, backend, cache=False) for graph in graphs]
+    assert render_many(graphs, backend=backend) == [{"svg": svg} for svg in expected]
+    # Identical dicts are rendered once and every result lands in the cache
+    assert len(render_cache) == 2
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor_keeps_order_and_isolates_errors(executor_class):
+    graphs = [_graph(slope) for slope in (0.25, 0.5, 1.0, 2.0)]
+    graphs.insert(2, BROKEN)
+    with executor_class(max_workers=2) as executor:
+        results = render_many(graphs, executor=executor, chunk_size=2)
+    assert [("svg" in result) for result in results] == [True, True, False, True, True]
+    assert results[2]["error"] and "Traceback" in results[2]["traceback"]
+    assert results[3]["svg"] == graph_from_dict(graphs[3], cache=False)
+
+
+def test_shared_markers_are_per_thread():
+    from pca_graph_viz.core import svg_utils
+
+    with svg_utils.shared_markers():
+        assert svg_utils._shared_markers.markers == {}
+        graph_from_dict(_graph(1.0), cache=False)
+        assert svg_utils._shared_markers.markers
+        # Renders in other threads neither see nor reset this thread's markers
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            seen = executor.submit(lambda: getattr(svg_utils._shared_markers, "markers", None))
+            assert seen.result() is None
+            executor.submit(render_many, [_graph(2.0)]).result()
+        assert svg_utils._shared_markers.markers
+    assert svg_utils._shared_markers.markers is None
+
+
+def test_unpicklable_dicts_fail_alone():
+    graphs = [_graph(1.0), {**_graph(2.0), "title": lambda: None}]
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        results = render_many(graphs, executor=executor, chunk_size=1)
+    assert "svg" in results[0]
+    assert "error" in results[1]
+
+
+def test_adapter_render_graphs():
+    results = render_graphs([_graph(1.0), BROKEN])
+    # Same default margin as render_graph
+    expected = graph_from_dict({**_graph(1.0), "settings": {"show_axes": True, "margin": 16}})
+    assert results[0] == {"svg": expected}
+    assert "interval" in results[1]["error"]
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for columnar line batches and the automatic batching of plain lines."""
+
+import re
+
+import numpy as np
+import pytest
+
+from pca_graph_viz.core.batching import (
+    LINE_BATCH_TYPE,
+    batch_lines,
+    batch_path_data,
+    batch_style_key,
+    line_batch,
+)
+from pca_graph_viz.core.path_encoder import encode_segments
+from pca_graph_viz.core.svg_utils import graph_from_dict
+
+
+def plain_line(x1, y1, x2, y2, **style):
+    style.setdefault("stroke-width", 1)
+    style.setdefault("class", "stroke-base-content")
+    return {"type": "line", "x1": x1, "y1": y1, "x2": x2, "y2": y2, **style}
+
+
+def graph(lines, **settings):
+    return {
+        "svg": {"width": 200, "height": 200},
+        "domain": {"x_min": -5, "x_max": 5, "y_min": -5, "y_max": 5},
+        "settings": {"show_axes": False, "show_grid": False, **settings},
+        "lines": lines,
+    }
+
+
+def path_data(svg, class_name):
+    match = re.search(rf'<path class="{class_name}" d="([^"]*)"', svg)
+    return match.group(1) if match else None
+
+
+def test_encode_segments():
+    assert encode_segments([0, 10], [1, 11], [2, 12], [3, 13]) == (
+        "M 0.0,1.0 L 2.0,3.0 M 10.0,11.0 L 12.0,13.0 "
+    )
+    assert encode_segments([0.004], [1.5], [2], [3], precision=2) == "M 0,1.5 L 2,3 "
+    assert encode_segments([], [], [], []) == ""
+
+
+def test_line_batch_helper():
+    batch = line_batch([0, 1], [0, 0], [0, 1], [1, 1], **{"class": "grid"})
+    assert batch["type"] == LINE_BATCH_TYPE
+    assert isinstance(batch["x1"], np.ndarray)
+    assert batch["class"] == "grid"
+    with pytest.raises(ValueError, match="same length"):
+        line_batch([0, 1], [0], [0, 1], [1, 1])
+
+
+def test_batch_style_key():
+    assert batch_style_key(plain_line(0, 0, 1, 1)) == batch_style_key(plain_line(2, 2, 3, 3))
+    assert batch_style_key(plain_line(0, 0, 1, 1)) != batch_style_key(
+        plain_line(0, 0, 1, 1, stroke="red")
+    )
+    # Elements that must keep their own <line>
+    assert batch_style_key(plain_line(0, 0, 1, 1, id="unique")) is None
+    assert batch_style_key(plain_line(0, 0, 1, 1, **{"marker-end": "url(#a)"})) is None
+    assert batch_style_key(plain_line(0, 0, 1, 1, **{"stroke-opacity": 0.5})) is None
+    assert batch_style_key({**plain_line(0, 0, 1, 1), "type": "axis"}) is None
+    assert batch_style_key({"type": "line", "x1": 0, "y1": 0, "x2": 1}) is None
+
+
+def test_batch_lines_merges_adjacent_runs_only():
+    circle = {"type": "circle", "cx": 0, "cy": 0, "r": 1}
+    lines = [
+        plain_line(0, 0, 1, 1),
+        plain_line(1, 1, 2, 2),
+        plain_line(2, 2, 3, 3),
+        circle,
+        plain_line(3, 3, 4, 4),
+        plain_line(4, 4, 5, 5, stroke="red"),
+        plain_line(5, 5, 6, 6, stroke="red"),
+    ]
+    batched = batch_lines(lines)
+    assert [element.get("type") for element in batched] == [
+        LINE_BATCH_TYPE,
+        "circle",
+        "line",
+        LINE_BATCH_TYPE,
+    ]
+    assert batched[0]["x1"] == [0, 1, 2]
+    assert batched[0]["class"] == "stroke-base-content"
+    assert batched[3]["stroke"] == "red"
+    assert batched[2] is lines[4]
+
+
+def test_batch_path_data_clips_and_drops_segments():
+    def identity(values):
+        return values
+
+    batch = line_batch([0, 50, np.nan, 500], [0, 0, 0, 500], [10, 150, 1, 600], [0, 0, 1, 600])
+    d = batch_path_data(batch, identity, identity, clip_rect=(0, 0, 100, 100), precision=2)
+    assert d == "M 0,0 L 10,0 M 50,0 L 100,0 "
+    # Dashed batches are only trimmed at their end
+    dashed = line_batch([-50], [0], [150], [0], **{"stroke-dasharray": "2,2"})
+    d = batch_path_data(dashed, identity, identity, clip_rect=(0, 0, 100, 100), precision=2)
+    assert d == "M -50,0 L 100,0 "
+
+
+def test_graph_draws_batch_as_single_path():
+    batch = line_batch(
+        np.arange(-4, 5), np.full(9, -5), np.arange(-4, 5), np.full(9, 5), **{"class": "grid"}
+    )
+    svg = graph_from_dict(graph([batch]), cache=False)
+    d = path_data(svg, "grid")
+    assert d is not None and d.count("M") == 9
+    assert "<line" not in svg
+
+
+@pytest.mark.parametrize("with_curve", [False, True])
+def test_auto_batching_matches_individual_lines(with_curve):
+    lines = [plain_line(x, -5, x, 5, **{"class": "divider"}) for x in range(-4, 5)]
+    if with_curve:
+        lines.append({"type": "curve", "data": {"x": [-5, 5], "y": [-5, 5]}})
+    separate = graph_from_dict(graph(lines, batch=False), cache=False)
+    batched = graph_from_dict(graph(lines), cache=False)
+    assert separate.count("<line") == 9
+    assert batched.count("<line") == 0
+
+    segments = re.findall(r'x1="([^"]+)" x2="([^"]+)" y1="([^"]+)" y2="([^"]+)"', separate)
+    expected = "".join(f"M {x1},{y1} L {x2},{y2} " for x1, x2, y1, y2 in segments)
+    assert path_data(batched, "divider") == expected
+    assert len(batched) < len(separate)
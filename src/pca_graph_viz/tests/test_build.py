@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for the offline pre-render of the graph catalog."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pca_graph_viz import build as catalog
+from pca_graph_viz.core.nagini_adapter import get_graph_dict
+from pca_graph_viz.core.svg_utils import graph_from_dict
+
+MODULES = ["graph3", "graph_1ere_probabilities_tree_diagram", "spe_sujet1_auto_07_question_small"]
+
+
+def test_build_writes_svgs_and_manifest(tmp_path):
+    logs = []
+    manifest = catalog.build(tmp_path, jobs=2, modules=MODULES, log=logs.append)
+    graphs = manifest["graphs"]
+    assert list(graphs) == sorted(MODULES)
+    assert json.loads((tmp_path / catalog.MANIFEST_NAME).read_text()) == manifest
+
+    entry = graphs["graph_1ere_probabilities_tree_diagram"]
+    assert entry["topic"] == "Probabilities and Conditional Probabilities"
+    svg = (tmp_path / entry["file"]).read_text(encoding="utf-8")
+    assert entry["bytes"] == len(svg.encode("utf-8"))
+    expected = graph_from_dict(get_graph_dict("graph_1ere_probabilities_tree_diagram"))
+    assert svg == expected
+
+    assert graphs["spe_sujet1_auto_07_question_small"] == {
+        "source_hash": graphs["spe_sujet1_auto_07_question_small"]["source_hash"],
+        "topic": None,
+        "parametric": True,
+    }
+    assert logs[-1].startswith("Rendered 2, unchanged 0, parametric 1, failed 0")
+
+
+def test_unchanged_graphs_are_skipped(tmp_path):
+    catalog.build(tmp_path, jobs=1, modules=MODULES, log=None)
+    svg_path = tmp_path / "graph3.svg"
+    os.utime(svg_path, (0, 0))
+
+    logs = []
+    catalog.build(tmp_path, jobs=1, modules=MODULES, log=logs.append)
+    assert logs[-1].startswith("Rendered 0, unchanged 3")
+    assert svg_path.stat().st_mtime == 0
+
+    # A missing output, a renderer change or --force render again
+    os.remove(tmp_path / "graph_1ere_probabilities_tree_diagram.svg")
+    catalog.build(tmp_path, jobs=1, modules=MODULES, log=logs.append)
+    assert logs[-1].startswith("Rendered 1, unchanged 2")
+
+    manifest = json.loads((tmp_path / catalog.MANIFEST_NAME).read_text())
+    manifest["renderer"] = "outdated"
+    (tmp_path / catalog.MANIFEST_NAME).write_text(json.dumps(manifest))
+    catalog.build(tmp_path, jobs=1, modules=["graph3"], log=logs.append)
+    assert logs[-1].startswith("Rendered 1, unchanged 0")
+    # Graphs built by an older renderer are not kept by a partial build
+    assert list(json.loads((tmp_path / catalog.MANIFEST_NAME).read_text())["graphs"]) == ["graph3"]
+
+    catalog.build(tmp_path, jobs=1, modules=["graph3"], force=True, log=logs.append)
+    assert logs[-1].startswith("Rendered 1, unchanged 0")
+    assert svg_path.stat().st_mtime > 0
+
+
+def test_source_hash_covers_imported_graph_modules(tmp_path):
+    sources = catalog.discover_graph_modules()
+    parabola = "spe_sujet1_auto_10_question_small_parabola_a_s1_a_0"
+    dispatch = "spe_sujet1_auto_10_question_small_dispatch"
+    assert catalog._graph_imports(sources[parabola]) == {dispatch}
+    before = catalog.graph_hash(parabola, sources)
+    assert before == catalog.graph_hash(parabola)
+
+    # The parabolas are drawn by the dispatch module: editing it changes their hash
+    edited = tmp_path / f"{dispatch}.py"
+    edited.write_bytes(Path(sources[dispatch]).read_bytes() + b"\n# edited\n")
+    assert catalog.graph_hash(parabola, {**sources, dispatch: str(edited)}) != before
+    assert catalog.graph_hash("graph3", {**sources, dispatch: str(edited)}) == catalog.graph_hash(
+        "graph3", sources
+    )
+
+
+def test_unknown_module(tmp_path):
+    with pytest.raises(ValueError, match="not_a_graph"):
+        catalog.build(tmp_path, modules=["not_a_graph"], log=None)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Tests for viewport clipping of curves and lines."""
+
+import re
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core.clipping import clip_polyline, clip_segments
+
+RECT = (0, 0, 100, 100)
+
+
+def test_clip_segments_liang_barsky():
+    x0, y0 = np.array([-50.0, 10.0, 200.0]), np.array([50.0, 10.0, 200.0])
+    x1, y1 = np.array([150.0, 20.0, 300.0]), np.array([50.0, 20.0, 300.0])
+    t0, t1, visible = clip_segments(x0, y0, x1, y1, RECT)
+    assert visible.tolist() == [True, True, False]
+    assert (t0[0], t1[0]) == (0.25, 0.75)
+    assert (t0[1], t1[1]) == (0.0, 1.0)
+
+
+def test_polyline_inside_is_unchanged():
+    px = np.linspace(1, 99, 50) / 3
+    py = np.sqrt(px)
+    cx, cy, starts = clip_polyline(px, py, RECT)
+    assert np.array_equal(cx, px) and np.array_equal(cy, py)
+    assert starts.tolist() == [True] + [False] * 49
+
+
+def test_polyline_leaving_and_reentering_is_split():
+    px = np.array([10.0, 50.0, 90.0, 90.0, 50.0, 10.0])
+    py = np.array([50.0, 150.0, 50.0, 40.0, -60.0, 40.0])
+    cx, cy, starts = clip_polyline(px, py, RECT)
+    # Leaves through the bottom, re-enters, leaves through the top, re-enters
+    assert starts.sum() == 3
+    assert cx.min() >= 0 and cx.max() <= 100 and cy.min() >= 0 and cy.max() <= 100
+    # Curve re-enters the viewport on the bottom edge
+    assert (cx[2], cy[2]) == (70.0, 100.0)
+
+
+def _graph(lines, **settings):
+    return {
+        "svg": {"width": 100},
+        "settings": settings,
+        "domain": {"x_min": 0, "x_max": 10, "y_min": 0, "y_max": 10},
+        "lines": lines,
+    }
+
+
+def test_asymptotic_curve_is_clipped_into_subpaths():
+    x = np.linspace(0.01, 9.99, 1000)
+    y = 5 + 1 / (x - 5)
+    graph = _graph([{"type": "curve", "data": {"x": x.tolist(), "y": y.tolist()}}])
+    clipped = graph_from_dict(graph)
+    unclipped = graph_from_dict({**graph, "settings": {"clip": False}})
+    assert len(clipped) < len(unclipped)
+    curve = re.search(r'<path class="curve[^>]* d="([^"]*)"', clipped).group(1)
+    # Left branch, the segment jumping across the asymptote, right branch
+    assert curve.count("M") == 3
+    coords = np.array(re.findall(r"-?[0-9.]+", curve), dtype=float)
+    assert coords.min() >= -8 and coords.max() <= 108
+
+
+def test_lines_outside_canvas_are_dropped_or_trimmed():
+    lines = [
+        {"type": "line", "x1": 20, "y1": 20, "x2": 30, "y2": 30, "id": "outside"},
+        {"type": "line", "x1": -100, "y1": 5, "x2": 5, "y2": 5, "id": "trimmed"},
+    ]
+    svg = graph_from_dict(_graph(lines))
+    assert 'id="outside"' not in svg
+    assert 'x1="-8"' in svg and 'x2="50"' in svg
+    assert 'id="outside"' in graph_from_dict(_graph(lines, clip=False))
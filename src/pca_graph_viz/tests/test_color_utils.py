@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized OKLCH conversion and the theme palettes."""
+
+import numpy as np
+import pytest
+
+from pca_graph_viz.core.color_utils import (
+    DAISYUI_COLOR_FALLBACKS,
+    get_color_from_class,
+    oklch_array_to_rgb,
+    oklch_colors,
+    oklch_to_hex,
+    oklch_to_hex_batch,
+    oklch_to_rgb,
+    parse_oklch,
+    theme_palette,
+)
+
+
+def test_batch_matches_scalar_conversion():
+    rng = np.random.default_rng(0)
+    lightness = rng.uniform(0, 1.1, 500)
+    c = rng.uniform(0, 0.4, 500)
+    h = rng.uniform(0, 360, 500)
+    rgb = oklch_array_to_rgb(lightness, c, h)
+    assert rgb.shape == (500, 3)
+    assert rgb.dtype == np.uint8
+    expected = [oklch_to_rgb(*values) for values in zip(lightness, c, h)]
+    assert rgb.tolist() == [list(values) for values in expected]
+
+
+def test_batch_clamps_out_of_gamut_colors():
+    rgb = oklch_array_to_rgb([0.0, 1.2, 0.7], [0.0, 0.0, 0.5], [0.0, 0.0, 150.0])
+    assert rgb[0].tolist() == [0, 0, 0]
+    assert rgb[1].tolist() == [255, 255, 255]
+    assert rgb.min() >= 0 and rgb.max() <= 255
+
+
+def test_hex_batch_keeps_unparseable_strings():
+    colors = ["oklch(45% 0.18 285)", "not a color", "oklch(0.4663 0.2626 340.55)"]
+    result = oklch_to_hex_batch(colors)
+    assert result == [oklch_to_hex(color) for color in colors]
+    assert result[1] == "not a color"
+
+
+@pytest.mark.parametrize("theme", sorted(oklch_colors))
+def test_theme_palette(theme):
+    palette = theme_palette(theme)
+    assert list(palette) == list(oklch_colors[theme])
+    for variable, hex_color in palette.items():
+        assert hex_color == oklch_to_hex(oklch_colors[theme][variable])
+    # Callers get their own copy of the memoized palette
+    palette["--color-primary"] = "#000000"
+    assert theme_palette(theme)["--color-primary"] != "#000000"
+
+
+def test_unknown_theme():
+    with pytest.raises(ValueError, match="Unknown theme"):
+        theme_palette("sunset")
+
+
+def test_daisyui_fallbacks_follow_palette():
+    palette = theme_palette("bolt")
+    assert DAISYUI_COLOR_FALLBACKS["stroke-primary"] == palette["--color-primary"]
+    assert DAISYUI_COLOR_FALLBACKS["fill-base-100"] == palette["--color-base-100"]
+    assert get_color_from_class("opacity-50 text-error") == palette["--color-error"]
+    assert get_color_from_class("stroke-unknown") is None
+    assert parse_oklch("oklch(45% 0.18 285)") == (0.45, 0.18, 285.0)
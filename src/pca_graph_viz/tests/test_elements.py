@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Tests for the element-type registry that draws the lines and shapes of a graph."""
+
+import re
+
+import numpy as np
+import pytest
+
+from pca_graph_viz.core.elements import (
+    ELEMENT_RENDERERS,
+    LINE_OBJECT_TYPE,
+    element_runs,
+    get_element_renderer,
+    register_element,
+    render_lines,
+)
+from pca_graph_viz.core.svg_utils import create_svg_scene, graph_from_dict
+from pca_graph_viz.models.line_object import create_axis_lines
+
+
+def graph(lines, **settings):
+    return {
+        "svg": {"width": 200, "height": 200},
+        "domain": {"x_min": -5, "x_max": 5, "y_min": -5, "y_max": 5},
+        "settings": {"show_axes": False, "show_grid": False, "batch": False, **settings},
+        "lines": lines,
+    }
+
+
+@pytest.fixture
+def cross_renderer():
+    calls = []
+
+    @register_element("cross")
+    def render_crosses(context, crosses):
+        calls.append(len(crosses))
+        for cross in crosses:
+            x, y = context.transform_x(cross["x"]), context.transform_y(cross["y"])
+            context.parent.add(context.drawing.path(d=f"M {x},{y} l 4,4", id=cross["id"]))
+
+    yield calls
+    del ELEMENT_RENDERERS["cross"]
+
+
+def test_element_runs_keep_order():
+    line = {"x1": 0, "y1": 0, "x2": 1, "y2": 1}
+    circle = {"type": "circle", "cx": 0, "cy": 0}
+    record = create_axis_lines(-1, 1, -1, 1)[0]
+    runs = element_runs([line, line, circle, line, record, record])
+    assert [(kind, len(run)) for kind, run in runs] == [
+        ("line", 2),
+        ("circle", 1),
+        ("line", 1),
+        (LINE_OBJECT_TYPE, 2),
+    ]
+
+
+def test_unknown_types_are_drawn_as_lines():
+    assert get_element_renderer("unknown") is render_lines
+    svg = graph_from_dict(graph([{"type": "unknown", "x1": 0, "y1": 0, "x2": 1, "y2": 1}]))
+    assert svg.count("<line") == 1
+
+
+def test_registered_renderer_receives_runs_in_z_order(cross_renderer):
+    lines = [
+        {"type": "cross", "x": 0, "y": 0, "id": "c1"},
+        {"type": "cross", "x": 1, "y": 1, "id": "c2"},
+        {"type": "circle", "cx": 0, "cy": 0, "id": "middle"},
+        {"type": "cross", "x": 2, "y": 2, "id": "c3"},
+    ]
+    svg = graph_from_dict(graph(lines), cache=False)
+    assert cross_renderer == [2, 1]
+    assert re.findall(r'id="(\w+)"', svg) == ["c1", "c2", "middle", "c3"]
+
+
+def test_ticks_are_drawn_as_one_path_per_style():
+    ticks = [
+        {"type": "tick", "x1": x, "y1": -0.2, "x2": x, "y2": 0.2, "class": "stroke-base-content"}
+        for x in range(-4, 5)
+    ]
+    ticks.append({"type": "tick", "x1": 0, "y1": -1, "x2": 0, "y2": 1, "id": "origin"})
+    svg = graph_from_dict(graph(ticks, clip=False))
+    (path_data,) = re.findall(r'<path class="stroke-base-content" d="([^"]*)"', svg)
+    assert path_data.count("M ") == 9
+    assert re.search(r'<line[^>]*id="origin"', svg)
+
+
+def test_scene_and_multi_curve_share_renderers(cross_renderer):
+    lines = [{"type": "cross", "x": 0, "y": 0, "id": "c"}]
+    create_svg_scene([0, 1], [0, 1], lines=lines, backend="string")
+    graph_from_dict(graph(lines), cache=False)
+    assert cross_renderer == [1, 1]
+
+
+def test_data_space_shapes():
+    shapes = [
+        {"type": "rect", "x": -1, "y": 0, "width": 2, "height": -1, "class": "fill-primary"},
+        {"type": "ellipse", "cx": 0, "cy": 0, "rx": 2, "ry": 1},
+        {"type": "polygon", "points": [[0, 0], [1, 2], [2, 0]]},
+        {"type": "polyline", "x": [0, 1, float("nan"), 2, 3], "y": [0, 1, 1, 0, 1]},
+        {"type": "text", "x": 1, "y": 2, "text": "A<B", "text-anchor": "middle"},
+    ]
+    svg = graph_from_dict(graph(shapes), backend="string", cache=False)
+    assert svg == graph_from_dict(graph(shapes), backend="svgwrite", cache=False)
+    # 20 px per data unit; the rect is normalized to a positive size
+    assert re.search(r'<rect class="fill-primary" height="20" [^>]*width="40" x="80" y="100"', svg)
+    assert re.search(r'<ellipse [^>]*cx="100" cy="100" [^>]*rx="40" ry="20"', svg)
+    assert 'd="M 100,100 L 120,60 L 140,100 Z"' in svg
+    assert 'd="M 100,100 L 120,80 M 140,100 L 160,80 "' in svg
+    assert re.search(r'<text [^>]*text-anchor="middle" x="120" y="60">A&lt;B</text>', svg)
+
+
+def test_scene_bounds_include_shapes():
+    shapes = [
+        {"type": "rect", "x": 0, "y": 0, "width": 10, "height": 5},
+        {"type": "text", "x": -10, "y": -5, "text": "corner"},
+    ]
+    svg = create_svg_scene([], [], lines=shapes, size=220, margin=10, backend="string")
+    # Bounds [-10.4, 10.4] x [-5.2, 5.2] once padded by 2%
+    assert re.search(r'<text [^>]*x="3.85" y="196.15"', svg)
+
+
+def test_arcs_use_the_axis_scales():
+    arcs = [
+        {"type": "arc", "cx": 0, "cy": 0, "r": 1, "start": 0, "end": np.pi / 2, "id": "quarter"},
+        {
+            "type": "arc",
+            "cx": 1,
+            "cy": 0,
+            "r": 0.5,
+            "start": 0,
+            "end": 1,
+            "sector": True,
+            "id": "s",
+        },
+        {"type": "arc", "cx": 0, "cy": 0, "r": 2, "start": 0, "end": -2 * np.pi, "id": "turn"},
+        {"type": "arc", "cx": 0, "cy": 0, "r": 1, "class": "stroke-primary"},
+    ]
+    domain = {"x_min": -5, "x_max": 5, "y_min": -2.5, "y_max": 2.5}
+    svg = graph_from_dict({**graph(arcs), "domain": domain}, backend="string", cache=False)
+    paths = {name: d for d, name in re.findall(r'<path [^>]*d="([^"]*)"[^>]*id="(\w+)"', svg)}
+    # 20 px per unit horizontally, 40 px vertically: the circle is an ellipse
+    assert paths["quarter"] == "M 120,100 A 20,40 0 0,0 100,60 "
+    assert paths["s"].startswith("M 120,100 L 130,100 A 10,20 0 0,0 ")
+    assert paths["s"].endswith("Z")
+    # A full clockwise turn is two half-turn arcs
+    assert paths["turn"] == "M 140,100 A 40,80 0 0,1 60,100 A 40,80 0 0,1 140,100 "
+    assert re.search(r'<ellipse class="stroke-primary" cx="100" cy="100" [^>]*rx="20" ry="40"', svg)
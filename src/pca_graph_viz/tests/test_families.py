@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for graph families (static template + re-rendered variable elements)."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core import render_many, svg_utils
+from pca_graph_viz.core.families import family_cache, split_family_member
+from pca_graph_viz.core.nagini_adapter import get_graph_dict
+
+PARABOLA_MODULES = [
+    f"spe_sujet1_auto_10_question_small_parabola_a_{case}"
+    for case in ("s1_a_0", "s1_a_m", "s1_a_p", "sm1_a_0", "sm1_a_m", "sm1_a_p")
+]
+
+
+def _plain(graph_dict):
+    return {key: value for key, value in graph_dict.items() if key != "family"}
+
+
+def _scene(label, radius=0.5, domain=True):
+    return {
+        "family": "test",
+        "svg": {"width": 120, "class": "fill-base-100"},
+        "domain": {"x_min": -3, "x_max": 3, "y_min": -3, "y_max": 3} if domain else {},
+        "settings": {"show_grid": True, "grid_color": "#ccc", "margin": 10},
+        "lines": [
+            {"type": "line", "x1": -2, "y1": 0, "x2": 2, "y2": 0},
+            {"type": "circle", "cx": 1, "cy": 1, "r": radius, "variable": True},
+            {"type": "text", "x": 0, "y": 2, "text": label, "variable": True},
+        ],
+        "foreign_objects": [
+            {"x": 2, "y": -2, "latex": "x"},
+            {"x": 0, "y": 2.5, "latex": label, "variable": True},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    family_cache.clear()
+    yield
+    family_cache.clear()
+
+
+@pytest.mark.parametrize("module_name", PARABOLA_MODULES)
+def test_parabola_family_matches_plain_renders(module_name):
+    labels = set()
+    for index, a_shift in enumerate((5, 2, 7, 2)):
+        graph_dict = get_graph_dict(module_name, {"a_shift": a_shift})
+        svg = graph_from_dict(graph_dict, cache=False)
+        assert svg == graph_from_dict(_plain(graph_dict), cache=False)
+        if index:
+            labels.add(graph_dict["foreign_objects"][-1]["latex"])
+    # One template per layout; the curve and the vertex dot are rendered once,
+    # then only each new M(0;a) label
+    stats = family_cache.stats()
+    assert (stats["misses"], stats["hits"], stats["templates"]) == (1, 3, 1)
+    assert stats["unit_misses"] == 2 + len(labels)
+
+
+@pytest.mark.parametrize("domain", [True, False])
+@pytest.mark.parametrize("backend", ["svgwrite", "string"])
+def test_scene_family(domain, backend):
+    for label, radius in (("a", 0.5), ("b", 0.5), ("a", 1.0)):
+        graph_dict = _scene(label, radius, domain)
+        expected = graph_from_dict(_plain(graph_dict), backend, cache=False)
+        assert graph_from_dict(graph_dict, backend, cache=False) == expected
+    # Without a domain the variable elements feed the bounds, so each graph has its own layout
+    assert family_cache.stats()["templates"] == (1 if domain else 3)
+
+
+def test_family_renders_use_the_requested_backend(monkeypatch):
+    backends = []
+    new_drawing = svg_utils.new_drawing
+
+    def recording_new_drawing(size, backend=None):
+        backends.append(backend)
+        return new_drawing(size, backend)
+
+    monkeypatch.setattr(svg_utils, "new_drawing", recording_new_drawing)
+    monkeypatch.setattr(svg_utils, "_default_backend", "string")
+    for label in ("a", "b"):
+        graph_from_dict(_scene(label), "svgwrite", cache=False)
+    # Plain render of the first member, template, then the units of the second
+    assert len(backends) > 2 and set(backends) == {"svgwrite"}
+
+
+def test_threaded_members_share_the_unit_memo():
+    graph_from_dict(_scene("z"), cache=False)
+    graphs = [_scene(label) for label in "abcabcabc"]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = render_many(graphs, executor=executor, chunk_size=1)
+    assert [result["svg"] for result in results] == [
+        graph_from_dict(_plain(graph), cache=False) for graph in graphs
+    ]
+    stats = family_cache.stats()
+    # Identical dicts are rendered once, each from the template: 3 members of 3 units
+    assert (stats["templates"], stats["unit_hits"] + stats["unit_misses"]) == (1, 9)
+
+
+def test_members_that_cannot_be_split_are_rendered_plainly():
+    graph_dict = _scene("a")
+    # A static element after a variable one of the same kind
+    graph_dict["foreign_objects"].append({"x": 1, "y": 1, "latex": "y"})
+    assert split_family_member(graph_dict) is None
+    # A variable line continuing a static run of the same type
+    assert (
+        split_family_member({"lines": [{"type": "circle"}, {"type": "circle", "variable": True}]})
+        is None
+    )
+    # A variable axis (its arrow marker belongs to the defs)
+    assert split_family_member({"lines": [{"type": "axis", "variable": True}]}) is None
+
+    for _ in range(2):
+        assert graph_from_dict(graph_dict, cache=False) == graph_from_dict(
+            _plain(graph_dict), cache=False
+        )
+    assert family_cache.stats()["templates"] == 0
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Import-time budget for the package.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``;
+the report lists the most expensive modules. Run this file directly to print
+the report for every budgeted module.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Cumulative import time budgets in milliseconds (generous: CI machines are slow)
+BUDGETS_MS = {
+    "pca_graph_viz": 50,
+    "pca_graph_viz.core": 50,
+    "pca_graph_viz.core.nagini_adapter": 150,
+    "pca_graph_viz.core.color_utils": 50,
+    "pca_graph_viz.core.svg_utils": 1500,
+}
+
+# Dependencies that must not be loaded by a bare `import pca_graph_viz`
+HEAVY_MODULES = ("numpy", "svgwrite", "pydantic")
+
+
+def measure_imports(statement):
+    """Run `statement` in a fresh interpreter.
+
+    Returns:
+        tuple: ({module: (self_us, cumulative_us)}, stdout)
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=SRC_DIR,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings, proc.stdout
+
+
+def format_report(timings, limit=10):
+    """Most expensive modules by cumulative time, one per line."""
+    rows = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)[:limit]
+    return "\n".join(
+        f"{cum / 1000:8.1f} ms  {self / 1000:8.1f} ms  {name}" for name, (self, cum) in rows
+    )
+
+
+@pytest.mark.parametrize("module, budget_ms", sorted(BUDGETS_MS.items()))
+def test_import_time_budget(module, budget_ms):
+    timings, stdout = measure_imports(f"import {module}")
+    print(f"\n{module}\n{format_report(timings)}")
+    # Importing must not have side effects such as printing
+    assert stdout == ""
+    assert timings[module][1] / 1000 <= budget_ms, format_report(timings)
+
+
+def test_package_import_is_lazy():
+    timings, _ = measure_imports("import pca_graph_viz")
+    assert not set(HEAVY_MODULES) & set(timings)
+    timings, _ = measure_imports("import pca_graph_viz.core.color_utils")
+    assert "numpy" not in timings
+    # Lazy attributes resolve through importlib, which -X importtime does not report
+    _, stdout = measure_imports(
+        "import sys; from pca_graph_viz import graph_from_dict; "
+        "print('pca_graph_viz.core.svg_utils' in sys.modules)"
+    )
+    assert stdout.strip() == "True"
+
+
+@pytest.mark.parametrize("package", ["pca_graph_viz", "pca_graph_viz.core", "pca_graph_viz.models"])
+def test_all_lists_the_lazy_attributes(package):
+    module = importlib.import_module(package)
+    assert sorted(module.__all__) == sorted(module._LAZY_ATTRIBUTES)
+
+
+if __name__ == "__main__":
+    for name in BUDGETS_MS:
+        found, _ = measure_imports(f"import {name}")
+        print(f"{name} ({found[name][1] / 1000:.1f} ms, budget {BUDGETS_MS[name]} ms)")
+        print(format_report(found))
+        print()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for curves with their own x samples in graph_from_dict."""
+
+import re
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core import svg_utils
+
+
+def _graph(curves):
+    return {
+        "svg": {"width": 100},
+        "domain": {"x_min": 0, "x_max": 10, "y_min": 0, "y_max": 10},
+        "lines": [{"type": "curve", "data": {"x": x, "y": y}} for x, y in curves],
+    }
+
+
+def test_each_curve_uses_its_own_x():
+    svg = graph_from_dict(_graph([([0, 10], [0, 10]), ([5, 5], [0, 10])]))
+    paths = re.findall(r'<path class="curve[^>]* d="([^"]*)"', svg)
+    assert paths == ["M 0,100 L 100,0 ", "M 50,100 L 50,0 "]
+
+
+def test_equal_x_arrays_are_shared(monkeypatch):
+    captured = {}
+    original = svg_utils.create_multi_curve_svg
+
+    def spy(*args, **kwargs):
+        captured["x_data_list"] = kwargs["x_data_list"]
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(svg_utils, "create_multi_curve_svg", spy)
+    x = np.linspace(0, 10, 50)
+    graph_from_dict(
+        _graph([(x.tolist(), x.tolist()), (x.tolist(), (x / 2).tolist()), ([0, 1], [0, 1])]),
+        cache=False,
+    )
+    first, second, third = captured["x_data_list"]
+    assert first is second
+    assert third is not first
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Tests for the module and graph-dict caches of the Nagini adapter."""
+
+import importlib
+import sys
+
+import pytest
+
+from pca_graph_viz.core import nagini_adapter
+from pca_graph_viz.tests import graphs
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    nagini_adapter.clear_module_cache()
+    yield
+    nagini_adapter.clear_module_cache()
+
+
+def test_module_is_imported_once_and_reloaded_on_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(graphs, "__path__", list(graphs.__path__) + [str(tmp_path)])
+    monkeypatch.setattr("sys.dont_write_bytecode", True)
+    source = tmp_path / "adapter_cache_probe.py"
+    source.write_text(
+        "CALLS = []\n\ndef get_graph_dict():\n    CALLS.append(1)\n    return {'title': 'v1'}\n"
+    )
+    importlib.invalidate_caches()
+
+    module = nagini_adapter.get_graph_module("adapter_cache_probe")
+    assert nagini_adapter.get_graph_module("adapter_cache_probe") is module
+    first = nagini_adapter.get_graph_dict("adapter_cache_probe")
+    first["title"] = "modified by the caller"
+    assert nagini_adapter.get_graph_dict("adapter_cache_probe") == {"title": "v1"}
+    assert module.CALLS == [1]
+
+    source.write_text("def get_graph_dict():\n    return {'title': 'version 2'}\n")
+    assert nagini_adapter.get_graph_dict("adapter_cache_probe") == {"title": "version 2"}
+    monkeypatch.delitem(sys.modules, module.__name__)
+
+
+def test_parameters_are_normalized_and_memoized():
+    name = "spe_sujet1_auto_07_question_small"
+    by_keyword = nagini_adapter.get_graph_dict(name, {"y_horizontal": 3})
+    by_global = nagini_adapter.get_graph_dict(
+        name, {"Y_LABEL_FOR_HORIZONTAL_LINE": 3, "a_shift": 1}
+    )
+    assert by_global == by_keyword
+    assert nagini_adapter.get_graph_dict(name, {"y_horizontal": 4}) != by_keyword
+
+
+def test_globals_read_at_import_re_execute_the_module():
+    name = "spe_sujet1_auto_08_question_canonical"
+
+    def curve(a, b):
+        result = nagini_adapter.load_and_render(
+            name, {"A_FLOAT_FOR_AFFINE_LINE": a, "B_FLOAT_FOR_AFFINE_LINE": b}, True
+        )
+        return result["graph"]["lines"][2]["data"]["y"][0], result["svg"]
+
+    (y_first, svg_first), (y_second, svg_second) = curve(2, 1), curve(-3, 4)
+    assert (y_first, y_second) == (2 * -8 + 1, -3 * -8 + 4)
+    assert svg_first != svg_second
+    assert curve(2, 1) == (y_first, svg_first)
+
+
+def test_injected_globals_do_not_leak_into_later_calls():
+    canonical = "spe_sujet1_auto_08_question_canonical"
+
+    def first_y(params):
+        return nagini_adapter.get_graph_dict(canonical, params)["lines"][2]["data"]["y"][0]
+
+    assert first_y({"a_affine": 2, "b_affine": 1}) == 2 * -8 + 1
+    assert first_y({}) == 0.75 * -8 + 2
+    # The no-parameter result was memoized with the default curve
+    assert first_y({}) == 0.75 * -8 + 2
+
+    small = "spe_sujet1_auto_07_question_small"
+    assert "graph" in nagini_adapter.load_graph_module(small, {"y_horizontal": 3})
+    result = nagini_adapter.load_graph_module(small, {})
+    assert "Y_LABEL_FOR_HORIZONTAL_LINE must be injected" in result["error"]
+
+
+def test_clear_module_cache_resets_injected_modules():
+    name = "spe_sujet1_auto_07_question_small"
+    nagini_adapter.get_graph_dict(name, {"y_horizontal": 3})
+    module = sys.modules[f"{nagini_adapter.GRAPHS_PACKAGE}.{name}"]
+    nagini_adapter.clear_module_cache()
+    assert f"{nagini_adapter.GRAPHS_PACKAGE}.{name}" not in sys.modules
+    assert not hasattr(module, "Y_LABEL_FOR_HORIZONTAL_LINE")
+
+
+def test_load_graph_module_reports_errors():
+    result = nagini_adapter.load_graph_module(
+        "spe_sujet1_auto_07_question_small", {"y_horizontal": 2}
+    )
+    assert "graph" in result and "title" in result
+    assert "error" in nagini_adapter.load_graph_module("no_such_graph_module")
+
+
+def test_load_and_render_returns_svg_and_metadata():
+    name = "spe_sujet1_auto_07_question_small"
+    graph_dict = nagini_adapter.get_graph_dict(name, {"y_horizontal": 2})
+    settings = dict(graph_dict.get("settings", {}))
+    result = nagini_adapter.load_and_render(name, {"y_horizontal": 2})
+    assert result["svg"].startswith("<svg")
+    assert result["title"] == graph_dict["title"]
+    assert result["counts"]["curve"] == 1
+    assert result["counts"]["foreign_objects"] == len(graph_dict["foreign_objects"])
+    assert "graph" not in result
+    # Rendering must not touch the cached dict
+    assert graph_dict.get("settings", {}) == settings
+    assert nagini_adapter.load_and_render(name, {"y_horizontal": 2}, True)["graph"] == graph_dict
+    assert "error" in nagini_adapter.load_and_render("no_such_graph_module")
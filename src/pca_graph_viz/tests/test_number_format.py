@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for coordinate quantization and compact number formatting."""
+
+import numpy as np
+import pytest
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core import number_format
+from pca_graph_viz.core.number_format import compact, quantize
+from pca_graph_viz.core.path_encoder import encode_polyline
+
+
+def test_quantize_scalars_use_shortest_form():
+    assert str(quantize(123.45678901234567, 2)) == "123.46"
+    assert str(quantize(165.0, 2)) == "165"
+    assert str(quantize(-0.001, 2)) == "0"
+    assert quantize(1.23456, None) == 1.23456
+
+
+def test_encode_polyline_compacts_coordinates():
+    px = np.array([0.0, 12.5049, -0.004, 3.1])
+    py = np.array([100.0, 7.0, 2.999, 0.25])
+    assert encode_polyline(px, py, 2) == "M 0,100 L 12.5,7 L 0,3 L 3.1,0.25 "
+    assert compact("M 10.0,2.05 ") == "M 10,2.05 "
+
+
+def _graph(settings):
+    return {
+        "svg": {"width": 100},
+        "settings": settings,
+        "domain": {"x_min": -3, "x_max": 4, "y_min": -3, "y_max": 4},
+        "lines": [{"type": "line", "x1": -1, "y1": 0, "x2": 1, "y2": 1}],
+        "foreign_objects": [{"x": 1, "y": 1, "latex": "A", "width": 20, "height": 10}],
+    }
+
+
+def test_settings_precision_overrides_package_default():
+    assert 'x1="28.57"' in graph_from_dict(_graph({}))
+    assert 'x1="28.6"' in graph_from_dict(_graph({"precision": 1}))
+    assert 'x1="28.5714285714285' in graph_from_dict(_graph({"precision": None}))
+
+
+def test_default_precision_can_be_changed():
+    previous = number_format.get_default_precision()
+    try:
+        number_format.set_default_precision(0)
+        svg = graph_from_dict(_graph({}))
+        assert 'x1="29"' in svg and '<foreignObject x="47" y="38"' in svg
+        with pytest.raises(ValueError):
+            number_format.set_default_precision(-1)
+    finally:
+        number_format.set_default_precision(previous)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for the vectorized path-data encoder."""
+
+import re
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core.path_encoder import encode_curve, encode_polyline
+
+
+def _legacy_path(x_data, y_data, transform_x, transform_y):
+    """The original per-point string builder, kept as a reference."""
+    points = [(transform_x(x), transform_y(y)) for x, y in zip(x_data, y_data)]
+    path_data = f"M {points[0][0]},{points[0][1]} "
+    for point in points[1:]:
+        path_data += f"L {point[0]},{point[1]} "
+    return path_data
+
+
+def test_encode_curve_matches_point_by_point_builder():
+    x = np.linspace(-4, 4, 1000)
+    y = x**2 - 5
+
+    def transform_x(v):
+        return (v - -4.5) / 9.0 * 150
+
+    def transform_y(v):
+        return 150 - (v - -6) / 20 * 150
+
+    assert encode_curve(x, y, transform_x, transform_y) == _legacy_path(
+        x, y, transform_x, transform_y
+    )
+
+
+def test_encode_polyline_short_and_uneven_inputs():
+    assert encode_polyline([1.0], [2.0]) == ""
+    assert encode_polyline([0, 1, 2], [3, 4]) == "M 0.0,3.0 L 1.0,4.0 "
+
+
+def _identity(v):
+    return v
+
+
+def test_non_finite_samples_break_the_path():
+    x = np.arange(8.0)
+    y = np.array([0.0, 1.0, np.nan, 3.0, np.inf, 5.0, 6.0, 7.0])
+    # The isolated finite sample between two gaps cannot be drawn and is dropped
+    assert (
+        encode_curve(x, y, _identity, _identity)
+        == "M 0.0,0.0 L 1.0,1.0 M 5.0,5.0 L 6.0,6.0 L 7.0,7.0 "
+    )
+
+
+def test_jump_threshold_splits_asymptotes():
+    x = np.array([0.0, 1.0, 2.0, 3.0])
+    y = np.array([0.0, 10.0, 500.0, 510.0])
+    assert encode_curve(x, y, _identity, _identity).count("M") == 1
+    assert encode_curve(x, y, _identity, _identity, jump=100).count("M") == 2
+
+
+def _curve_path(svg):
+    return re.search(r'<path class="curve[^>]* d="([^"]*)"', svg).group(1)
+
+
+def test_graph_from_dict_accepts_null_samples():
+    x = np.linspace(-3, 3, 601)
+    y = [None if v == 0 else 1 / v for v in np.round(x, 2)]
+    graph = {"svg": {"width": 100}, "lines": [{"type": "curve", "data": {"x": x, "y": y}}]}
+    # No domain: the bounds are computed from the finite samples only
+    svg = graph_from_dict(graph)
+    assert "nan" not in svg and "inf" not in svg
+    assert _curve_path(svg).count("M") == 2
+
+
+def test_discontinuity_setting_drops_asymptote_connector():
+    x = np.linspace(-3, 3, 600)
+    graph = {
+        "svg": {"width": 100},
+        "domain": {"x_min": -3, "x_max": 3, "y_min": -5, "y_max": 5},
+        "lines": [{"type": "curve", "data": {"x": x.tolist(), "y": (1 / x).tolist()}}],
+    }
+    # Branch, vertical connector across x = 0, branch
+    assert _curve_path(graph_from_dict(graph)).count("M") == 3
+    graph["settings"] = {"discontinuity": True}
+    assert _curve_path(graph_from_dict(graph)).count("M") == 2
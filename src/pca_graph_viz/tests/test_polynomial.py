@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Tests for exact Bézier emission of polynomial curves."""
+
+import re
+from math import comb
+
+import numpy as np
+import pytest
+from numpy.polynomial import polynomial as P
+
+from pca_graph_viz.core.polynomial import (
+    encode_polynomial,
+    polynomial_coefficients,
+    polynomial_key_points,
+    visible_pieces,
+)
+from pca_graph_viz.core.svg_utils import graph_from_dict
+
+# 20 px per data unit on [-5, 5] x [-5, 5]
+SCALE = 20
+
+
+def transform_x(x):
+    return (np.asarray(x) + 5) * SCALE
+
+
+def transform_y(y):
+    return 200 - (np.asarray(y) + 5) * SCALE
+
+
+def graph(lines, **settings):
+    return {
+        "svg": {"width": 200, "height": 200},
+        "domain": {"x_min": -5, "x_max": 5, "y_min": -5, "y_max": 5},
+        "settings": {"show_axes": False, "show_grid": False, **settings},
+        "lines": lines,
+    }
+
+
+def bezier_points(path_data):
+    """Evaluate every segment of `path_data` at a few parameters, in data space."""
+    points = []
+    current = None
+    for command, coords in re.findall(r"([MLQC])((?: -?[\d.e+-]+,-?[\d.e+-]+)+)", path_data):
+        controls = [tuple(map(float, pair.split(","))) for pair in coords.split()]
+        if command == "M":
+            current = controls[-1]
+            continue
+        control = np.array([current] + controls)
+        order = len(control) - 1
+        t = np.linspace(0, 1, 11)[:, None]
+        curve = sum(
+            comb(order, k) * t**k * (1 - t) ** (order - k) * control[k] for k in range(order + 1)
+        )
+        points.append(curve)
+        current = controls[-1]
+    curve = np.concatenate(points)
+    return curve[:, 0] / SCALE - 5, (200 - curve[:, 1]) / SCALE - 5
+
+
+@pytest.mark.parametrize(
+    "coefficients, command",
+    [([-2, 0, 0.5], "Q"), ([1, -1, 0, 0.3], "C"), ([0, 2], "L"), ([3, 0, 0], "L")],
+)
+def test_polynomials_are_exact(coefficients, command):
+    path_data = encode_polynomial(coefficients, (-3, 3), transform_x, transform_y)
+    assert path_data.count(command) == 1
+    x, y = bezier_points(path_data)
+    assert np.allclose(y, P.polyval(x, coefficients), atol=1e-9)
+
+
+def test_polynomial_is_split_at_the_viewport():
+    coefficients = [0, -6, 0, 1]  # x^3 - 6x peaks at about +-5.66
+    view = (-5, 5, -5, 5)
+    starts, ends = visible_pieces(polynomial_coefficients(coefficients), (-4, 4), view)
+    assert len(starts) == 3
+    assert np.allclose(np.abs(P.polyval(ends[:-1], coefficients)), 5)
+
+    path_data = encode_polynomial(coefficients, (-4, 4), transform_x, transform_y, view)
+    assert path_data.count("M") == 3
+    x, y = bezier_points(path_data)
+    assert np.allclose(y, P.polyval(x, coefficients), atol=1e-9)
+    assert encode_polynomial(coefficients, (6, 8), transform_x, transform_y, view) == ""
+
+
+def test_key_points_span_the_curve():
+    x, y = polynomial_key_points([-2, 0, 0.5], (-1, 3))
+    assert x.tolist() == [-1, 0, 3]
+    assert y.tolist() == [-1.5, -2, 2.5]
+
+
+def test_graph_dict_polynomial():
+    line = {"type": "polynomial", "coefficients": [-2, 0, 0.5], "class": "stroke-primary"}
+    svg = graph_from_dict(graph([line]), cache=False)
+    path_data = re.search(r'<path class="stroke-primary" d="([^"]*)"', svg).group(1)
+    # Cut where the parabola leaves the canvas grown by the clipping padding
+    assert path_data == "M 23.06,-8 Q 100,288 176.94,-8 "
+
+    # Higher degrees fall back to adaptive sampling
+    line = {"type": "polynomial", "coefficients": [0, 0, 0, 0, 0.1], "class": "stroke-primary"}
+    svg = graph_from_dict(graph([line]), cache=False)
+    path_data = re.search(r'<path class="stroke-primary" d="([^"]*)"', svg).group(1)
+    assert "Q" not in path_data and path_data.count("L") > 10
+    with pytest.raises(ValueError, match="degree 4"):
+        encode_polynomial([0, 0, 0, 0, 1], (0, 1), transform_x, transform_y)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Tests for the slotted element records and their bulk validators."""
+
+import subprocess
+import sys
+
+import pytest
+
+from pca_graph_viz.models.foreign_object import create_foreign_object, validate_foreign_objects
+from pca_graph_viz.models.line_object import create_axis_lines, create_grid_lines, validate_lines
+from pca_graph_viz.models.records import (
+    ForeignObjectRecord,
+    LineRecord,
+    get_debug_validation,
+    set_debug_validation,
+    validate_foreign_object_dicts,
+    validate_line_dicts,
+)
+from pca_graph_viz.tests.test_import_time import SRC_DIR
+
+LINE_DICTS = [
+    {"x1": 0, "y1": 0, "x2": 1, "y2": 2},
+    {
+        "x1": -1.5,
+        "y1": 0,
+        "x2": 3,
+        "y2": "4",
+        "stroke": "red",
+        "stroke_width": 2,
+        "stroke_opacity": 0.5,
+        "stroke_dasharray": "5,5",
+        "stroke_linecap": "round",
+        "class": "stroke-primary",
+        "id": "l2",
+    },
+]
+
+FOREIGN_OBJECT_DICTS = [
+    {"x": 1, "y": 2, "latex": "x^2"},
+    {"x": 0, "y": 0, "data-latex": "\\pi", "class": "text-primary", "style": "color: red"},
+    {"x": 3, "y": 4, "latex": "y", "bg_color": "white", "text_color": "black", "padding": "2px"},
+]
+
+
+@pytest.fixture
+def debug_validation():
+    set_debug_validation(True)
+    yield
+    set_debug_validation(False)
+
+
+def test_records_are_slotted():
+    line = validate_line_dicts(LINE_DICTS)[0]
+    assert isinstance(line, LineRecord)
+    assert not hasattr(line, "__dict__")
+    with pytest.raises(AttributeError):
+        line.color = "red"
+
+
+def test_line_records_match_pydantic_models():
+    from pca_graph_viz.models.pydantic_models import Line
+
+    for record, line in zip(validate_line_dicts(LINE_DICTS), [Line(**d) for d in LINE_DICTS]):
+        assert record.dict(by_alias=True) == line.model_dump(by_alias=True)
+        assert record.to_svg_line(lambda x: 2 * x, lambda y: -y) == line.to_svg_line(
+            lambda x: 2 * x, lambda y: -y
+        )
+
+
+def test_typed_lines_match_pydantic_models():
+    from pca_graph_viz.models import Line, LineType
+    from pca_graph_viz.models.pydantic_models import TypedLine
+
+    # Records keep numbers as given (the bulk validators convert them), pydantic coerces
+    line = Line(x1=-5.0, y1=0.0, x2=5.0, y2=0.0, stroke="#333", class_="axis", type=LineType.AXIS)
+    assert isinstance(line, LineRecord) and not hasattr(line, "__dict__")
+    model = TypedLine(
+        **{"x1": -5, "y1": 0, "x2": 5, "y2": 0, "stroke": "#333", "class": "axis", "type": "axis"}
+    )
+    assert line.dict(by_alias=True) == model.model_dump(by_alias=True)
+    assert line.dict()["type"] == "axis" and Line(x1=0, y1=0, x2=1, y2=1).type == "curve"
+    assert line.to_svg_line() == model.to_svg_line()
+
+
+def test_foreign_object_records_match_pydantic_models(debug_validation):
+    models = validate_foreign_objects([dict(obj) for obj in FOREIGN_OBJECT_DICTS])
+    set_debug_validation(False)
+    records = validate_foreign_objects(FOREIGN_OBJECT_DICTS)
+    assert all(isinstance(record, ForeignObjectRecord) for record in records)
+    for record, model in zip(records, models):
+        assert record.dict(by_alias=True) == model.model_dump(by_alias=True)
+        assert record.to_foreign_object_xml(margin=5) == model.to_foreign_object_xml(margin=5)
+    assert records[1].class_ == "svg-latex text-primary"
+    assert records[2].style == "background-color: white; color: black; padding: 2px"
+
+
+def test_validators_do_not_mutate_input():
+    objects = [dict(obj) for obj in FOREIGN_OBJECT_DICTS]
+    validate_foreign_objects(objects)
+    assert objects == FOREIGN_OBJECT_DICTS
+
+
+def test_bulk_validation_reports_every_error():
+    lines = [
+        {"x1": 0, "y1": 0, "x2": 1},
+        {"x1": "a", "y1": 0, "x2": 1, "y2": 1, "stroke_opacity": 2},
+        {"x1": 0, "y1": 0, "x2": 1, "y2": 1, "stroke_linecap": "pointy", "stroke": ""},
+    ]
+    with pytest.raises(ValueError) as error:
+        validate_lines(lines)
+    message = str(error.value)
+    assert message.startswith("5 invalid line field(s)")
+    for expected in (
+        "[0] y2: field required",
+        "[1] x1:",
+        "[1] stroke_opacity: must be between 0 and 1",
+        "[2] stroke_linecap:",
+        "[2] stroke: stroke color cannot be empty",
+    ):
+        assert expected in message
+
+    with pytest.raises(ValueError, match=r"\[0\] width: must be greater than 0"):
+        validate_foreign_object_dicts([{"x": 0, "y": 0, "latex": "x", "width": 0}])
+    with pytest.raises(ValueError, match=r"\[0\] style: invalid CSS style string"):
+        create_foreign_object(0, 0, "x", style="bold")
+
+
+def test_generated_lines_match_pydantic_markup():
+    from pca_graph_viz.models.pydantic_models import Line
+
+    lines = create_grid_lines(-5, 5, -4, 4, grid_count=4) + create_axis_lines(-5, 5, -4, 4)
+    assert len(lines) == 12
+    for line in lines:
+        model = Line(**line.dict(by_alias=True))
+        assert line.to_svg_line() == model.to_svg_line()
+
+
+def test_debug_mode_returns_pydantic_models(debug_validation):
+    from pca_graph_viz.models.pydantic_models import ForeignObject, Line
+
+    assert get_debug_validation()
+    assert all(isinstance(line, Line) for line in validate_lines(LINE_DICTS))
+    assert all(isinstance(line, Line) for line in create_grid_lines(0, 1, 0, 1, grid_count=1))
+    assert isinstance(create_foreign_object(0, 0, "x"), ForeignObject)
+    with pytest.raises(ValueError):
+        validate_lines([{"x1": 0}])
+
+
+def test_records_do_not_import_pydantic():
+    code = (
+        "import sys; "
+        "from pca_graph_viz.models.line_object import create_grid_lines, validate_lines; "
+        "from pca_graph_viz.models.foreign_object import validate_foreign_objects; "
+        "create_grid_lines(0, 1, 0, 1); validate_foreign_objects([{'x': 0, 'y': 0, 'latex': 'x'}]); "
+        "import pca_graph_viz.models; pca_graph_viz.models.LineRecord; "
+        "pca_graph_viz.models.Line(x1=0, y1=0, x2=1, y2=1, type='axis'); "
+        "print('pydantic' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=SRC_DIR, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for the graph-dict fingerprint and the LRU render cache."""
+
+import numpy as np
+import pytest
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core.render_cache import RenderCache, fingerprint, render_cache
+
+
+def _graph(slope=1.0):
+    x = np.linspace(-1, 1, 200)
+    return {
+        "svg": {"width": 120},
+        "domain": {"x_min": -1, "x_max": 1, "y_min": -2, "y_max": 2},
+        "lines": [{"type": "curve", "data": {"x": x.tolist(), "y": (slope * x).tolist()}}],
+    }
+
+
+def test_fingerprint_is_canonical():
+    x = np.linspace(0, 1, 50)
+    assert fingerprint({"a": 1, "b": x.tolist()}) == fingerprint({"b": x, "a": 1})
+    assert fingerprint({"a": 1}) != fingerprint({"a": 1.0})
+    assert fingerprint({"y": [1, None]}) != fingerprint({"y": [1, 0]})
+    assert fingerprint([1, 2.0]) != fingerprint([1.0, 2])
+    assert fingerprint([1, 2.0]) != fingerprint([1.0, 2.0])
+    assert fingerprint([1, True]) != fingerprint([1, 1])
+    assert fingerprint(_graph(1.0)) != fingerprint(_graph(1.5))
+    with pytest.raises(TypeError):
+        fingerprint({"lines": [object()]})
+
+
+def test_lru_eviction_is_bounded_by_size():
+    cache = RenderCache(max_bytes=10)
+    cache.put("a", "xxxx")
+    cache.put("b", "yyyy")
+    assert cache.get("a") == "xxxx"
+    cache.put("c", "zzzz")
+    # "b" was the least recently used entry
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.current_bytes == 8
+    cache.put("huge", "w" * 11)
+    assert "huge" not in cache
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "entries": 0, "bytes": 0, "max_bytes": 10}
+
+
+def test_graph_from_dict_uses_the_cache():
+    render_cache.clear()
+    first = graph_from_dict(_graph())
+    second = graph_from_dict(_graph())
+    assert first == second
+    assert (render_cache.hits, render_cache.misses) == (1, 1)
+    assert graph_from_dict(_graph(), cache=False) == first
+    assert graph_from_dict(_graph(), backend="string") == first
+    assert render_cache.misses == 2
+    render_cache.clear()
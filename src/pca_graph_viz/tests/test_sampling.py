@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Tests for the curvature-adaptive function sampler."""
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict, pixel_size_for, sample_function
+
+DOMAIN = {"x_min": -5, "x_max": 5, "y_min": -5, "y_max": 5}
+PIXEL = pixel_size_for(DOMAIN, 340)
+
+
+def _max_pixel_error(func, x, y, pixel_size):
+    """Largest gap, in pixels, between `func` and the polyline through (x, y)."""
+    dense_x = np.linspace(x[0], x[-1], 20001)
+    return np.max(np.abs(func(dense_x) - np.interp(dense_x, x, y))) / pixel_size[1]
+
+
+def test_straight_line_uses_initial_grid_only():
+    x, y = sample_function(lambda v: 2 * v + 1, -5, 5, PIXEL)
+    assert len(x) == 33
+    assert np.allclose(y, 2 * x + 1)
+
+
+def test_parabola_is_accurate_with_few_points():
+    func = lambda v: v**2 - 3  # noqa: E731
+    x, y = sample_function(func, -3, 3, PIXEL)
+    assert len(x) < 200
+    assert np.all(np.diff(x) > 0)
+    assert _max_pixel_error(func, x, y, PIXEL) < 0.5
+
+
+def test_refinement_concentrates_at_exponential_knee():
+    x, y = sample_function(np.exp, -5, 1.6, PIXEL)
+    # Samples per data unit on the flat tail vs. past the knee
+    flat, steep = np.sum(x < -2) / 3, np.sum(x > 0) / 1.6
+    assert steep > 1.5 * flat
+    assert _max_pixel_error(np.exp, x, y, PIXEL) < 0.5
+
+
+def test_undefined_region_breaks_the_rendered_curve():
+    x, y = sample_function(np.log, -2, 5, PIXEL)
+    assert np.isnan(y[0]) and np.isfinite(y[-1])
+    graph = {
+        "svg": {"width": 340},
+        "domain": DOMAIN,
+        "lines": [{"type": "curve", "data": {"x": x.tolist(), "y": y.tolist()}}],
+    }
+    assert "nan" not in graph_from_dict(graph)
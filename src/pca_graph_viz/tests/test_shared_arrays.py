@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the memory-mapped transport of curve samples to worker processes."""
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core import render_many
+from pca_graph_viz.core.render_cache import fingerprint, render_cache
+from pca_graph_viz.core.shared_arrays import (
+    ArrayRef,
+    pack_graph_dicts,
+    scratch_dir,
+    unpack_graph_dicts,
+)
+
+
+def _graphs():
+    x = np.linspace(-3, 3, 600)
+    shared_x = x.tolist()
+    return [
+        {
+            "domain": {"x_min": -3, "x_max": 3, "y_min": -2, "y_max": 2},
+            "lines": [
+                {"type": "curve", "data": {"x": shared_x, "y": np.sin(x * k).tolist()}}
+                for k in (1, 2)
+            ]
+            + [{"type": "line", "x1": 0, "y1": 0, "x2": 1, "y2": 1}],
+        }
+        for _ in range(2)
+    ] + [
+        # Integer samples, a short curve and samples holding None
+        {
+            "lines": [
+                {"type": "curve", "data": {"x": list(range(300)), "y": np.arange(300.0)}},
+                {"type": "curve", "data": {"x": [0, 1, 2], "y": [0, 1, 4]}},
+                {"type": "curve", "data": {"x": list(range(300)), "y": [None] * 300}},
+            ]
+        }
+    ]
+
+
+def test_pack_and_unpack_round_trip():
+    graphs = _graphs()
+    path, packed = pack_graph_dicts(graphs)
+    try:
+        assert fingerprint(graphs) == fingerprint(_graphs())  # inputs are not modified
+        first, _, mixed = packed
+        assert isinstance(first["lines"][0]["data"]["x"], ArrayRef)
+        assert first["lines"][2] is graphs[0]["lines"][2]
+        assert mixed["lines"][1]["data"] == {"x": [0, 1, 2], "y": [0, 1, 4]}
+        assert isinstance(mixed["lines"][2]["data"]["x"], ArrayRef)
+        assert mixed["lines"][2]["data"]["y"] == [None] * 300
+        # The x list shared by four curves is stored once, equal but distinct lists twice
+        assert os.path.getsize(path) == 8 * (600 * 5 + 300 * 3)
+
+        unpacked = unpack_graph_dicts(pickle.loads(pickle.dumps(packed)), path)
+        x_views = {id(line["data"]["x"]) for graph in unpacked[:2] for line in graph["lines"][:2]}
+        assert len(x_views) == 1
+        y = unpacked[1]["lines"][1]["data"]["y"]
+        assert type(y) is np.ndarray and not y.flags.writeable
+        assert np.array_equal(y, graphs[1]["lines"][1]["data"]["y"])
+    finally:
+        os.remove(path)
+
+
+def _scratch_files():
+    return {name for name in os.listdir(scratch_dir()) if name.startswith("pca_graph_viz-")}
+
+
+def test_process_pool_renders_from_the_scratch_file():
+    render_cache.clear()
+    graphs = _graphs()
+    expected = [graph_from_dict(graph, cache=False) for graph in graphs]
+    before = _scratch_files()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = render_many(graphs, executor=executor, chunk_size=1)
+        assert [result.get("svg") for result in results] == expected
+        # Same output when the dicts are pickled
+        assert render_many(graphs, executor=executor, shared_arrays=False) == results
+    assert _scratch_files() == before
+    render_cache.clear()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for pixel-tolerance curve simplification."""
+
+import numpy as np
+
+from pca_graph_viz import graph_from_dict
+from pca_graph_viz.core.simplify import simplify_polyline
+
+
+def _max_deviation(px, py, sx, sy):
+    """Largest distance from an original point to the simplified polyline."""
+    worst = 0.0
+    for x, y in zip(px, py):
+        best = np.inf
+        for x0, y0, x1, y1 in zip(sx[:-1], sy[:-1], sx[1:], sy[1:]):
+            dx, dy = x1 - x0, y1 - y0
+            t = (
+                0.0
+                if dx == dy == 0
+                else np.clip(((x - x0) * dx + (y - y0) * dy) / (dx * dx + dy * dy), 0, 1)
+            )
+            best = min(best, np.hypot(x - x0 - t * dx, y - y0 - t * dy))
+        worst = max(worst, best)
+    return worst
+
+
+def test_straight_line_collapses_to_endpoints():
+    px = np.linspace(0, 300, 1000)
+    sx, sy, removed = simplify_polyline(px, 2 * px + 1, tolerance=0.25)
+    assert removed == 998
+    assert (sx[0], sx[-1]) == (0, 300)
+
+
+def test_parabola_stays_within_tolerance():
+    x = np.linspace(-4, 4, 1000)
+    px, py = (x + 4) * 20, 170 - x**2 * 10
+    sx, sy, removed = simplify_polyline(px, py, tolerance=0.25)
+    assert removed > 800
+    # Same-pixel collapsing may shift points by up to half a pixel diagonal
+    assert _max_deviation(px, py, sx, sy) <= 0.25 + np.sqrt(0.5)
+
+
+def test_graph_from_dict_reports_removed_points():
+    x = np.linspace(-1, 1, 500)
+    graph = {
+        "svg": {"width": 100},
+        "settings": {"simplify": 0.5},
+        "domain": {"x_min": -1, "x_max": 1, "y_min": -1, "y_max": 1},
+        "lines": [{"type": "curve", "data": {"x": x.tolist(), "y": x.tolist()}}],
+    }
+    stats = {}
+    svg = graph_from_dict(graph, stats=stats)
+    assert stats["points_removed"] == 498
+    assert 'd="M 0,100 L 100,0 "' in svg
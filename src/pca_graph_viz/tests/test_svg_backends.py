@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""The direct string backend must reproduce svgwrite's output byte for byte."""
+
+import importlib
+import inspect
+import pkgutil
+
+import numpy as np
+import pytest
+
+from pca_graph_viz.core import svg_utils
+from pca_graph_viz.core.svg_utils import create_svg_scene, graph_from_dict
+from pca_graph_viz.tests import graphs
+
+
+def _catalog_graph_dicts():
+    """Yield (module_name, graph_dict) for every parameterless graph in tests.graphs."""
+    for info in pkgutil.iter_modules(graphs.__path__):
+        module = importlib.import_module(f"{graphs.__name__}.{info.name}")
+        get_graph_dict = getattr(module, "get_graph_dict", None)
+        if get_graph_dict and not inspect.signature(get_graph_dict).parameters:
+            yield info.name, get_graph_dict()
+
+
+@pytest.mark.parametrize("module_name, graph_dict", list(_catalog_graph_dicts()))
+def test_string_backend_matches_svgwrite(module_name: str, graph_dict: dict) -> None:
+    expected = graph_from_dict(graph_dict, backend="svgwrite")
+    assert graph_from_dict(graph_dict, backend="string") == expected, module_name
+
+
+def test_scene_with_axes_and_labels_matches() -> None:
+    x = np.linspace(-2, 2, 9)
+    kwargs = {
+        "size": 120,
+        "grid_color": "gray",
+        "margin": {"top": 4, "right": 6, "bottom": 8, "left": 10},
+        "foreign_objects": [{"x": 1, "y": 1, "latex": "x", "show_point": True}],
+        "lines": [{"type": "circle", "cx": 0, "cy": 0, "r": 3, "class": 'a"b'}],
+    }
+    expected = create_svg_scene(x, x**2, backend="svgwrite", **kwargs)
+    assert create_svg_scene(x, x**2, backend="string", **kwargs) == expected
+
+
+def test_default_backend_can_be_switched() -> None:
+    previous = svg_utils.get_default_backend()
+    try:
+        svg_utils.set_default_backend("string")
+        assert svg_utils.get_default_backend() == "string"
+        with pytest.raises(ValueError):
+            svg_utils.set_default_backend("cairo")
+    finally:
+        svg_utils.set_default_backend(previous)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests for the parameter-sweep archives of parameterized graphs."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from pca_graph_viz import sweep as sweeps
+from pca_graph_viz.core.nagini_adapter import load_and_render
+from pca_graph_viz.tests.test_import_time import SRC_DIR
+
+AFFINE = "spe_sujet1_auto_08_question_small"
+PARABOLA = "spe_sujet1_auto_10_question_small_parabola_a_s1_a_m"
+
+
+def test_parse_param():
+    assert sweeps.parse_param("a_affine=-1:1:0.25") == ("a_affine", -1.0, 1.0, 0.25)
+    assert sweeps.parse_param("b_affine=2") == ("b_affine", 2.0, 2.0, 1.0)
+    for spec in ["a_affine", "a_affine=1:2", "a_affine=x", "a_affine=1:0:1", "a_affine=0:1:0"]:
+        with pytest.raises(ValueError):
+            sweeps.parse_param(spec)
+
+
+def test_grid_is_quantized_row_major():
+    axes = sweeps.grid_axes([("a", 0.0, 0.3, 0.1), ("b", 1.0, 2.0, 1.0)])
+    assert axes[0].tolist() == [0.0, 0.1, 0.2, 0.3]
+    points = sweeps.grid_points(axes)
+    assert points.shape == (8, 2)
+    assert points[:3].tolist() == [[0.0, 1.0], [0.0, 2.0], [0.1, 1.0]]
+
+
+def test_archive_matches_browser_renders(tmp_path):
+    params = [sweeps.parse_param(spec) for spec in ["a_affine=-1:1:0.5", "b_affine=0:1:0.5"]]
+    archive = sweeps.sweep(AFFINE, params, log=None)
+    assert [param["count"] for param in archive["params"]] == [5, 3]
+    assert archive["params"][1]["global"] == "B_FLOAT_FOR_AFFINE_LINE"
+    assert len(archive["index"]) == 15 and -1 not in archive["index"]
+
+    archive = sweeps.load_archive(sweeps.write_archive(archive, tmp_path))
+    for values in [
+        {"a_affine": 0.5, "b_affine": 1},
+        {"A_FLOAT_FOR_AFFINE_LINE": -1, "b_affine": 0},
+    ]:
+        assert sweeps.lookup(archive, values) == load_and_render(AFFINE, values)["svg"]
+
+    # Values off the grid or outside it are left to Python
+    assert sweeps.lookup(archive, {"a_affine": 0.4, "b_affine": 1}) is None
+    assert sweeps.lookup(archive, {"a_affine": 1.5, "b_affine": 1}) is None
+    assert sweeps.lookup(archive, {"a_affine": 0.5}) is None
+
+    ids = sweeps.lookup_ids(archive, np.array([[[-1, 0], [1, 1]], [[0.25, 0], [0, 0.5]]]))
+    assert ids.shape == (2, 2)
+    assert ids.tolist() == [[archive["index"][0], archive["index"][14]], [-1, archive["index"][7]]]
+
+
+def test_identical_renders_are_stored_once():
+    archive = sweeps.sweep(PARABOLA, [sweeps.parse_param("A_SHIFT_MAGNITUDE=1:4:1")], log=None)
+    # Only the label of the parabola moves: the rest of the SVG is stored once
+    assert len(archive["svgs"]) == 4
+    assert all(len(svg) < 200 for svg in archive["svgs"])
+    assert (
+        sweeps.lookup(archive, {"a_shift": 3}) == load_and_render(PARABOLA, {"a_shift": 3})["svg"]
+    )
+
+    archive = sweeps.sweep(PARABOLA, [("a_shift", 2.0, 2.0, 1.0)], log=None)
+    assert archive["svgs"] == [""] and archive["index"] == [0]
+
+
+def test_parameters_must_match_the_module():
+    with pytest.raises(ValueError, match="b_affine"):
+        sweeps.sweep(AFFINE, [sweeps.parse_param("a_affine=0:1:1")], log=None)
+    with pytest.raises(ValueError, match="a_shift"):
+        sweeps.sweep(
+            AFFINE, [sweeps.parse_param(s) for s in ["a_affine=0", "b_affine=0", "a_shift=1"]]
+        )
+    with pytest.raises(ValueError, match="twice"):
+        sweeps.sweep(PARABOLA, [("a_shift", 1, 1, 1), ("A_SHIFT_MAGNITUDE", 1, 1, 1)])
+
+
+def test_cli_runs_outside_src(tmp_path):
+    # As with an installed package: the working directory is not src/
+    env = {**os.environ, "PYTHONPATH": SRC_DIR}
+    args = ["--param", "A_SHIFT_MAGNITUDE=1:2:1", "--out", str(tmp_path)]
+    subprocess.run(
+        [sys.executable, "-m", "pca_graph_viz.sweep", PARABOLA, *args],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+    archive = sweeps.load_archive(sweeps.archive_path(tmp_path, PARABOLA))
+    assert archive["index"] == [0, 1]
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Tests for the adaptive grid tick engine."""
+
+import numpy as np
+
+from pca_graph_viz.core.svg_utils import create_svg_scene
+from pca_graph_viz.core.ticks import nice_step, tick_values
+
+
+def test_small_domains_keep_the_integer_grid():
+    assert tick_values(-2.3, 3.7).tolist() == [-2, -1, 0, 1, 2, 3]
+
+
+def test_steps_follow_the_1_2_5_sequence():
+    assert nice_step(20_000, max_ticks=40) == 500
+    assert nice_step(90, max_ticks=40) == 5
+    assert nice_step(3e6, max_ticks=10) == 500_000
+
+
+def test_huge_domain_is_bounded_and_drawn_as_two_paths():
+    x = np.array([-1e6, 1e6])
+    svg = create_svg_scene(x, x, size=300, grid_color="gray", show_axes=False, grid_max_lines=20)
+    grid_paths = [part for part in svg.split("<path")[1:] if 'stroke="gray"' in part]
+    assert len(grid_paths) == 2
+    assert all(part.count("M ") <= 21 for part in grid_paths)
+    assert "<line" not in svg